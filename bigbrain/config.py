@@ -6,11 +6,14 @@ import bpy
 from . import utils
 from .i18n import get_text as _
 
-def apply_undo_settings():
-    """Apply undo settings from addon preferences to Blender preferences"""
+def apply_undo_limits(addon_prefs):
+    """Apply the undo steps and memory limit to Blender preferences"""
     prefs = bpy.context.preferences.edit
-    addon_prefs = bpy.context.preferences.addons["bigbrain"].preferences
-
+    
+    # The smart undo budget picks both values from free system RAM
+    if addon_prefs.smart_undo and utils.undo_budget.update(addon_prefs, force=True):
+        return
+    
     try:
         # Set undo steps
         prefs.undo_steps = addon_prefs.undo_steps
@@ -24,6 +27,11 @@ def apply_undo_settings():
         utils.log(_('undo_memory_set').format(addon_prefs.undo_memory_limit))
     except Exception as e:
         utils.log(f"Failed to set undo_memory_limit: {e}", 'ERROR')
+
+def apply_undo_settings():
+    """Apply undo settings from addon preferences to Blender preferences"""
+    addon_prefs = bpy.context.preferences.addons["bigbrain"].preferences
+    apply_undo_limits(addon_prefs)
     
     # Start RAM status if enabled
     if addon_prefs.show_overlay:
@@ -25,6 +25,10 @@ TEXTS = {
         # Undo settings
         'undo_steps': "Undo Steps",
         'undo_memory': "Undo Memory Limit (MB)",
+        'smart_undo': "Smart Undo Budget",
+        'undo_budget_share': "Budget (% of free RAM)",
+        'undo_budget_status': "Budget: {0} MB, {1} steps (~{2:.1f} MB/step)",
+        'undo_budget_waiting': "Waiting for system RAM data (psutil)",
         'auto_backup': "Auto Backup Undo History",
         'backup_interval': "Backup Interval (minutes)",
         'backup_location': "Backup Location",
@@ -34,21 +38,41 @@ TEXTS = {
         
         # RAM settings
         'status_delay': "Status Update Delay (s)",
+        'adaptive_sampling': "Adaptive Sampling",
+        'min_sample_interval': "Min (s)",
+        'max_sample_interval': "Max (s)",
+        'use_sampler_thread': "Background Sampling",
+        'sampler_rate': "Rate (Hz)",
         'show_overlay': "Show RAM Overlay",
         'critical_warning': "Critical Memory Warning",
         'critical_threshold': "Warning Threshold (MB)",
         'warning_sound': "Play Warning Sound",
+        'leak_detection': "Leak Detection",
+        'leak_threshold': "Threshold (MB/min)",
+        'leak_window': "Window (min)",
+        'pressure_response': "Memory Pressure Response",
+        'pressure_soft': "Soft (%)",
+        'pressure_hard': "Hard (%)",
+        'pressure_critical': "Critical (%)",
+        'enable_profiler': "Operator Profiler",
         'show_graph': "Show Real-time Graph",
         'graph_width': "Graph Width",
         'graph_height': "Graph Height",
+        'graph_window': "Graph Window",
+        'graph_color': "Graph Color",
+        'graph_background_color': "Background",
         'compact_overlay': "Compact Overlay (FPS+RAM+VRAM)",
         'show_fps': "Show FPS",
         'show_vram': "Show VRAM (if available)",
+        'show_process_tree': "Show Blender + Children",
         
         # Debug settings
         'log_to_file': "Log to File",
         'log_level': "Log Level",
+        'log_capacity': "Entries Kept in Memory",
         'log_location': "Log File Location",
+        'record_metrics': "Record Metrics",
+        'recording_location': "Recording Location",
         'log_filter': "Filter Logs",
         'clear_logs': "Clear Logs",
         'export_logs': "Export Logs",
@@ -82,6 +106,10 @@ TEXTS = {
         'snapshot_created': "Project snapshot created: {0}",
         'snapshot_restored': "Project snapshot restored: {0}",
         'logs_exported': "Logs exported to {0}",
+        'export_running': "A log export is already running",
+        'export_progress': "Exporting logs... {:.0f}%",
+        'export_cancelled': "Log export cancelled",
+        'no_log_files': "No daily log files found",
         
         # Log levels
         'log_debug': "Debug",
@@ -96,6 +124,24 @@ TEXTS = {
         'filter_warning': "Warning",
         'filter_error': "Error",
         'no_logs': "No logs to display",
+        'no_log_matches': "No matching log entries",
+        'log_position': "{}–{} of {}",
+        'scan_memory': "Scan",
+        'no_memory_scan': "Run a scan to see memory per datablock",
+        'top_consumers': "Top consumers:",
+        'leak_trend': "Baseline trend: {0} MB/min",
+        'pressure_level': "Memory pressure: {0} ({1:.0f}%)",
+        'swap_status': "Swap: {0:.0f} MB, in {1:.1f} MB/s, {2:.0f} faults/s",
+        'process_tree_total': "Blender + children: {0}",
+        'replay_live': "Showing live data",
+        'replay_range': "From {0}, {1:.0f} min",
+        'replay_position': "Position",
+        'replay_load_failed': "Could not load recording: {0}",
+        'no_profile': "No operators recorded yet",
+        'profile_operator': "Operator (calls)",
+        'profile_cleared': "Operator profile cleared",
+        'profile_exported': "Operator profile exported to {0}",
+        'profile_export_failed': "Error exporting operator profile",
     },
     
     'PT': {
@@ -119,6 +165,10 @@ TEXTS = {
         # Undo settings
         'undo_steps': "Passos de Desfazer",
         'undo_memory': "Limite de Memória (MB)",
+        'smart_undo': "Orçamento Inteligente de Desfazer",
+        'undo_budget_share': "Orçamento (% da RAM livre)",
+        'undo_budget_status': "Orçamento: {0} MB, {1} passos (~{2:.1f} MB/passo)",
+        'undo_budget_waiting': "Aguardando dados de RAM do sistema (psutil)",
         'auto_backup': "Backup Automático do Histórico",
         'backup_interval': "Intervalo de Backup (minutos)",
         'backup_location': "Local do Backup",
@@ -128,21 +178,41 @@ TEXTS = {
         
         # RAM settings
         'status_delay': "Atraso de Atualização (s)",
+        'adaptive_sampling': "Amostragem Adaptativa",
+        'min_sample_interval': "Mín (s)",
+        'max_sample_interval': "Máx (s)",
+        'use_sampler_thread': "Amostragem em Segundo Plano",
+        'sampler_rate': "Taxa (Hz)",
         'show_overlay': "Mostrar Overlay de RAM",
         'critical_warning': "Aviso de Memória Crítica",
         'critical_threshold': "Limite de Aviso (MB)",
         'warning_sound': "Tocar Som de Aviso",
+        'leak_detection': "Detecção de Vazamentos",
+        'leak_threshold': "Limite (MB/min)",
+        'leak_window': "Janela (min)",
+        'pressure_response': "Resposta à Pressão de Memória",
+        'pressure_soft': "Leve (%)",
+        'pressure_hard': "Alta (%)",
+        'pressure_critical': "Crítica (%)",
+        'enable_profiler': "Perfilador de Operadores",
         'show_graph': "Mostrar Gráfico em Tempo Real",
         'graph_width': "Largura do Gráfico",
         'graph_height': "Altura do Gráfico",
+        'graph_window': "Janela do Gráfico",
+        'graph_color': "Cor do Gráfico",
+        'graph_background_color': "Fundo",
         'compact_overlay': "Overlay Compacto (FPS+RAM+VRAM)",
         'show_fps': "Mostrar FPS",
         'show_vram': "Mostrar VRAM (se disponível)",
+        'show_process_tree': "Mostrar Blender + Filhos",
         
         # Debug settings
         'log_to_file': "Log para Arquivo",
         'log_level': "Nível de Log",
+        'log_capacity': "Entradas Mantidas na Memória",
         'log_location': "Local do Arquivo de Log",
+        'record_metrics': "Gravar Métricas",
+        'recording_location': "Local das Gravações",
         'log_filter': "Filtrar Logs",
         'clear_logs': "Limpar Logs",
         'export_logs': "Exportar Logs",
@@ -176,6 +246,10 @@ TEXTS = {
         'snapshot_created': "Snapshot do projeto criado: {0}",
         'snapshot_restored': "Snapshot do projeto restaurado: {0}",
         'logs_exported': "Logs exportados para {0}",
+        'export_running': "Uma exportação de logs já está em andamento",
+        'export_progress': "Exportando logs... {:.0f}%",
+        'export_cancelled': "Exportação de logs cancelada",
+        'no_log_files': "Nenhum arquivo de log diário encontrado",
         
         # Log levels
         'log_debug': "Debug",
@@ -190,6 +264,24 @@ TEXTS = {
         'filter_warning': "Aviso",
         'filter_error': "Erro",
         'no_logs': "Nenhum log para exibir",
+        'no_log_matches': "Nenhum log encontrado",
+        'log_position': "{}–{} de {}",
+        'scan_memory': "Analisar",
+        'no_memory_scan': "Execute uma análise para ver a memória por datablock",
+        'top_consumers': "Maiores consumidores:",
+        'leak_trend': "Tendência da base: {0} MB/min",
+        'pressure_level': "Pressão de memória: {0} ({1:.0f}%)",
+        'swap_status': "Swap: {0:.0f} MB, entrada {1:.1f} MB/s, {2:.0f} falhas/s",
+        'process_tree_total': "Blender + filhos: {0}",
+        'replay_live': "Mostrando dados ao vivo",
+        'replay_range': "Desde {0}, {1:.0f} min",
+        'replay_position': "Posição",
+        'replay_load_failed': "Não foi possível carregar a gravação: {0}",
+        'no_profile': "Nenhum operador registrado",
+        'profile_operator': "Operador (chamadas)",
+        'profile_cleared': "Perfil de operadores limpo",
+        'profile_exported': "Perfil exportado para {0}",
+        'profile_export_failed': "Erro ao exportar perfil",
     },
     
     'ES': {
@@ -213,6 +305,10 @@ TEXTS = {
         # Undo settings
         'undo_steps': "Pasos de Deshacer",
         'undo_memory': "Límite de Memoria (MB)",
+        'smart_undo': "Presupuesto Inteligente de Deshacer",
+        'undo_budget_share': "Presupuesto (% de RAM libre)",
+        'undo_budget_status': "Presupuesto: {0} MB, {1} pasos (~{2:.1f} MB/paso)",
+        'undo_budget_waiting': "Esperando datos de RAM del sistema (psutil)",
         'auto_backup': "Copia de Seguridad Automática",
         'backup_interval': "Intervalo de Copia (minutos)",
         'backup_location': "Ubicación de Copias",
@@ -222,21 +318,41 @@ TEXTS = {
         
         # RAM settings
         'status_delay': "Retraso de Actualización (s)",
+        'adaptive_sampling': "Muestreo Adaptativo",
+        'min_sample_interval': "Mín (s)",
+        'max_sample_interval': "Máx (s)",
+        'use_sampler_thread': "Muestreo en Segundo Plano",
+        'sampler_rate': "Frecuencia (Hz)",
         'show_overlay': "Mostrar Overlay de RAM",
         'critical_warning': "Aviso de Memoria Crítica",
         'critical_threshold': "Umbral de Aviso (MB)",
         'warning_sound': "Reproducir Sonido de Aviso",
+        'leak_detection': "Detección de Fugas",
+        'leak_threshold': "Umbral (MB/min)",
+        'leak_window': "Ventana (min)",
+        'pressure_response': "Respuesta a Presión de Memoria",
+        'pressure_soft': "Leve (%)",
+        'pressure_hard': "Alta (%)",
+        'pressure_critical': "Crítica (%)",
+        'enable_profiler': "Perfilador de Operadores",
         'show_graph': "Mostrar Gráfico en Tiempo Real",
         'graph_width': "Ancho del Gráfico",
         'graph_height': "Altura del Gráfico",
+        'graph_window': "Ventana del Gráfico",
+        'graph_color': "Color del Gráfico",
+        'graph_background_color': "Fondo",
         'compact_overlay': "Overlay Compacto (FPS+RAM+VRAM)",
         'show_fps': "Mostrar FPS",
         'show_vram': "Mostrar VRAM (si disponible)",
+        'show_process_tree': "Mostrar Blender + Hijos",
         
         # Debug settings
         'log_to_file': "Log a Archivo",
         'log_level': "Nivel de Log",
+        'log_capacity': "Entradas en Memoria",
         'log_location': "Ubicación del Archivo Log",
+        'record_metrics': "Grabar Métricas",
+        'recording_location': "Ubicación de Grabaciones",
         'log_filter': "Filtrar Logs",
         'clear_logs': "Limpiar Logs",
         'export_logs': "Exportar Logs",
@@ -270,6 +386,10 @@ TEXTS = {
         'snapshot_created': "Instantánea del proyecto creada: {0}",
         'snapshot_restored': "Instantánea del proyecto restaurada: {0}",
         'logs_exported': "Logs exportados a {0}",
+        'export_running': "Ya hay una exportación de registros en curso",
+        'export_progress': "Exportando registros... {:.0f}%",
+        'export_cancelled': "Exportación de registros cancelada",
+        'no_log_files': "No se encontraron archivos de registro diarios",
         
         # Log levels
         'log_debug': "Debug",
@@ -284,6 +404,24 @@ TEXTS = {
         'filter_warning': "Aviso",
         'filter_error': "Error",
         'no_logs': "No hay logs para mostrar",
+        'no_log_matches': "No hay registros coincidentes",
+        'log_position': "{}–{} de {}",
+        'scan_memory': "Analizar",
+        'no_memory_scan': "Ejecute un análisis para ver la memoria por datablock",
+        'top_consumers': "Mayores consumidores:",
+        'leak_trend': "Tendencia base: {0} MB/min",
+        'pressure_level': "Presión de memoria: {0} ({1:.0f}%)",
+        'swap_status': "Swap: {0:.0f} MB, entrada {1:.1f} MB/s, {2:.0f} fallos/s",
+        'process_tree_total': "Blender + hijos: {0}",
+        'replay_live': "Mostrando datos en vivo",
+        'replay_range': "Desde {0}, {1:.0f} min",
+        'replay_position': "Posición",
+        'replay_load_failed': "No se pudo cargar la grabación: {0}",
+        'no_profile': "Ningún operador registrado",
+        'profile_operator': "Operador (llamadas)",
+        'profile_cleared': "Perfil de operadores borrado",
+        'profile_exported': "Perfil exportado a {0}",
+        'profile_export_failed': "Error al exportar perfil",
     },
     
     'FR': {
@@ -6,6 +6,7 @@ from . import (
     reset_defaults,
     toggle_overlay,
     export_logs,
+    export_profile,
     diagnose_conflicts
 )
 
@@ -19,11 +20,13 @@ def register():
     reset_defaults.register()
     toggle_overlay.register()
     export_logs.register()
+    export_profile.register()
     diagnose_conflicts.register()
     # Os operadores de version são registrados no próprio módulo version
 
 def unregister():
     diagnose_conflicts.unregister()
+    export_profile.unregister()
     export_logs.unregister()
     toggle_overlay.unregister()
     reset_defaults.unregister()
@@ -1,17 +1,19 @@
 # =============================================================================
-# operators/export_logs.py — Export logs to a text file
+# operators/export_logs.py — Export logs to a text, JSON Lines or gzip file
 # =============================================================================
 
 import bpy
-import os
 import datetime
 from .. import utils
+from ..utils import log_export
 from ..i18n import get_text as _
 
+_EXTENSIONS = {'TEXT': ".txt", 'JSONL': ".jsonl"}
+
 class BIGBRAIN_OT_ExportLogs(bpy.types.Operator):
     bl_idname = "bigbrain.export_logs"
     bl_label = "Export Logs"
-    bl_description = "Export BigBrain logs to a text file"
+    bl_description = "Export BigBrain logs to a file (Esc cancels a running export)"
     bl_options = {'REGISTER'}
     
     filepath: bpy.props.StringProperty(
@@ -21,6 +23,38 @@ class BIGBRAIN_OT_ExportLogs(bpy.types.Operator):
         subtype='FILE_PATH'
     )
     
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('BUFFER', "Log Buffer", "Entries kept in memory this session"),
+            ('FILES', "Daily Log Files", "Merge the daily log files written to disk")
+        ],
+        default='BUFFER'
+    )
+    
+    export_format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('TEXT', "Text", "One formatted line per entry"),
+            ('JSONL', "JSON Lines", "One JSON object per entry")
+        ],
+        default='TEXT'
+    )
+    
+    compress: bpy.props.BoolProperty(
+        name="Gzip",
+        description="Compress the export with gzip",
+        default=False
+    )
+    
+    days: bpy.props.IntProperty(
+        name="Days",
+        description="Number of most recent daily log files to merge",
+        default=1,
+        min=1,
+        max=365
+    )
+    
     def invoke(self, context, event):
         # Set default filename with timestamp
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -30,37 +64,100 @@ class BIGBRAIN_OT_ExportLogs(bpy.types.Operator):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
     
+    def check(self, context):
+        """Keep the file extension in line with the format options"""
+        base = self.filepath
+        for extension in (".gz", ".txt", ".jsonl"):
+            if base.endswith(extension):
+                base = base[:-len(extension)]
+        filepath = base + _EXTENSIONS[self.export_format] + (".gz" if self.compress else "")
+        if filepath == self.filepath:
+            return False
+        self.filepath = filepath
+        return True
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "source")
+        if self.source == 'FILES':
+            layout.prop(self, "days")
+        layout.prop(self, "export_format")
+        layout.prop(self, "compress")
+    
+    def _create_job(self, context, filepath):
+        if self.source == 'BUFFER':
+            return log_export.ExportJob(filepath, self.export_format, self.compress,
+                                        store=utils.logging.store)
+        prefs = context.preferences.addons["bigbrain"].preferences
+        paths = log_export.daily_files(utils.logging.get_log_directory(prefs), self.days)
+        if not paths:
+            return None
+        return log_export.ExportJob(filepath, self.export_format, self.compress, paths=paths)
+    
     def execute(self, context):
         # Resolve the filepath (handle // for relative paths)
         filepath = bpy.path.abspath(self.filepath)
         
-        try:
-            # Create directory if it doesn't exist
-            directory = os.path.dirname(filepath)
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-            
-            # Write logs to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"BigBrain Logs - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 60 + "\n\n")
-                
-                for entry in utils.log_entries:
-                    f.write(f"{entry}\n")
-            
-            # Log the action
-            utils.log(_('logs_exported').format(filepath))
-            self.report({'INFO'}, _('logs_exported').format(filepath))
-            
-            return {'FINISHED'}
-            
-        except Exception as e:
-            utils.log(f"Error exporting logs: {e}")
-            self.report({'ERROR'}, f"Error exporting logs: {e}")
+        if log_export.is_running():
+            self.report({'WARNING'}, _('export_running'))
             return {'CANCELLED'}
+        
+        job = self._create_job(context, filepath)
+        if job is None:
+            self.report({'WARNING'}, _('no_log_files'))
+            return {'CANCELLED'}
+        
+        # Without a window (background mode) there is no modal loop to wait in
+        if context.window is None:
+            job.run()
+            return self._finish(job)
+        
+        log_export.start(job)
+        self._job = job
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        job = self._job
+        if event.type == 'ESC':
+            job.cancel()
+        elif event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        wm = context.window_manager
+        wm.progress_update(int(job.progress * 100))
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if job.is_alive():
+            return {'PASS_THROUGH'}
+        
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        return self._finish(job)
+    
+    def _finish(self, job):
+        if job.cancelled:
+            self.report({'WARNING'}, _('export_cancelled'))
+            return {'CANCELLED'}
+        
+        if job.error is not None:
+            utils.log("Error exporting logs: {}", 'ERROR', job.error)
+            self.report({'ERROR'}, f"Error exporting logs: {job.error}")
+            return {'CANCELLED'}
+        
+        # Log the action
+        utils.log(_('logs_exported').format(job.filepath))
+        self.report({'INFO'}, _('logs_exported').format(job.filepath))
+        return {'FINISHED'}
 
 def register():
     bpy.utils.register_class(BIGBRAIN_OT_ExportLogs)
 
 def unregister():
-    bpy.utils.unregister_class(BIGBRAIN_OT_ExportLogs)
\ No newline at end of file
+    # Don't leave a worker writing after the addon is gone
+    log_export.cancel()
+    bpy.utils.unregister_class(BIGBRAIN_OT_ExportLogs)
@@ -0,0 +1,52 @@
+# =============================================================================
+# operators/export_profile.py — Export operator profiler statistics as CSV
+# =============================================================================
+
+import bpy
+import os
+import datetime
+from .. import utils
+from ..i18n import get_text as _
+
+class BIGBRAIN_OT_ExportProfile(bpy.types.Operator):
+    bl_idname = "bigbrain.export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Export per-operator time and memory statistics to a CSV file"
+    bl_options = {'REGISTER'}
+    
+    filepath: bpy.props.StringProperty(
+        name="File Path",
+        description="Path to save the CSV file",
+        default="//bigbrain_profile.csv",
+        subtype='FILE_PATH'
+    )
+    
+    def invoke(self, context, event):
+        # Set default filename with timestamp
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.filepath = f"//bigbrain_profile_{timestamp}.csv"
+        
+        # Show file browser
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        # Resolve the filepath (handle // for relative paths)
+        filepath = bpy.path.abspath(self.filepath)
+        
+        directory = os.path.dirname(filepath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        if utils.profiler.export_csv(filepath):
+            self.report({'INFO'}, _('profile_exported').format(filepath))
+            return {'FINISHED'}
+        
+        self.report({'ERROR'}, _('profile_export_failed'))
+        return {'CANCELLED'}
+
+def register():
+    bpy.utils.register_class(BIGBRAIN_OT_ExportProfile)
+
+def unregister():
+    bpy.utils.unregister_class(BIGBRAIN_OT_ExportProfile)
@@ -19,24 +19,54 @@ class BIGBRAIN_OT_ResetDefaults(bpy.types.Operator):
         for prop in [
             "undo_steps", 
             "undo_memory_limit", 
+            "smart_undo",
+            "undo_budget_share",
             "status_delay", 
+            "adaptive_sampling",
+            "min_sample_interval",
+            "max_sample_interval",
+            "use_sampler_thread",
+            "sampler_rate",
             "show_overlay", 
             "language",
             "critical_threshold",
             "warning_sound",
+            "pressure_response",
+            "pressure_soft",
+            "pressure_hard",
+            "pressure_critical",
+            "pressure_soft_actions",
+            "pressure_hard_actions",
+            "pressure_critical_actions",
+            "leak_detection",
+            "leak_threshold",
+            "leak_window",
+            "enable_profiler",
             "show_graph",
             "graph_width",
             "graph_height",
+            "graph_window",
+            "graph_color",
+            "graph_background_color",
             "compact_overlay",
             "show_fps",
             "show_vram",
+            "show_process_tree",
             "log_to_file",
             "log_level",
+            "log_capacity",
+            "record_metrics",
             "auto_disable_conflicts"
         ]:
             if hasattr(prefs, prop):
                 try:
-                    default = type(prefs).bl_rna.properties[prop].default
+                    rna_prop = type(prefs).bl_rna.properties[prop]
+                    if getattr(rna_prop, "is_array", False):
+                        default = rna_prop.default_array
+                    elif getattr(rna_prop, "is_enum_flag", False):
+                        default = rna_prop.default_flag
+                    else:
+                        default = rna_prop.default
                     setattr(prefs, prop, default)
                 except Exception as e:
                     utils.log(f"Failed to reset {prop}: {e}")
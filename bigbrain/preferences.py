@@ -7,6 +7,46 @@ import os
 from . import utils, version
 from .i18n import get_text as _
 
+def _update_graph_settings(self, context):
+    """Refresh the cached graph settings used by the overlay draw handler"""
+    from .ui import overlay_draw
+    overlay_draw.refresh_settings(self)
+
+def _update_undo_budget(self, context):
+    """Re-apply the undo limits when the smart budget is toggled or retuned"""
+    from . import config
+    config.apply_undo_limits(self)
+
+def _update_process_tree(self, context):
+    """Start/stop walking the process tree for the Blender + children total"""
+    if self.show_process_tree:
+        if not utils.process_tree.start():
+            utils.log("psutil not available, process tree totals disabled", 'WARNING')
+    else:
+        utils.process_tree.stop()
+    utils.ram_monitor.reset_status_cache()
+
+def _update_recorder(self, context):
+    """Start or stop the metrics recording (a new file per start)"""
+    utils.recorder.stop()
+    if self.record_metrics:
+        utils.recorder.start(self.recording_location)
+
+def _update_logging(self, context):
+    """Restart or stop the log file writer with the new settings"""
+    utils.logging.configure(self)
+
+def _update_profiler(self, context):
+    """Install or remove the operator profiler handlers"""
+    if self.enable_profiler:
+        utils.profiler.start()
+    else:
+        utils.profiler.stop()
+
+def _update_sampler_thread(self, context):
+    """Start/stop the background sampler thread when its settings change"""
+    utils.ram_monitor.update_sampler_thread(self)
+
 class BigBrainPreferences(bpy.types.AddonPreferences):
     bl_idname = "bigbrain"
 
@@ -26,6 +66,23 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         min=0
     )
     
+    smart_undo: bpy.props.BoolProperty(
+        name="Smart Undo Budget",
+        description="Adjust undo steps and memory limit to a share of free system RAM, based on the measured memory cost of each undo step (Undo Steps becomes the upper bound)",
+        default=False,
+        update=_update_undo_budget
+    )
+    
+    undo_budget_share: bpy.props.IntProperty(
+        name="Undo Budget (%)",
+        description="Share of free system RAM the undo stack may use",
+        default=25,
+        min=5,
+        max=75,
+        subtype='PERCENTAGE',
+        update=_update_undo_budget
+    )
+    
     # Display settings
     status_delay: bpy.props.FloatProperty(
         name="Status Delay (s)", 
@@ -34,6 +91,44 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         min=0.1
     )
     
+    adaptive_sampling: bpy.props.BoolProperty(
+        name="Adaptive Sampling",
+        description="Sample faster while memory changes quickly or nears the critical threshold, and back off while usage is flat or Blender is idle",
+        default=False
+    )
+    
+    min_sample_interval: bpy.props.FloatProperty(
+        name="Min Interval (s)",
+        description="Fastest sampling interval used by adaptive sampling",
+        default=0.1,
+        min=0.05,
+        max=5.0
+    )
+    
+    max_sample_interval: bpy.props.FloatProperty(
+        name="Max Interval (s)",
+        description="Slowest sampling interval used by adaptive sampling",
+        default=5.0,
+        min=0.5,
+        max=60.0
+    )
+    
+    use_sampler_thread: bpy.props.BoolProperty(
+        name="Background Sampling",
+        description="Read process and system metrics (RSS, CPU, swap, I/O) on a background thread instead of the UI thread",
+        default=False,
+        update=_update_sampler_thread
+    )
+    
+    sampler_rate: bpy.props.FloatProperty(
+        name="Sampling Rate (Hz)",
+        description="How often the background thread samples process metrics",
+        default=10.0,
+        min=1.0,
+        max=20.0,
+        update=_update_sampler_thread
+    )
+    
     show_overlay: bpy.props.BoolProperty(
         name="Show RAM Overlay", 
         description="Show RAM usage in the status bar",
@@ -43,7 +138,8 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
     show_graph: bpy.props.BoolProperty(
         name="Show RAM Graph", 
         description="Show RAM usage graph overlay",
-        default=False
+        default=False,
+        update=_update_graph_settings
     )
     
     graph_width: bpy.props.IntProperty(
@@ -51,7 +147,8 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         description="Width of the RAM graph in pixels",
         default=200, 
         min=100, 
-        max=500
+        max=500,
+        update=_update_graph_settings
     )
     
     graph_height: bpy.props.IntProperty(
@@ -59,7 +156,44 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         description="Height of the RAM graph in pixels",
         default=100, 
         min=50, 
-        max=300
+        max=300,
+        update=_update_graph_settings
+    )
+    
+    graph_window: bpy.props.EnumProperty(
+        name="Graph Window",
+        description="Time span shown by the RAM graph",
+        items=[
+            ('1M', "1 Minute", "Raw samples from the last minute"),
+            ('10M', "10 Minutes", "Last 10 minutes"),
+            ('1H', "1 Hour", "Last hour"),
+            ('8H', "8 Hours", "Last 8 hours (minute averages)"),
+            ('24H', "24 Hours", "Last 24 hours (minute averages)")
+        ],
+        default='1M',
+        update=_update_graph_settings
+    )
+    
+    graph_color: bpy.props.FloatVectorProperty(
+        name="Graph Color",
+        description="Color of the RAM graph line",
+        subtype='COLOR',
+        size=4,
+        min=0.0,
+        max=1.0,
+        default=(0.0, 1.0, 0.0, 1.0),
+        update=_update_graph_settings
+    )
+    
+    graph_background_color: bpy.props.FloatVectorProperty(
+        name="Graph Background",
+        description="Background color of the RAM graph",
+        subtype='COLOR',
+        size=4,
+        min=0.0,
+        max=1.0,
+        default=(0.0, 0.0, 0.0, 0.5),
+        update=_update_graph_settings
     )
     
     compact_overlay: bpy.props.BoolProperty(
@@ -80,6 +214,13 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         default=True
     )
     
+    show_process_tree: bpy.props.BoolProperty(
+        name="Show Blender + Children",
+        description="Show the memory of Blender plus its child processes (render/bake subprocesses, helper tools); requires psutil",
+        default=False,
+        update=_update_process_tree
+    )
+    
     # Warning settings
     critical_threshold: bpy.props.IntProperty(
         name="Critical RAM Threshold (MB)", 
@@ -101,18 +242,117 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         subtype='FILE_PATH'
     )
     
+    # Memory pressure settings
+    pressure_response: bpy.props.BoolProperty(
+        name="Memory Pressure Response",
+        description="Free memory automatically as system RAM usage crosses the soft, hard and critical levels",
+        default=False
+    )
+    
+    pressure_soft: bpy.props.IntProperty(
+        name="Soft Level (%)",
+        description="System RAM usage that starts the soft pressure actions",
+        default=75,
+        min=10,
+        max=99,
+        subtype='PERCENTAGE'
+    )
+    
+    pressure_hard: bpy.props.IntProperty(
+        name="Hard Level (%)",
+        description="System RAM usage that starts the hard pressure actions",
+        default=85,
+        min=10,
+        max=99,
+        subtype='PERCENTAGE'
+    )
+    
+    pressure_critical: bpy.props.IntProperty(
+        name="Critical Level (%)",
+        description="System RAM usage that starts the critical pressure actions",
+        default=95,
+        min=10,
+        max=99,
+        subtype='PERCENTAGE'
+    )
+    
+    pressure_soft_actions: bpy.props.EnumProperty(
+        name="Soft Actions",
+        description="Actions run when entering the soft level",
+        items=utils.pressure.ACTION_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'FREE_IMAGE_GPU'}
+    )
+    
+    pressure_hard_actions: bpy.props.EnumProperty(
+        name="Hard Actions",
+        description="Actions run when entering the hard level",
+        items=utils.pressure.ACTION_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'FREE_IMAGE_GPU', 'CLEAR_SEQUENCER_CACHE', 'PAUSE_GRAPH'}
+    )
+    
+    pressure_critical_actions: bpy.props.EnumProperty(
+        name="Critical Actions",
+        description="Actions run when entering the critical level",
+        items=utils.pressure.ACTION_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'FREE_IMAGE_GPU', 'CLEAR_SEQUENCER_CACHE', 'LOWER_UNDO_LIMIT', 'PAUSE_GRAPH'}
+    )
+    
+    # Leak detection settings
+    leak_detection: bpy.props.BoolProperty(
+        name="Leak Detection",
+        description="Watch the RAM baseline for sustained growth and report the operators and handlers active while it grows",
+        default=True
+    )
+    
+    leak_threshold: bpy.props.FloatProperty(
+        name="Leak Threshold (MB/min)",
+        description="Baseline growth rate reported as a possible leak",
+        default=5.0,
+        min=0.1
+    )
+    
+    leak_window: bpy.props.IntProperty(
+        name="Leak Window (min)",
+        description="Time span the baseline trend is fitted over",
+        default=10,
+        min=3,
+        max=120
+    )
+    
+    # Profiler settings
+    enable_profiler: bpy.props.BoolProperty(
+        name="Operator Profiler",
+        description="Record wall time, RAM and VRAM deltas for every operator run",
+        default=False,
+        update=_update_profiler
+    )
+    
     # Logging settings
     log_to_file: bpy.props.BoolProperty(
         name="Log to File", 
         description="Save logs to file",
-        default=False
+        default=False,
+        update=_update_logging
     )
     
     log_location: bpy.props.StringProperty(
         name="Log Location", 
         description="Directory to save log files",
         default="",
-        subtype='DIR_PATH'
+        subtype='DIR_PATH',
+        update=_update_logging
+    )
+    
+    log_capacity: bpy.props.IntProperty(
+        name="Log Capacity",
+        description="Number of log entries kept in memory (oldest are dropped first)",
+        default=10000,
+        min=100,
+        max=200000,
+        update=_update_logging
     )
     
     log_level: bpy.props.EnumProperty(
@@ -124,7 +364,24 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
             ('WARNING', "Warning", "Show only warning and error messages"),
             ('ERROR', "Error", "Show only error messages")
         ],
-        default='INFO'
+        default='INFO',
+        update=_update_logging
+    )
+    
+    # Metrics recording settings
+    record_metrics: bpy.props.BoolProperty(
+        name="Record Metrics",
+        description="Append every sample to a compact binary recording for post-mortem analysis",
+        default=False,
+        update=_update_recorder
+    )
+    
+    recording_location: bpy.props.StringProperty(
+        name="Recording Location",
+        description="Directory for metrics recordings (empty = BigBrain's recordings folder)",
+        default="",
+        subtype='DIR_PATH',
+        update=_update_recorder
     )
     
     # Terminal settings
@@ -201,6 +458,20 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         col.prop(self, "undo_steps", text=_('undo_steps'))
         col.prop(self, "undo_memory_limit", text=_('undo_memory'))
         
+        row = col.row(align=True)
+        row.prop(self, "smart_undo", text=_('smart_undo'))
+        sub = row.row(align=True)
+        sub.enabled = self.smart_undo
+        sub.prop(self, "undo_budget_share", text=_('undo_budget_share'))
+        
+        if self.smart_undo:
+            budget = utils.undo_budget.status
+            if budget['steps']:
+                col.label(text=_('undo_budget_status').format(
+                    budget['memory_limit'], budget['steps'], budget['step_cost']), icon='INFO')
+            else:
+                col.label(text=_('undo_budget_waiting'), icon='INFO')
+        
         # Display settings
         box = layout.box()
         box.label(text=_('display_settings'), icon='SCREEN_BACK')
@@ -211,6 +482,17 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         row.prop(self, "compact_overlay", text=_('compact_overlay'))
         
         col.prop(self, "status_delay", text=_('status_delay'))
+        col.prop(self, "adaptive_sampling", text=_('adaptive_sampling'))
+        if self.adaptive_sampling:
+            row = col.row(align=True)
+            row.prop(self, "min_sample_interval", text=_('min_sample_interval'))
+            row.prop(self, "max_sample_interval", text=_('max_sample_interval'))
+        
+        row = col.row(align=True)
+        row.prop(self, "use_sampler_thread", text=_('use_sampler_thread'))
+        sub = row.row(align=True)
+        sub.enabled = self.use_sampler_thread
+        sub.prop(self, "sampler_rate", text=_('sampler_rate'))
         
         # Graph settings
         sub_box = box.box()
@@ -222,12 +504,17 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
             col = sub_box.column(align=True)
             col.prop(self, "graph_width", text=_('graph_width'))
             col.prop(self, "graph_height", text=_('graph_height'))
+            col.prop(self, "graph_window", text=_('graph_window'))
+            row = col.row(align=True)
+            row.prop(self, "graph_color", text=_('graph_color'))
+            row.prop(self, "graph_background_color", text=_('graph_background_color'))
         
         # Additional display options
         col = box.column(align=True)
         col.enabled = self.show_overlay
         col.prop(self, "show_fps", text=_('show_fps'))
         col.prop(self, "show_vram", text=_('show_vram'))
+        col.prop(self, "show_process_tree", text=_('show_process_tree'))
         
         # Warning settings
         box = layout.box()
@@ -243,17 +530,43 @@ class BigBrainPreferences(bpy.types.AddonPreferences):
         if self.warning_sound and self.critical_threshold > 0:
             col.prop(self, "warning_sound_file", text="")
         
+        col = box.column(align=True)
+        col.prop(self, "pressure_response", text=_('pressure_response'))
+        if self.pressure_response:
+            for level in ('soft', 'hard', 'critical'):
+                row = col.row(align=True)
+                row.prop(self, f"pressure_{level}", text=_(f'pressure_{level}'))
+                row.prop(self, f"pressure_{level}_actions")
+        
+        col = box.column(align=True)
+        col.prop(self, "leak_detection", text=_('leak_detection'))
+        sub = col.row(align=True)
+        sub.enabled = self.leak_detection
+        sub.prop(self, "leak_threshold", text=_('leak_threshold'))
+        sub.prop(self, "leak_window", text=_('leak_window'))
+        
+        col.prop(self, "enable_profiler", text=_('enable_profiler'))
+        
         # Logging settings
         box = layout.box()
         box.label(text=_('logging_settings'), icon='TEXT')
         
         col = box.column(align=True)
         col.prop(self, "log_level", text=_('log_level'))
+        col.prop(self, "log_capacity", text=_('log_capacity'))
         col.prop(self, "log_to_file", text=_('log_to_file'))
         
         if self.log_to_file:
             col.prop(self, "log_location", text=_('log_location'))
         
+        col = box.column(align=True)
+        col.prop(self, "record_metrics", text=_('record_metrics'))
+        if self.record_metrics:
+            col.prop(self, "recording_location", text=_('recording_location'))
+            filepath = utils.recorder.get_filepath()
+            if filepath:
+                col.label(text=os.path.basename(filepath), icon='REC')
+        
         # Terminal settings
         box = layout.box()
         box.prop(self, "show_terminal", text=_('show_terminal'))
@@ -6,6 +6,9 @@ from . import (
     log_viewer,
     header_status,
     overlay_draw,
+    memory_panel,
+    profiler_panel,
+    replay_panel,
     terminal_panel
 )
 
@@ -13,10 +16,16 @@ def register():
     log_viewer.register()
     header_status.register()
     overlay_draw.register()
+    memory_panel.register()
+    profiler_panel.register()
+    replay_panel.register()
     terminal_panel.register()
 
 def unregister():
     terminal_panel.unregister()
+    replay_panel.unregister()
+    profiler_panel.unregister()
+    memory_panel.unregister()
     overlay_draw.unregister()
     header_status.unregister()
     log_viewer.unregister()
\ No newline at end of file
@@ -26,9 +26,9 @@ class BIGBRAIN_HT_Header(bpy.types.Header):
         # BigBrain label
         row.label(text="BB", icon='MEMORY')
         
-        # RAM usage
-        stats = bpy.app.memory_statistics()
-        used_ram = stats.get("mem_in_use", 0) / (1024 * 1024)  # Convert to MB
+        # RAM usage from the shared snapshot (sampled at most once per interval)
+        snapshot = utils.sampler.get_snapshot()
+        used_ram = snapshot.ram
         
         # Format based on size
         if used_ram > 1024:
@@ -43,16 +43,25 @@ class BIGBRAIN_HT_Header(bpy.types.Header):
         
         row.label(text=ram_text)
         
+        # Blender + children total from the process tree walker
+        if prefs.show_process_tree:
+            tree = utils.process_tree.get_totals()
+            if tree is not None:
+                total = tree['total']
+                if total > 1024:
+                    tree_text = f"{total/1024:.2f} GB"
+                else:
+                    tree_text = f"{total:.1f} MB"
+                row.label(text=_('process_tree_total').format(tree_text))
+        
         # FPS if enabled
         if hasattr(prefs, "show_fps") and prefs.show_fps:
-            fps = context.scene.render.fps / context.scene.render.fps_base
-            row.label(text=f"{fps:.1f} FPS")
+            row.label(text=f"{snapshot.fps:.1f} FPS")
         
         # VRAM if enabled and available
         if hasattr(prefs, "show_vram") and prefs.show_vram:
-            vram = stats.get("gpu_mem_in_use", 0)
-            if vram > 0:
-                vram_mb = vram / (1024 * 1024)
+            vram_mb = snapshot.vram
+            if vram_mb > 0:
                 if vram_mb > 1024:
                     vram_text = f"{vram_mb/1024:.2f} GB"
                 else:
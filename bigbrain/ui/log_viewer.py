@@ -3,20 +3,190 @@
 # =============================================================================
 
 import bpy
+import time
+import textwrap
 from .. import utils
+from ..utils.log_store import DEBUG, INFO, WARNING, ERROR
 from ..i18n import get_text as _
 
+# Entries shown per page
+PAGE_SIZE = 20
+
+# Approximate label character width at UI scale 1.0 and the space taken by
+# the panel margins and the icon, in pixels
+CHAR_WIDTH = 7.0
+LINE_MARGIN = 50
+MIN_LINE_CHARS = 20
+
+# Wrapped entries kept; the cache is dropped once it grows past this
+MAX_WRAPPED = 2000
+
+_FILTER_LEVELS = {
+    'ALL': None,
+    'INFO': (INFO,),
+    'WARNING': (WARNING,),
+    'ERROR': (ERROR,)
+}
+
+# Search time facet: seconds back from now
+_SEARCH_RANGES = {
+    'ALL': None,
+    '1M': 60,
+    '10M': 600,
+    '1H': 3600
+}
+
+_LEVEL_ICONS = {
+    DEBUG: 'CONSOLE',
+    INFO: 'INFO',
+    WARNING: 'ERROR',
+    ERROR: 'CANCEL'
+}
+
+# Wrapped lines per record sequence number, valid for _wrap_chars
+_wrapped = {}
+_wrap_chars = 0
+
+# Last search: (key, matching seqs)
+_results = (None, [])
+
+# Last built page: (key, lines, first, last, total)
+_page = (None, [], 0, 0, 0)
+
+def get_line_chars(context):
+    """Characters that fit on one label line of the panel's region"""
+    scale = context.preferences.system.ui_scale
+    width = context.region.width / scale if context.region else 300
+    return max(int((width - LINE_MARGIN) / CHAR_WIDTH), MIN_LINE_CHARS)
+
+def wrap_record(record, chars):
+    """Wrapped lines of a record (computed once per record and width)"""
+    global _wrap_chars
+    if chars != _wrap_chars:
+        _wrapped.clear()
+        _wrap_chars = chars
+    lines = _wrapped.get(record.seq)
+    if lines is None:
+        if len(_wrapped) >= MAX_WRAPPED:
+            _wrapped.clear()
+        lines = tuple(textwrap.wrap(record.format(), chars)) or ("",)
+        _wrapped[record.seq] = lines
+    return lines
+
+def get_results(scene):
+    """
+    Sequence numbers matching the search box, or None without a search
+
+    Results are kept until the log, query or facets change; the time facet
+    is re-evaluated at most once a second.
+    """
+    global _results
+    query = scene.bigbrain_log_search.strip()
+    if not query:
+        return None
+
+    span = _SEARCH_RANGES.get(scene.bigbrain_log_search_range)
+    now = int(time.time())
+    key = (utils.logging.store.version, query, scene.bigbrain_log_filter, span,
+           now if span is not None else None)
+    if _results[0] != key:
+        since = now - span if span is not None else None
+        seqs = utils.logging.search_logs(query, _FILTER_LEVELS.get(scene.bigbrain_log_filter), since)
+        _results = (key, seqs)
+    return _results[1]
+
+def _view_total(scene, results):
+    if results is not None:
+        return len(results)
+    return utils.logging.store.count(_FILTER_LEVELS.get(scene.bigbrain_log_filter))
+
+def clamp_offset(total, offset):
+    """Limit an offset (entries back from the newest) to a view of total entries"""
+    return min(max(offset, 0), max(total - PAGE_SIZE, 0))
+
+def get_page(scene, chars):
+    """
+    Lines of the page ending bigbrain_log_offset entries before the newest
+    entry of the view (the filtered log or the search results)
+
+    Only the entries of the page are fetched; the result is reused until
+    the log, view, offset or width changes.
+
+    Returns:
+        (lines, first, last, total): (text, icon) tuples, the 1-based
+        positions of the first and last entry shown and the view's total
+    """
+    global _page
+    store = utils.logging.store
+    results = get_results(scene)
+    key = (store.version, scene.bigbrain_log_filter, _results[0] if results is not None else None,
+           scene.bigbrain_log_offset, chars)
+    if _page[0] == key:
+        return _page[1:]
+
+    total = _view_total(scene, results)
+    end = total - clamp_offset(total, scene.bigbrain_log_offset)
+    start = max(end - PAGE_SIZE, 0)
+    if results is not None:
+        records = [store.get(seq) for seq in results[start:end]]
+    else:
+        records = store.window(start, end - start, _FILTER_LEVELS.get(scene.bigbrain_log_filter))
+
+    lines = []
+    for record in records:
+        wrapped = wrap_record(record, chars)
+        lines.append((wrapped[0], _LEVEL_ICONS.get(record.level, 'INFO')))
+        lines.extend((text, 'BLANK1') for text in wrapped[1:])
+
+    _page = (key, lines, start + 1, end, total)
+    return _page[1:]
+
+def _update_log_view(self, context):
+    """A new filter or search starts at its newest entries"""
+    self.bigbrain_log_offset = 0
+
 class BIGBRAIN_OT_ClearLogs(bpy.types.Operator):
     bl_idname = "bigbrain.clear_logs"
     bl_label = "Clear Logs"
     bl_description = "Clear all log entries"
     
     def execute(self, context):
-        utils.log_entries.clear()
+        utils.logging.clear_logs()
         utils.log(_('logs_cleared'))
+        context.scene.bigbrain_log_offset = 0
         self.report({"INFO"}, _('logs_cleared'))
         return {"FINISHED"}
 
+class BIGBRAIN_OT_ScrollLogs(bpy.types.Operator):
+    bl_idname = "bigbrain.scroll_logs"
+    bl_label = "Scroll Logs"
+    bl_description = "Page through the log"
+    
+    direction: bpy.props.EnumProperty(
+        items=[
+            ('OLDEST', "Oldest", "Jump to the oldest entries"),
+            ('UP', "Older", "Show the previous page"),
+            ('DOWN', "Newer", "Show the next page"),
+            ('NEWEST', "Newest", "Jump to the newest entries and follow new ones")
+        ],
+        default='NEWEST'
+    )
+    
+    def execute(self, context):
+        scene = context.scene
+        offset = scene.bigbrain_log_offset
+        total = _view_total(scene, get_results(scene))
+        if self.direction == 'OLDEST':
+            offset = total
+        elif self.direction == 'UP':
+            offset += PAGE_SIZE
+        elif self.direction == 'DOWN':
+            offset -= PAGE_SIZE
+        else:
+            offset = 0
+        scene.bigbrain_log_offset = clamp_offset(total, offset)
+        return {"FINISHED"}
+
 class BIGBRAIN_PT_LogViewer(bpy.types.Panel):
     bl_label = "BigBrain Logs"
     bl_idname = "BIGBRAIN_PT_log_viewer"
@@ -27,50 +197,48 @@ class BIGBRAIN_PT_LogViewer(bpy.types.Panel):
     
     def draw(self, context):
         layout = self.layout
+        scene = context.scene
         
         # Filter controls
         row = layout.row(align=True)
         row.label(text=_('log_filter'))
+        row.prop(scene, "bigbrain_log_filter", text="")
+        
+        # Search
+        row = layout.row(align=True)
+        row.prop(scene, "bigbrain_log_search", text="", icon='VIEWZOOM')
+        row.prop(scene, "bigbrain_log_search_range", text="")
         
-        # Log level filter (if implemented)
-        if hasattr(context.scene, "bigbrain_log_filter"):
-            row.prop(context.scene, "bigbrain_log_filter", text="")
+        # Log entries: only the current page is fetched and wrapped
+        lines, first, last, total = get_page(scene, get_line_chars(context))
         
-        # Log entries
         box = layout.box()
         col = box.column(align=True)
-        
-        if not utils.log_entries:
-            col.label(text=_('no_logs'))
+        if not lines:
+            col.label(text=_('no_log_matches') if scene.bigbrain_log_search.strip() else _('no_logs'))
         else:
-            # Show the most recent logs (limited to avoid performance issues)
-            for entry in utils.log_entries[-20:]:
-                # Determine icon based on log content (optional)
-                icon = 'INFO'
-                if "error" in entry.lower() or "failed" in entry.lower():
-                    icon = 'ERROR'
-                elif "warning" in entry.lower():
-                    icon = 'ERROR'
-                
-                # Wrap long lines
-                if len(entry) > 40:
-                    wrapped_lines = [entry[i:i+40] for i in range(0, len(entry), 40)]
-                    for i, wrapped in enumerate(wrapped_lines):
-                        # Only show icon on first line
-                        if i == 0:
-                            col.label(text=wrapped, icon=icon)
-                        else:
-                            col.label(text=wrapped)
-                else:
-                    col.label(text=entry, icon=icon)
+            for text, icon in lines:
+                col.label(text=text, icon=icon)
+        
+        # Paging
+        row = layout.row(align=True)
+        for direction, icon in (('OLDEST', 'TRIA_UP_BAR'), ('UP', 'TRIA_UP'),
+                                ('DOWN', 'TRIA_DOWN'), ('NEWEST', 'TRIA_DOWN_BAR')):
+            row.operator("bigbrain.scroll_logs", text="", icon=icon).direction = direction
+        row.label(text=_('log_position').format(first if total else 0, last, total))
         
         # Action buttons
         row = layout.row(align=True)
         row.operator("bigbrain.clear_logs", icon='X')
         row.operator("bigbrain.export_logs", icon='EXPORT')
+        
+        job = utils.log_export.get_job()
+        if job is not None and job.is_alive():
+            layout.label(text=_('export_progress').format(job.progress * 100), icon='SORTTIME')
 
 def register():
     bpy.utils.register_class(BIGBRAIN_OT_ClearLogs)
+    bpy.utils.register_class(BIGBRAIN_OT_ScrollLogs)
     bpy.utils.register_class(BIGBRAIN_PT_LogViewer)
     
     # Register log filter property
@@ -82,13 +250,50 @@ def register():
             ('WARNING', _('filter_warning'), "Show warning entries only"),
             ('ERROR', _('filter_error'), "Show error entries only")
         ],
-        default='ALL'
+        default='ALL',
+        update=_update_log_view
+    )
+    
+    bpy.types.Scene.bigbrain_log_search = bpy.props.StringProperty(
+        name="Search Logs",
+        description="Show entries containing all of these words (matched as word prefixes)",
+        default="",
+        update=_update_log_view
+    )
+    
+    bpy.types.Scene.bigbrain_log_search_range = bpy.props.EnumProperty(
+        name="Search Range",
+        description="Only search entries from this recent period",
+        items=[
+            ('ALL', "Any Time", "Search the whole log"),
+            ('1M', "Last Minute", "Entries from the last minute"),
+            ('10M', "Last 10 Minutes", "Entries from the last 10 minutes"),
+            ('1H', "Last Hour", "Entries from the last hour")
+        ],
+        default='ALL',
+        update=_update_log_view
+    )
+    
+    bpy.types.Scene.bigbrain_log_offset = bpy.props.IntProperty(
+        name="Log Offset",
+        description="Entries between the newest one and the last entry shown (0 follows new entries)",
+        default=0,
+        min=0
     )
 
 def unregister():
+    global _page, _results
     bpy.utils.unregister_class(BIGBRAIN_PT_LogViewer)
+    bpy.utils.unregister_class(BIGBRAIN_OT_ScrollLogs)
     bpy.utils.unregister_class(BIGBRAIN_OT_ClearLogs)
     
-    # Unregister log filter property
+    # Unregister log properties
     if hasattr(bpy.types.Scene, "bigbrain_log_filter"):
-        del bpy.types.Scene.bigbrain_log_filter
\ No newline at end of file
+        del bpy.types.Scene.bigbrain_log_filter
+    for prop in ("bigbrain_log_offset", "bigbrain_log_search", "bigbrain_log_search_range"):
+        if hasattr(bpy.types.Scene, prop):
+            delattr(bpy.types.Scene, prop)
+    
+    _wrapped.clear()
+    _page = (None, [], 0, 0, 0)
+    _results = (None, [])
@@ -0,0 +1,147 @@
+# =============================================================================
+# ui/memory_panel.py — Sidebar panel with the per-datablock memory breakdown
+# =============================================================================
+
+import bpy
+from .. import utils
+from ..i18n import get_text as _
+
+# Icons per datablock kind
+KIND_ICONS = {
+    'MESH': 'MESH_DATA',
+    'IMAGE': 'IMAGE_DATA',
+    'CACHE': 'PHYSICS',
+}
+
+# Number of rows shown in the top consumers list
+TOP_COUNT = 15
+
+class BIGBRAIN_OT_ScanMemory(bpy.types.Operator):
+    bl_idname = "bigbrain.scan_memory"
+    bl_label = "Scan Memory"
+    bl_description = "Estimate memory used by meshes, images and particle/physics caches"
+    
+    full: bpy.props.BoolProperty(
+        name="Full Rescan",
+        description="Re-estimate every datablock instead of only the ones changed since the last scan",
+        default=False
+    )
+    
+    def execute(self, context):
+        count = utils.memory_analyzer.scan(full=self.full)
+        utils.log("Memory scan: {} datablocks estimated", 'DEBUG', count)
+        return {'FINISHED'}
+
+class BIGBRAIN_PT_MemoryBreakdown(bpy.types.Panel):
+    bl_label = "Memory Breakdown"
+    bl_idname = "BIGBRAIN_PT_memory_breakdown"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'BigBrain'
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    def draw(self, context):
+        layout = self.layout
+        analyzer = utils.memory_analyzer
+        
+        # Leak detector status
+        leak = utils.leak_detector.status
+        box = layout.box()
+        row = box.row()
+        row.alert = leak['suspected']
+        row.label(
+            text=_('leak_trend').format(f"{leak['slope']:+.1f}"),
+            icon='ERROR' if leak['suspected'] else 'GRAPH'
+        )
+        if leak['suspected']:
+            col = box.column(align=True)
+            for name, count in leak['culprits']:
+                col.label(text=f"{name} x{count}")
+        
+        # Swap and page faults
+        swap = utils.ram_monitor.get_paging_stats()
+        if swap['swap_used'] > 0 or swap['thrashing']:
+            row = box.row()
+            row.alert = swap['thrashing']
+            row.label(text=_('swap_status').format(
+                swap['swap_used'], swap['swap_in_rate'], swap['fault_rate']),
+                icon='ERROR' if swap['thrashing'] else 'DISK_DRIVE')
+        
+        # Memory pressure level
+        pressure = utils.pressure.status
+        if pressure['level'] != 'NONE':
+            row = box.row()
+            row.alert = pressure['level'] == 'CRITICAL'
+            row.label(text=_('pressure_level').format(pressure['level'], pressure['percent']), icon='ERROR')
+        
+        # Scan controls
+        row = layout.row(align=True)
+        row.operator("bigbrain.scan_memory", text=_('scan_memory'), icon='FILE_REFRESH').full = False
+        row.operator("bigbrain.scan_memory", text="", icon='RECOVER_LAST').full = True
+        
+        if not analyzer.has_results():
+            layout.label(text=_('no_memory_scan'))
+            return
+        
+        # Totals per datablock kind
+        box = layout.box()
+        col = box.column(align=True)
+        for kind, total in analyzer.get_collection_totals().items():
+            row = col.row()
+            row.label(text=kind.title(), icon=KIND_ICONS[kind])
+            row.label(text=utils.ram_monitor.format_ram(total))
+        
+        # Sort / filter controls
+        row = layout.row(align=True)
+        row.prop(context.scene, "bigbrain_memory_kind", text="")
+        row.prop(context.scene, "bigbrain_memory_sort", text="")
+        
+        # Top consumers
+        kind = context.scene.bigbrain_memory_kind
+        items = analyzer.get_top_consumers(
+            TOP_COUNT,
+            kind=None if kind == 'ALL' else kind,
+            sort=context.scene.bigbrain_memory_sort
+        )
+        
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text=_('top_consumers'))
+        for item_kind, name, size_mb in items:
+            row = col.row()
+            row.label(text=name, icon=KIND_ICONS[item_kind])
+            row.label(text=utils.ram_monitor.format_ram(size_mb))
+
+def register():
+    bpy.utils.register_class(BIGBRAIN_OT_ScanMemory)
+    bpy.utils.register_class(BIGBRAIN_PT_MemoryBreakdown)
+    
+    bpy.types.Scene.bigbrain_memory_sort = bpy.props.EnumProperty(
+        name="Sort",
+        items=[
+            ('SIZE', "Size", "Largest first"),
+            ('NAME', "Name", "Alphabetical"),
+            ('TYPE', "Type", "Grouped by datablock type")
+        ],
+        default='SIZE'
+    )
+    
+    bpy.types.Scene.bigbrain_memory_kind = bpy.props.EnumProperty(
+        name="Type",
+        items=[
+            ('ALL', "All", "All datablock types"),
+            ('MESH', "Meshes", "Mesh geometry and attributes"),
+            ('IMAGE', "Images", "Loaded image pixel buffers"),
+            ('CACHE', "Caches", "Particle and physics caches")
+        ],
+        default='ALL'
+    )
+
+def unregister():
+    bpy.utils.unregister_class(BIGBRAIN_PT_MemoryBreakdown)
+    bpy.utils.unregister_class(BIGBRAIN_OT_ScanMemory)
+    
+    if hasattr(bpy.types.Scene, "bigbrain_memory_kind"):
+        del bpy.types.Scene.bigbrain_memory_kind
+    if hasattr(bpy.types.Scene, "bigbrain_memory_sort"):
+        del bpy.types.Scene.bigbrain_memory_sort
@@ -5,74 +5,329 @@
 import bpy
 import gpu
 import blf
-import time
+import datetime
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 from .. import utils
 from ..i18n import get_text as _
 
-# Store RAM history for graph
-ram_history = []
-last_update_time = 0
-MAX_HISTORY_POINTS = 100
+# Graph time windows in seconds, keyed by the graph_window preference
+GRAPH_WINDOWS = {
+    '1M': 60,
+    '10M': 600,
+    '1H': 3600,
+    '8H': 8 * 3600,
+    '24H': 24 * 3600,
+}
 
-def get_ram_usage():
-    """Get current RAM usage in MB"""
-    stats = bpy.app.memory_statistics()
-    return stats.get("mem_in_use", 0) / (1024 * 1024)
+class GraphSettings:
+    """Snapshot of the graph preferences read by the draw callback"""
+    __slots__ = ("show_graph", "width", "height", "window_seconds",
+                 "line_color", "background_color")
 
-def update_ram_history():
-    """Update RAM history for graph"""
-    global ram_history, last_update_time
+    def __init__(self):
+        self.show_graph = False
+        self.width = 200
+        self.height = 100
+        self.window_seconds = 60
+        self.line_color = (0.0, 1.0, 0.0, 1.0)
+        self.background_color = (0.0, 0.0, 0.0, 0.5)
+
+# Refreshed by the preference update callbacks, never by the draw path
+settings = GraphSettings()
+
+# Set by the memory pressure engine; hides the graph without touching prefs
+_paused = False
+
+class ReplayData:
+    """A loaded metrics recording and the part of it being viewed"""
+    __slots__ = ("filepath", "times", "values", "position", "span")
+
+    def __init__(self, filepath, times, values):
+        self.filepath = filepath
+        self.times = times  # Memory-mapped views, never copied whole
+        self.values = values
+        self.position = 1.0  # Scrub cursor, 0..1 of the recording
+        self.span = None  # Seconds shown before the cursor (None = all)
+
+    @property
+    def start(self):
+        return float(self.times[0])
+
+    @property
+    def end(self):
+        return float(self.times[-1])
+
+    def cursor_time(self):
+        return self.start + self.position * (self.end - self.start)
+
+    def view_range(self):
+        if self.span is None:
+            return self.start, self.end
+        cursor = self.cursor_time()
+        return cursor - self.span, cursor
+
+    def value_at(self, timestamp):
+        index = int(np.searchsorted(self.times, timestamp, side='right')) - 1
+        return float(self.values[max(index, 0)])
+
+# Recording shown instead of the live history (None = live)
+_replay = None
+
+def refresh_settings(prefs=None):
+    """
+    Copy graph preferences into the settings snapshot and (un)register the
+    draw handler so a hidden graph costs nothing per frame
+    """
+    if prefs is None:
+        addon = bpy.context.preferences.addons.get("bigbrain")
+        if addon is None:
+            return
+        prefs = addon.preferences
+    
+    settings.show_graph = prefs.show_graph
+    settings.width = prefs.graph_width
+    settings.height = prefs.graph_height
+    settings.window_seconds = GRAPH_WINDOWS.get(prefs.graph_window, 60)
+    settings.line_color = tuple(prefs.graph_color)
+    settings.background_color = tuple(prefs.graph_background_color)
     
-    # Limit update frequency
-    current_time = time.time()
-    if current_time - last_update_time < 0.5:  # Update every 0.5 seconds
+    _update_draw_handler()
+
+def set_paused(paused):
+    """Pause or resume drawing the graph (memory pressure response)"""
+    global _paused
+    _paused = paused
+    _update_draw_handler()
+
+def _update_draw_handler():
+    if bpy.app.background:
         return
+    if (settings.show_graph or _replay is not None) and not _paused:
+        register_draw_handler()
+    else:
+        unregister_draw_handler()
+    
+    # Redraw 3D Views so the change shows up immediately
+    for window in getattr(bpy.context.window_manager, "windows", ()):
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+# Cached GPU state. Batches are built in graph-local coordinates and moved
+# into place with a matrix translation, so views of different sizes share
+# them and orbiting/redrawing never rebuilds anything.
+_shader = None
+_bg_batch = None
+_bg_key = None
+_line_batch = None
+_line_key = None
+_max_ram = 0.0
+
+def _get_shader():
+    """Get the (cached) builtin uniform color shader"""
+    global _shader
+    if _shader is None:
+        if bpy.app.version >= (4, 0, 0):
+            _shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        else:
+            _shader = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
+    return _shader
+
+def _get_background_batch(width, height):
+    """Get the background rectangle batch, rebuilt only on resize"""
+    global _bg_batch, _bg_key
+    key = (width, height)
+    if _bg_batch is None or _bg_key != key:
+        vertices = ((0, 0), (width, 0), (width, height), (0, height))
+        indices = ((0, 1, 2), (0, 2, 3))
+        _bg_batch = batch_for_shader(_get_shader(), 'TRIS', {"pos": vertices}, indices=indices)
+        _bg_key = key
+    return _bg_batch
+
+def _get_line_batch(history, seconds, now, width, height):
+    """
+    Get the graph line batch, rebuilt only when a new sample has landed or
+    the graph size/window changed
+
+    Returns:
+        (batch or None, max value used for scaling)
+    """
+    global _line_batch, _line_key, _max_ram
+    key = (history.version, seconds, width, height)
+    if _line_key == key:
+        return _line_batch, _max_ram
+    
+    _line_key = key
+    _line_batch = None
     
-    last_update_time = current_time
+    # Pick the finest history tier covering the selected window
+    times, values, mins, maxs = history.window(seconds, now)
+    if len(values) < 2:
+        _max_ram = 0.0
+        return None, _max_ram
     
-    # Add current RAM usage to history
-    ram_history.append(get_ram_usage())
+    # Scale to the peak in the window (rollup peaks included)
+    _max_ram = float(np.max(maxs))
+    scale = height / _max_ram if _max_ram > 0 else 0.0
     
-    # Limit history size
-    if len(ram_history) > MAX_HISTORY_POINTS:
-        ram_history.pop(0)
+    # Compute all vertices in one vectorized pass
+    points = np.empty((len(values), 2), dtype=np.float32)
+    points[:, 0] = np.clip((np.asarray(times, dtype=np.float64) - (now - seconds)) / seconds, 0.0, 1.0) * width
+    points[:, 1] = np.asarray(values, dtype=np.float32) * scale
+    
+    _line_batch = batch_for_shader(_get_shader(), 'LINE_STRIP', {"pos": points})
+    return _line_batch, _max_ram
 
-def draw_ram_graph(context):
-    """Draw RAM usage graph overlay"""
-    prefs = context.preferences.addons["bigbrain"].preferences
+def decimate_minmax(times, values, start, end, width):
+    """
+    Reduce the samples in [start, end] to at most two points per pixel column
+
+    Each column keeps its minimum and maximum, so spikes survive however
+    many samples fall into one pixel and the output size depends only on
+    the width, not on the recording length.
+
+    Returns:
+        (x positions in 0..width, values) as float32 arrays
+    """
+    first = int(np.searchsorted(times, start, side='left'))
+    last = int(np.searchsorted(times, end, side='right'))
+    times = np.asarray(times[first:last], dtype=np.float64)
+    values = np.asarray(values[first:last], dtype=np.float32)
+    span = max(end - start, 1e-6)
     
-    # Check if graph should be shown
-    if not hasattr(prefs, "show_graph") or not prefs.show_graph:
+    if len(values) <= 2 * width:
+        return ((times - start) / span * width).astype(np.float32), values
+    
+    # Samples are time-ordered, so each column is one contiguous run
+    columns = np.minimum(((times - start) / span * width).astype(np.int64), width - 1)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(columns)) + 1))
+    mins = np.minimum.reduceat(values, starts)
+    maxs = np.maximum.reduceat(values, starts)
+    
+    # Interleave min and max per column into one line strip
+    xs = np.repeat(columns[starts].astype(np.float32), 2)
+    ys = np.empty(len(starts) * 2, dtype=np.float32)
+    ys[0::2] = mins
+    ys[1::2] = maxs
+    return xs, ys
+
+def _get_replay_batch(width, height):
+    """
+    Get the replay line batch for the current view, rebuilt only when the
+    scrub position, span or graph size changed
+
+    Returns:
+        (batch or None, max value used for scaling)
+    """
+    global _line_batch, _line_key, _max_ram
+    key = ('REPLAY', id(_replay), _replay.position, _replay.span, width, height)
+    if _line_key == key:
+        return _line_batch, _max_ram
+    
+    _line_key = key
+    _line_batch = None
+    
+    start, end = _replay.view_range()
+    xs, ys = decimate_minmax(_replay.times, _replay.values, start, end, width)
+    if len(ys) < 2:
+        _max_ram = 0.0
+        return None, _max_ram
+    
+    _max_ram = float(ys.max())
+    scale = height / _max_ram if _max_ram > 0 else 0.0
+    points = np.empty((len(ys), 2), dtype=np.float32)
+    points[:, 0] = xs
+    points[:, 1] = ys * scale
+    
+    _line_batch = batch_for_shader(_get_shader(), 'LINE_STRIP', {"pos": points})
+    return _line_batch, _max_ram
+
+def load_replay(filepath):
+    """
+    Show a metrics recording in the graph instead of the live history
+
+    Raises:
+        OSError, ValueError if the file cannot be read as a recording
+    """
+    global _replay, _line_key
+    records = utils.recorder.read_recording(filepath)
+    if len(records) < 2:
+        raise ValueError("Recording has fewer than two samples")
+    _replay = ReplayData(filepath, records['timestamp'], records['ram'])
+    _line_key = None
+    _update_draw_handler()
+
+def close_replay():
+    """Return the graph to live data"""
+    global _replay, _line_key
+    _replay = None
+    _line_key = None
+    _update_draw_handler()
+
+def get_replay():
+    """The loaded ReplayData, or None while showing live data"""
+    return _replay
+
+def set_replay_view(position, span):
+    """Move the scrub cursor (0..1) and set the seconds shown (None = all)"""
+    if _replay is None:
+        return
+    _replay.position = min(max(position, 0.0), 1.0)
+    _replay.span = span
+    _update_draw_handler()
+
+def _reset_cache():
+    """Drop cached GPU resources (on unregister / reload)"""
+    global _shader, _bg_batch, _bg_key, _line_batch, _line_key, _max_ram
+    _shader = None
+    _bg_batch = None
+    _bg_key = None
+    _line_batch = None
+    _line_key = None
+    _max_ram = 0.0
+
+def draw_ram_graph():
+    """Draw RAM usage graph overlay"""
+    if _replay is not None:
+        draw_replay_graph()
         return
     
-    # Update RAM history
-    update_ram_history()
+    # Refresh the shared history if the sampler is due (no-op otherwise)
+    snapshot = utils.sampler.get_snapshot()
+    seconds = settings.window_seconds
     
     # Get graph dimensions
-    width = prefs.graph_width
-    height = prefs.graph_height
+    width = settings.width
+    height = settings.height
     
     # Position in bottom right corner with padding
-    region = context.region
+    region = bpy.context.region
     x = region.width - width - 20
     y = 20
     
-    # Draw background
-    draw_rect(x, y, width, height, (0.0, 0.0, 0.0, 0.5))
+    shader = _get_shader()
+    bg_batch = _get_background_batch(width, height)
+    line_batch, max_ram = _get_line_batch(
+        utils.ram_monitor.ram_history, seconds, snapshot.timestamp, width, height)
     
-    # Draw graph if we have enough data
-    if len(ram_history) > 1:
-        # Find max value for scaling
-        max_ram = max(ram_history)
-        if max_ram <= 0:
-            max_ram = 1  # Avoid division by zero
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((x, y))
+        shader.bind()
         
-        # Draw graph lines
-        draw_graph_lines(x, y, width, height, ram_history, max_ram)
+        # Draw background
+        shader.uniform_float("color", settings.background_color)
+        bg_batch.draw(shader)
         
+        # Draw graph lines
+        if line_batch is not None:
+            shader.uniform_float("color", settings.line_color)
+            line_batch.draw(shader)
+    
+    # Draw labels if we have enough data
+    if line_batch is not None:
         # Draw current value
-        current_ram = ram_history[-1]
+        current_ram = snapshot.ram
         blf.color(0, 1.0, 1.0, 1.0, 1.0)
         blf.position(0, x + 5, y + height - 20, 0)
         blf.size(0, 12)
@@ -93,66 +348,39 @@ def draw_ram_graph(context):
             max_text = f"Max: {max_ram:.0f} MB"
         blf.draw(0, max_text)
 
-def draw_rect(x, y, width, height, color):
-    """Draw a rectangle with the given dimensions and color"""
-    if bpy.app.version >= (4, 0, 0):
-        # Blender 4.0+ shader approach
-        with gpu.matrix.push_pop():
-            # Set up the shader
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            batch = batch_for_shader(
-                shader, 'TRI_FAN',
-                {
-                    "pos": ((x, y), (x + width, y), (x + width, y + height), (x, y + height)),
-                }
-            )
-            
-            # Draw the rectangle
-            shader.bind()
-            shader.uniform_float("color", color)
-            batch.draw(shader)
-    else:
-        # Blender 2.93-3.x approach
-        vertices = ((x, y), (x + width, y), (x + width, y + height), (x, y + height))
-        indices = ((0, 1, 2), (0, 2, 3))
-        
-        shader = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
-        batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-        
-        shader.bind()
-        shader.uniform_float("color", color)
-        batch.draw(shader)
-
-def draw_graph_lines(x, y, width, height, data, max_value):
-    """Draw graph lines for the given data"""
-    if not data or len(data) < 2:
-        return
+def draw_replay_graph():
+    """Draw the loaded recording around the scrub cursor"""
+    width = settings.width
+    height = settings.height
     
-    # Calculate points
-    points = []
-    for i, value in enumerate(data):
-        px = x + (i / (len(data) - 1)) * width
-        py = y + (value / max_value) * height
-        points.append((px, py))
-    
-    # Draw lines
-    if bpy.app.version >= (4, 0, 0):
-        # Blender 4.0+ shader approach
-        with gpu.matrix.push_pop():
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": points})
-            
-            shader.bind()
-            shader.uniform_float("color", (0.0, 1.0, 0.0, 1.0))
-            batch.draw(shader)
-    else:
-        # Blender 2.93-3.x approach
-        shader = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
-        batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": points})
-        
+    region = bpy.context.region
+    x = region.width - width - 20
+    y = 20
+    
+    shader = _get_shader()
+    bg_batch = _get_background_batch(width, height)
+    line_batch, max_ram = _get_replay_batch(width, height)
+    
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((x, y))
         shader.bind()
-        shader.uniform_float("color", (0.0, 1.0, 0.0, 1.0))
-        batch.draw(shader)
+        shader.uniform_float("color", settings.background_color)
+        bg_batch.draw(shader)
+        if line_batch is not None:
+            shader.uniform_float("color", settings.line_color)
+            line_batch.draw(shader)
+    
+    cursor = _replay.cursor_time()
+    stamp = datetime.datetime.fromtimestamp(cursor).strftime('%Y-%m-%d %H:%M:%S')
+    blf.size(0, 12)
+    blf.color(0, 1.0, 0.8, 0.2, 1.0)
+    blf.position(0, x + 5, y + height - 20, 0)
+    blf.draw(0, f"REPLAY {stamp}")
+    blf.color(0, 1.0, 1.0, 1.0, 1.0)
+    blf.position(0, x + 5, y + height - 36, 0)
+    blf.draw(0, f"RAM: {utils.ram_monitor.format_ram(_replay.value_at(cursor))}")
+    blf.position(0, x + 5, y + 5, 0)
+    blf.draw(0, f"Max: {utils.ram_monitor.format_ram(max_ram)}")
 
 # Drawing handler
 _draw_handle = None
@@ -162,7 +390,7 @@ def register_draw_handler():
     global _draw_handle
     if _draw_handle is None:
         _draw_handle = bpy.types.SpaceView3D.draw_handler_add(
-            draw_ram_graph, (bpy.context,), 'WINDOW', 'POST_PIXEL')
+            draw_ram_graph, (), 'WINDOW', 'POST_PIXEL')
 
 def unregister_draw_handler():
     """Unregister the drawing handler"""
@@ -172,7 +400,12 @@ def unregister_draw_handler():
         _draw_handle = None
 
 def register():
-    register_draw_handler()
+    # Registers the draw handler only if the graph is enabled
+    refresh_settings()
 
 def unregister():
-    unregister_draw_handler()
\ No newline at end of file
+    global _paused, _replay
+    unregister_draw_handler()
+    _reset_cache()
+    _paused = False
+    _replay = None
\ No newline at end of file
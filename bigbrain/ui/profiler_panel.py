@@ -0,0 +1,83 @@
+# =============================================================================
+# ui/profiler_panel.py — Sidebar table of the most expensive operators
+# =============================================================================
+
+import bpy
+from .. import utils
+from ..i18n import get_text as _
+
+# Number of operators listed in the table
+TOP_COUNT = 10
+
+class BIGBRAIN_OT_ClearProfile(bpy.types.Operator):
+    bl_idname = "bigbrain.clear_profile"
+    bl_label = "Clear Profile"
+    bl_description = "Clear all recorded operator statistics"
+    
+    def execute(self, context):
+        utils.profiler.clear()
+        utils.log(_('profile_cleared'))
+        self.report({"INFO"}, _('profile_cleared'))
+        return {"FINISHED"}
+
+class BIGBRAIN_PT_Profiler(bpy.types.Panel):
+    bl_label = "Operator Profiler"
+    bl_idname = "BIGBRAIN_PT_profiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'BigBrain'
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    def draw_header(self, context):
+        prefs = context.preferences.addons["bigbrain"].preferences
+        self.layout.prop(prefs, "enable_profiler", text="")
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        row = layout.row(align=True)
+        row.prop(context.scene, "bigbrain_profile_sort", expand=True)
+        
+        rows = utils.profiler.get_ranking(context.scene.bigbrain_profile_sort, TOP_COUNT)
+        
+        box = layout.box()
+        col = box.column(align=True)
+        if not rows:
+            col.label(text=_('no_profile'))
+        else:
+            # Column headers
+            header = col.row()
+            header.label(text=_('profile_operator'))
+            header.label(text="p50 / p95 ms")
+            header.label(text="RAM p95")
+            
+            for entry in rows:
+                row = col.row()
+                row.label(text=f"{entry['name']} ({entry['calls']})")
+                row.label(text=f"{entry['time_p50']:.0f} / {entry['time_p95']:.0f}")
+                row.label(text=f"{entry['ram_p95']:+.1f} MB")
+        
+        row = layout.row(align=True)
+        row.operator("bigbrain.clear_profile", icon='X')
+        row.operator("bigbrain.export_profile", icon='EXPORT')
+
+def register():
+    bpy.utils.register_class(BIGBRAIN_OT_ClearProfile)
+    bpy.utils.register_class(BIGBRAIN_PT_Profiler)
+    
+    bpy.types.Scene.bigbrain_profile_sort = bpy.props.EnumProperty(
+        name="Sort",
+        items=[
+            ('TIME', "Time", "Slowest operators (p95 wall time) first"),
+            ('RAM', "RAM", "Largest RAM growth (p95) first"),
+            ('CALLS', "Calls", "Most frequently used operators first")
+        ],
+        default='TIME'
+    )
+
+def unregister():
+    bpy.utils.unregister_class(BIGBRAIN_PT_Profiler)
+    bpy.utils.unregister_class(BIGBRAIN_OT_ClearProfile)
+    
+    if hasattr(bpy.types.Scene, "bigbrain_profile_sort"):
+        del bpy.types.Scene.bigbrain_profile_sort
@@ -0,0 +1,125 @@
+# =============================================================================
+# ui/replay_panel.py — Load and scrub recorded sessions in the RAM graph
+# =============================================================================
+
+import bpy
+import os
+import datetime
+from .. import utils
+from . import overlay_draw
+from ..i18n import get_text as _
+
+def _update_replay_view(self, context):
+    """Push the scrub position and span to the graph"""
+    overlay_draw.set_replay_view(
+        self.bigbrain_replay_position,
+        overlay_draw.GRAPH_WINDOWS.get(self.bigbrain_replay_span)
+    )
+
+class BIGBRAIN_OT_LoadReplay(bpy.types.Operator):
+    bl_idname = "bigbrain.load_replay"
+    bl_label = "Load Recording"
+    bl_description = "Show a recorded session in the RAM graph"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(
+        default="*" + utils.recorder.FILE_EXTENSION,
+        options={'HIDDEN'}
+    )
+
+    def invoke(self, context, event):
+        self.filepath = utils.recorder.get_default_directory() + os.sep
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        try:
+            overlay_draw.load_replay(filepath)
+        except (OSError, ValueError) as e:
+            utils.log(f"Could not load recording {filepath}: {e}", 'ERROR')
+            self.report({'ERROR'}, _('replay_load_failed').format(e))
+            return {'CANCELLED'}
+
+        _update_replay_view(context.scene, context)
+        utils.log(f"Replaying {filepath}", 'INFO')
+        return {'FINISHED'}
+
+class BIGBRAIN_OT_CloseReplay(bpy.types.Operator):
+    bl_idname = "bigbrain.close_replay"
+    bl_label = "Back to Live"
+    bl_description = "Close the recording and show live data again"
+
+    def execute(self, context):
+        overlay_draw.close_replay()
+        return {'FINISHED'}
+
+class BIGBRAIN_PT_Replay(bpy.types.Panel):
+    bl_label = "Session Replay"
+    bl_idname = "BIGBRAIN_PT_replay"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'BigBrain'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        replay = overlay_draw.get_replay()
+
+        row = layout.row(align=True)
+        row.operator("bigbrain.load_replay", icon='FILE_FOLDER')
+        if replay is None:
+            layout.label(text=_('replay_live'))
+            return
+        row.operator("bigbrain.close_replay", text="", icon='X')
+
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text=os.path.basename(replay.filepath), icon='REC')
+        start = datetime.datetime.fromtimestamp(replay.start)
+        col.label(text=_('replay_range').format(
+            start.strftime('%Y-%m-%d %H:%M'), (replay.end - replay.start) / 60.0))
+
+        col = layout.column(align=True)
+        col.prop(context.scene, "bigbrain_replay_position", text=_('replay_position'), slider=True)
+        col.prop(context.scene, "bigbrain_replay_span", text="")
+
+def register():
+    bpy.utils.register_class(BIGBRAIN_OT_LoadReplay)
+    bpy.utils.register_class(BIGBRAIN_OT_CloseReplay)
+    bpy.utils.register_class(BIGBRAIN_PT_Replay)
+
+    bpy.types.Scene.bigbrain_replay_position = bpy.props.FloatProperty(
+        name="Position",
+        description="Point in the recording shown at the graph cursor",
+        default=1.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+        update=_update_replay_view
+    )
+
+    bpy.types.Scene.bigbrain_replay_span = bpy.props.EnumProperty(
+        name="Span",
+        description="Time shown before the cursor",
+        items=[
+            ('ALL', "Whole Recording", "Show the whole recording"),
+            ('1M', "1 Minute", "Last minute before the cursor"),
+            ('10M', "10 Minutes", "Last 10 minutes before the cursor"),
+            ('1H', "1 Hour", "Last hour before the cursor"),
+            ('8H', "8 Hours", "Last 8 hours before the cursor"),
+            ('24H', "24 Hours", "Last 24 hours before the cursor")
+        ],
+        default='ALL',
+        update=_update_replay_view
+    )
+
+def unregister():
+    bpy.utils.unregister_class(BIGBRAIN_PT_Replay)
+    bpy.utils.unregister_class(BIGBRAIN_OT_CloseReplay)
+    bpy.utils.unregister_class(BIGBRAIN_OT_LoadReplay)
+
+    if hasattr(bpy.types.Scene, "bigbrain_replay_position"):
+        del bpy.types.Scene.bigbrain_replay_position
+    if hasattr(bpy.types.Scene, "bigbrain_replay_span"):
+        del bpy.types.Scene.bigbrain_replay_span
@@ -4,7 +4,17 @@
 
 import bpy
 from . import logging
+from . import sampler
+from . import paging
+from . import process_tree
 from . import ram_monitor
+from . import recorder
+from . import headless
+from . import memory_analyzer
+from . import profiler
+from . import undo_budget
+from . import pressure
+from . import leak_detector
 from . import conflicts
 from . import diagnostics
 from . import system
@@ -15,7 +25,17 @@ addon_keymaps = []
 def register():
     """Register all utility modules"""
     logging.register()
+    sampler.register()
+    paging.register()
+    process_tree.register()
     ram_monitor.register()
+    recorder.register()
+    headless.register()
+    memory_analyzer.register()
+    profiler.register()
+    undo_budget.register()
+    pressure.register()
+    leak_detector.register()
     conflicts.register()
     diagnostics.register()
     system.register()
@@ -51,15 +71,25 @@ def unregister():
     system.unregister()
     diagnostics.unregister()
     conflicts.unregister()
+    leak_detector.unregister()
+    pressure.unregister()
+    undo_budget.unregister()
+    profiler.unregister()
+    memory_analyzer.unregister()
+    headless.unregister()
+    recorder.unregister()
     ram_monitor.unregister()
+    process_tree.unregister()
+    paging.unregister()
+    sampler.unregister()
     logging.unregister()
     
     logging.log("BigBrain utilities unregistered")
 
 # Convenience functions to access from other modules
-def log(message, level='INFO'):
-    """Log a message with the specified level"""
-    return logging.log(message, level)
+def log(message, level='INFO', *args):
+    """Log a message (or a template for args) with the specified level"""
+    return logging.log(message, level, *args)
 
 def get_ram_usage():
     """Get current RAM usage in MB"""
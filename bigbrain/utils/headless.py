@@ -0,0 +1,310 @@
+# =============================================================================
+# utils/headless.py — Per-frame render metrics (with reports in -b sessions)
+# =============================================================================
+
+import bpy
+import os
+import re
+import csv
+import json
+import time
+import datetime
+from . import sampler
+from . import render_sampler
+from . import leak_detector
+from .leak_detector import theil_sen_slope
+
+# "Mem:120.42M (Peak 130.00M)" in the render stats line (Cycles and EEVEE)
+_PEAK_RE = re.compile(r"Peak[:\s]+([\d.]+)\s*([KMG])", re.IGNORECASE)
+_PEAK_UNITS = {'K': 1.0 / 1024, 'M': 1.0, 'G': 1024.0}
+
+REPORT_FIELDS = ['frame', 'render_time', 'ram_start', 'ram_peak', 'ram_avg', 'ram_end',
+                 'rss_peak', 'vram_peak', 'render_peak', 'samples']
+
+# Frames listed as worst in the summary
+WORST_FRAMES = 5
+# Trend fits use at most this many evenly spaced frames (Theil-Sen is O(n^2))
+MAX_TREND_POINTS = 200
+
+class FrameStats:
+    """Metrics of one rendered frame (times in seconds, memory in MB)"""
+    __slots__ = ("frame", "start", "render_time", "ram_start", "ram_peak", "ram_avg",
+                 "ram_end", "rss_peak", "vram_peak", "render_peak", "samples")
+
+    def __init__(self, frame, start, ram, vram):
+        self.frame = frame
+        self.start = start
+        self.render_time = 0.0
+        self.ram_start = ram
+        self.ram_peak = ram
+        self.ram_avg = ram
+        self.ram_end = ram
+        self.rss_peak = 0.0
+        self.vram_peak = vram
+        self.render_peak = 0.0  # Peak reported by the render engine's stats
+        self.samples = 0  # High-frequency samples taken during the frame
+
+    def observe(self, ram, vram):
+        if ram > self.ram_peak:
+            self.ram_peak = ram
+        if vram > self.vram_peak:
+            self.vram_peak = vram
+
+    def merge(self, accumulator):
+        """Fold in the peaks caught by the render sampler thread"""
+        if accumulator is None or not accumulator.samples:
+            return
+        self.samples = accumulator.samples
+        if accumulator.mem_peak > 0:
+            self.ram_avg = accumulator.mem_avg
+        self.rss_peak = accumulator.rss_peak
+        if accumulator.mem_peak > self.ram_peak:
+            self.ram_peak = accumulator.mem_peak
+
+    @property
+    def peak(self):
+        """Highest peak seen by either BigBrain or the render engine"""
+        return max(self.ram_peak, self.render_peak)
+
+    def as_row(self):
+        return {
+            'frame': self.frame,
+            'render_time': round(self.render_time, 3),
+            'ram_start': round(self.ram_start, 1),
+            'ram_peak': round(self.ram_peak, 1),
+            'ram_avg': round(self.ram_avg, 1),
+            'ram_end': round(self.ram_end, 1),
+            'rss_peak': round(self.rss_peak, 1),
+            'vram_peak': round(self.vram_peak, 1),
+            'render_peak': round(self.render_peak, 1),
+            'samples': self.samples,
+        }
+
+# Frames of the current render job
+frames = []
+_current = None
+
+_report_file = None
+_report_writer = None
+report_path = None
+
+# Summary of the last finished animation render (None before the first)
+last_summary = None
+
+def is_headless():
+    """True when Blender runs without a UI (blender -b)"""
+    return bpy.app.background
+
+def parse_render_peak(stats):
+    """Get the peak memory in MB from a render stats line (0.0 if absent)"""
+    match = _PEAK_RE.search(stats or "")
+    if not match:
+        return 0.0
+    return float(match.group(1)) * _PEAK_UNITS[match.group(2).upper()]
+
+def _trend(points):
+    """Theil-Sen slope over at most MAX_TREND_POINTS evenly spaced points"""
+    if len(points) > MAX_TREND_POINTS:
+        step = len(points) / MAX_TREND_POINTS
+        points = [points[int(i * step)] for i in range(MAX_TREND_POINTS)]
+    return theil_sen_slope(points)
+
+def summarize(frames, frame_end):
+    """
+    Summarize a render job
+
+    Args:
+        frames: FrameStats of the rendered frames
+        frame_end: Last frame of the full range, for the peak prediction
+
+    Returns:
+        Dict with frame count, times, worst frames, growth per frame (of
+        the between-frame baseline and of the peaks) and the predicted peak
+        if the full range were rendered
+    """
+    if not frames:
+        return {'frames': 0}
+
+    peaks = [(f.frame, f.peak) for f in frames]
+    baseline_growth = _trend([(f.frame, f.ram_start) for f in frames]) if len(frames) > 1 else 0.0
+    peak_growth = _trend(peaks) if len(frames) > 1 else 0.0
+    max_peak = max(peak for _frame, peak in peaks)
+    last_frame = max(f.frame for f in frames)
+
+    # Extrapolate rising peaks over the frames not rendered (e.g. test runs
+    # with a frame step or a shortened range)
+    remaining = max(frame_end - last_frame, 0)
+    predicted = max_peak + max(peak_growth, 0.0) * remaining
+
+    worst = sorted(frames, key=lambda f: f.peak, reverse=True)[:WORST_FRAMES]
+    total_time = sum(f.render_time for f in frames)
+    return {
+        'frames': len(frames),
+        'total_time': round(total_time, 2),
+        'avg_time': round(total_time / len(frames), 2),
+        'max_time': round(max(f.render_time for f in frames), 2),
+        'peak': round(max_peak, 1),
+        'rss_peak': round(max(f.rss_peak for f in frames), 1),
+        'vram_peak': round(max(f.vram_peak for f in frames), 1),
+        'baseline_growth_per_frame': round(baseline_growth, 3),
+        'peak_growth_per_frame': round(peak_growth, 3),
+        'predicted_peak': round(predicted, 1),
+        'predicted_for_frame': frame_end,
+        'worst_frames': [{'frame': f.frame, 'peak': round(f.peak, 1),
+                          'render_time': round(f.render_time, 2)} for f in worst],
+    }
+
+def _write_summary(summary):
+    from .. import utils
+    if report_path is None:
+        return
+    path = os.path.splitext(report_path)[0] + "_summary.json"
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+    except OSError as e:
+        utils.log(f"Could not write render summary: {e}", 'ERROR')
+
+def _report_directory(scene):
+    directory = os.path.dirname(bpy.path.abspath(scene.render.filepath))
+    return directory or bpy.app.tempdir
+
+def _open_report(scene):
+    """Start a CSV report; rows are flushed per frame so a crash keeps them"""
+    global _report_file, _report_writer, report_path
+    from .. import utils
+    report_path = None
+    stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(_report_directory(scene), f"bigbrain_render_{stamp}.csv")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _report_file = open(path, 'w', encoding='utf-8', newline='')
+    except OSError as e:
+        utils.log(f"Could not create render report: {e}", 'ERROR')
+        return
+    _report_writer = csv.DictWriter(_report_file, fieldnames=REPORT_FIELDS)
+    _report_writer.writeheader()
+    report_path = path
+    utils.log(f"Writing render report to {path}", 'INFO')
+
+def _close_report():
+    global _report_file, _report_writer
+    if _report_file is not None:
+        _report_file.close()
+    _report_file = None
+    _report_writer = None
+
+@bpy.app.handlers.persistent
+def _on_render_init(scene, *args):
+    global _current
+    frames.clear()
+    _current = None
+    if is_headless():
+        _open_report(scene)
+    render_sampler.start(read_guarded=is_headless())
+
+@bpy.app.handlers.persistent
+def _on_render_pre(scene, *args):
+    global _current
+    ram, vram = sampler.read_memory()
+    _current = FrameStats(scene.frame_current, time.perf_counter(), ram, vram)
+    render_sampler.begin_frame()
+
+@bpy.app.handlers.persistent
+def _on_render_stats(stats, *args):
+    if _current is not None:
+        peak = parse_render_peak(stats)
+        if peak > _current.render_peak:
+            _current.render_peak = peak
+
+@bpy.app.handlers.persistent
+def _on_render_post(scene, *args):
+    global _current
+    from .. import utils
+    if _current is None:
+        return
+    frame = _current
+    _current = None
+
+    frame.merge(render_sampler.end_frame())
+    ram, vram = sampler.read_memory()
+    frame.observe(ram, vram)
+    frame.ram_end = ram
+    frame.render_time = time.perf_counter() - frame.start
+    frames.append(frame)
+
+    # In background mode timers don't run during a render job: one shared
+    # snapshot per frame feeds the history and recorder, and the leak
+    # detector is fed directly. With a UI the timers keep running, and
+    # this handler is on the render thread, so listeners are left alone.
+    if is_headless():
+        leak_detector.on_snapshot(sampler.sample())
+
+    if _report_writer is not None:
+        _report_writer.writerow(frame.as_row())
+        _report_file.flush()
+    utils.log("Frame {}: {:.1f} s, RAM peak {:.0f} MB (avg {:.0f} MB), RSS peak {:.0f} MB, "
+              "VRAM peak {:.0f} MB", 'INFO', frame.frame, frame.render_time, frame.ram_peak,
+              frame.ram_avg, frame.rss_peak, frame.vram_peak)
+
+@bpy.app.handlers.persistent
+def _on_render_complete(scene, *args):
+    global last_summary
+    from .. import utils
+    render_sampler.stop()
+    _close_report()
+    # Single-frame renders (F12) in the UI have no trend to report
+    if not frames or (len(frames) < 2 and not is_headless()):
+        return
+
+    summary = summarize(frames, scene.frame_end)
+    last_summary = summary
+    lines = [
+        f"Render finished: {summary['frames']} frames in {summary['total_time']:.1f} s, "
+        f"peak {summary['peak']:.0f} MB, growth {summary['peak_growth_per_frame']:+.2f} MB/frame, "
+        f"predicted peak {summary['predicted_peak']:.0f} MB by frame {scene.frame_end}",
+        "Worst frames: " + ", ".join(
+            f"{f['frame']} ({f['peak']:.0f} MB)" for f in summary['worst_frames'])
+    ]
+    for line in lines:
+        utils.log(line, 'INFO')
+
+    # Reports for render farms and scripts
+    if is_headless():
+        _write_summary(summary)
+        for line in lines:
+            print(f"[BigBrain] {line}")
+
+@bpy.app.handlers.persistent
+def _on_render_cancel(scene, *args):
+    from .. import utils
+    render_sampler.stop()
+    _close_report()
+    utils.log(f"Render cancelled after {len(frames)} frames", 'WARNING')
+
+_HANDLERS = (
+    ("render_init", _on_render_init),
+    ("render_pre", _on_render_pre),
+    ("render_stats", _on_render_stats),
+    ("render_post", _on_render_post),
+    ("render_complete", _on_render_complete),
+    ("render_cancel", _on_render_cancel),
+)
+
+def register():
+    # Per-frame tracking runs in every session; only the CSV/JSON reports
+    # and stdout summary are limited to background mode
+    for name, handler in _HANDLERS:
+        handler_list = getattr(bpy.app.handlers, name)
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+def unregister():
+    global _current
+    for name, handler in _HANDLERS:
+        handler_list = getattr(bpy.app.handlers, name)
+        if handler in handler_list:
+            handler_list.remove(handler)
+    render_sampler.stop()
+    _close_report()
+    _current = None
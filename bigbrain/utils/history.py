@@ -0,0 +1,189 @@
+# =============================================================================
+# utils/history.py — Multi-resolution metric history (raw / minute / hour)
+# =============================================================================
+
+import numpy as np
+from bisect import bisect_left
+from .ring_buffer import RingBuffer
+
+# Default tier sizes: raw samples, 1 day of minutes, 1 week of hours
+RAW_CAPACITY = 7200
+MINUTE_CAPACITY = 24 * 60
+HOUR_CAPACITY = 7 * 24
+
+# Most points a window query should return before a coarser tier is used
+MAX_WINDOW_POINTS = 2000
+
+def _bisect_segments(segments, start):
+    """Index of the first value >= start across sorted ring segments"""
+    offset = 0
+    for segment in segments:
+        if len(segment) and segment[-1] >= start:
+            return offset + bisect_left(segment, start)
+        offset += len(segment)
+    return offset
+
+def _newest(buffer, count, extra=()):
+    """
+    Copy the newest count values of a ring buffer, followed by extra, into
+    one float64 array; only the requested values are copied
+    """
+    arrays = [np.frombuffer(segment, dtype=segment.format)
+              for segment in (buffer.segments(count) if count > 0 else ())]
+    arrays.append(np.asarray(extra, dtype=np.float64))
+    return np.concatenate(arrays)
+
+class RollupTier:
+    """
+    Fixed-period min/max/avg rollups, updated incrementally
+
+    Samples are folded into the open bucket as they arrive; the bucket is
+    pushed into the ring buffers when a sample for a later period shows up.
+    """
+
+    def __init__(self, period, capacity):
+        self.period = period
+        self.times = RingBuffer(capacity, 'd')  # Bucket start times
+        self.mins = RingBuffer(capacity)
+        self.maxs = RingBuffer(capacity)
+        self.avgs = RingBuffer(capacity)
+        self._bucket = None  # Index of the open bucket
+        self._min = 0.0
+        self._max = 0.0
+        self._sum = 0.0
+        self._count = 0
+
+    def add(self, timestamp, value):
+        """Fold one sample into the current bucket"""
+        bucket = int(timestamp // self.period)
+
+        if bucket != self._bucket:
+            self._flush()
+            self._bucket = bucket
+            self._min = self._max = value
+            self._sum = value
+            self._count = 1
+            return
+
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._sum += value
+        self._count += 1
+
+    def _flush(self):
+        if self._bucket is None or not self._count:
+            return
+        self.times.append(self._bucket * self.period)
+        self.mins.append(self._min)
+        self.maxs.append(self._max)
+        self.avgs.append(self._sum / self._count)
+
+    def clear(self):
+        for buffer in (self.times, self.mins, self.maxs, self.avgs):
+            buffer.clear()
+        self._bucket = None
+        self._count = 0
+
+    @property
+    def oldest_time(self):
+        """Start time of the oldest bucket still stored (None if empty)"""
+        if len(self.times):
+            return self.times.segments()[0][0]
+        if self._bucket is not None:
+            return self._bucket * self.period
+        return None
+
+    def covers(self, start):
+        """True if this tier holds everything from `start` that was recorded"""
+        oldest = self.oldest_time
+        return oldest is not None and (oldest <= start or len(self.times) < self.times.capacity)
+
+    def window(self, start):
+        """
+        Get buckets whose start time is >= start, including the open one
+
+        Returns:
+            (times, avgs, mins, maxs) arrays, oldest first
+        """
+        count = len(self.times) - _bisect_segments(self.times.segments(), start)
+
+        # Include the bucket that is still accumulating
+        if self._count and (self._bucket + 1) * self.period > start:
+            return (_newest(self.times, count, (self._bucket * self.period,)),
+                    _newest(self.avgs, count, (self._sum / self._count,)),
+                    _newest(self.mins, count, (self._min,)),
+                    _newest(self.maxs, count, (self._max,)))
+
+        return (_newest(self.times, count), _newest(self.avgs, count),
+                _newest(self.mins, count), _newest(self.maxs, count))
+
+class TieredHistory:
+    """
+    RRD-style history: raw samples plus 1-minute and 1-hour rollups
+
+    Memory use is fixed by the tier capacities, however long the session.
+    """
+
+    def __init__(self, raw_capacity=RAW_CAPACITY, minute_capacity=MINUTE_CAPACITY,
+                 hour_capacity=HOUR_CAPACITY):
+        self.raw = RingBuffer(raw_capacity)
+        self.raw_times = RingBuffer(raw_capacity, 'd')
+        self.minutes = RollupTier(60, minute_capacity)
+        self.hours = RollupTier(3600, hour_capacity)
+
+    def __len__(self):
+        return len(self.raw)
+
+    @property
+    def last(self):
+        return self.raw.last
+
+    @property
+    def version(self):
+        """Changes whenever a sample is added or the history is cleared"""
+        return self.raw.version
+
+    def append(self, timestamp, value):
+        """Add one sample to every tier"""
+        self.raw.append(value)
+        self.raw_times.append(timestamp)
+        self.minutes.add(timestamp, value)
+        self.hours.add(timestamp, value)
+
+    def clear(self):
+        self.raw.clear()
+        self.raw_times.clear()
+        self.minutes.clear()
+        self.hours.clear()
+
+    def _raw_window(self, start):
+        count = len(self.raw_times) - _bisect_segments(self.raw_times.segments(), start)
+        values = _newest(self.raw, count)
+        return _newest(self.raw_times, count), values, values, values
+
+    def window(self, seconds, now, max_points=MAX_WINDOW_POINTS):
+        """
+        Get the history covering the last `seconds` from the finest tier that
+        reaches back that far without returning more than max_points
+
+        Returns:
+            (times, avgs, mins, maxs) float64 arrays, oldest first
+        """
+        start = now - seconds
+
+        count = len(self.raw_times)
+        if count > 1:
+            oldest, newest = self.raw_times.min, self.raw_times.max
+            interval = max((newest - oldest) / (count - 1), 1e-3)
+            covers = oldest <= start or count < self.raw_times.capacity
+            if covers and seconds / interval <= max_points:
+                return self._raw_window(start)
+
+        if seconds / self.minutes.period <= max_points and self.minutes.covers(start):
+            return self.minutes.window(start)
+
+        if self.hours.oldest_time is None:
+            return self._raw_window(start)
+        return self.hours.window(start)
@@ -0,0 +1,230 @@
+# =============================================================================
+# utils/leak_detector.py — Memory leak detection from the RAM baseline trend
+# =============================================================================
+
+import bpy
+import time
+from collections import Counter, deque
+from . import sampler
+from . import profiler
+
+# RAM is reduced to one baseline point (the minimum) per bucket, so undo,
+# purge and GC dips define the baseline while transient spikes are ignored
+BASELINE_BUCKET = 30.0  # seconds
+MIN_POINTS = 6  # Baseline points needed before fitting a trend
+ALERT_COOLDOWN = 600.0  # Seconds between repeated alerts for one episode
+MAX_BUCKETS = 24 * 120  # One day of 30 s buckets
+# Runs from its own timer, never from draw callbacks: the trend fit is
+# O(n^2) and must not stall a viewport redraw
+TICK_INTERVAL = 1.0  # seconds
+
+# Handler lists whose activity is attributed to suspected leaks
+WATCHED_HANDLERS = (
+    "depsgraph_update_post",
+    "frame_change_post",
+    "undo_post",
+    "redo_post",
+)
+
+# Closed buckets: (start time, baseline RAM in MB, Counter of activity)
+_buckets = deque(maxlen=MAX_BUCKETS)
+
+# Open bucket
+_bucket_start = None
+_bucket_min = 0.0
+_bucket_activity = Counter()
+
+# Most recent operator already attributed (as_pointer of wm.operators[-1])
+_last_operator = None
+
+_last_alert_time = 0.0
+_last_snapshot_time = 0.0
+
+# Latest evaluation, read by the UI
+status = {
+    'slope': 0.0,  # Baseline growth in MB/min
+    'growth': 0.0,  # Baseline growth over the window in MB
+    'suspected': False,
+    'culprits': [],  # [(activity name, count)]
+    'evaluated': 0.0,  # Time of the last evaluation
+}
+
+def note_activity(name, count=1):
+    """Attribute activity (an operator or handler) to the current bucket"""
+    _bucket_activity[name] += count
+
+def _poll_operators():
+    """Record operators that finished since the last poll"""
+    global _last_operator
+    operators, _last_operator = profiler.poll_new_operators(_last_operator)
+    for op in operators:
+        note_activity(op.bl_idname)
+
+def theil_sen_slope(points):
+    """Median of pairwise slopes: robust to the odd spike the minimum missed"""
+    slopes = []
+    for i in range(len(points)):
+        t0, v0 = points[i]
+        for j in range(i + 1, len(points)):
+            t1, v1 = points[j]
+            if t1 > t0:
+                slopes.append((v1 - v0) / (t1 - t0))
+    if not slopes:
+        return 0.0
+    slopes.sort()
+    middle = len(slopes) // 2
+    if len(slopes) % 2:
+        return slopes[middle]
+    return (slopes[middle - 1] + slopes[middle]) / 2
+
+def _third_party_handlers(names):
+    """Names of non-BigBrain handler functions registered on the given lists"""
+    root = __name__.split(".")[0]
+    found = []
+    for name in names:
+        for func in getattr(bpy.app.handlers, name, ()):
+            module = getattr(func, "__module__", "") or ""
+            if module.split(".")[0] != root:
+                found.append(f"{name}: {module}.{getattr(func, '__name__', '?')}")
+    return found
+
+def evaluate(prefs):
+    """Fit the baseline trend over the detection window and raise alerts"""
+    global _last_alert_time
+    from .. import utils
+
+    now = time.time()
+    window = prefs.leak_window * 60.0
+    points = [(t, ram) for t, ram, _activity in _buckets if t >= now - window]
+    status['evaluated'] = now
+
+    if len(points) < MIN_POINTS:
+        status.update(slope=0.0, growth=0.0, suspected=False, culprits=[])
+        return
+
+    # Growth must hold over the whole window and still be going on in its
+    # second half, i.e. across many operator runs rather than one big step
+    slope = theil_sen_slope(points) * 60.0
+    recent = points[len(points) // 2:]
+    recent_slope = theil_sen_slope(recent) * 60.0
+    growth = slope * (points[-1][0] - points[0][0]) / 60.0
+    suspected = slope >= prefs.leak_threshold and recent_slope >= prefs.leak_threshold * 0.5
+
+    activity = Counter()
+    for t, _ram, bucket_activity in _buckets:
+        if t >= points[0][0]:
+            activity.update(bucket_activity)
+    culprits = activity.most_common(5)
+
+    status.update(slope=slope, growth=growth, suspected=suspected, culprits=culprits)
+
+    if not suspected:
+        return
+    if now - _last_alert_time < ALERT_COOLDOWN:
+        return
+    _last_alert_time = now
+
+    utils.log(
+        f"Possible memory leak: baseline growing {slope:.1f} MB/min "
+        f"(+{growth:.0f} MB over {len(points) * BASELINE_BUCKET / 60:.0f} min)",
+        'WARNING'
+    )
+    if culprits:
+        utils.log("Activity in that window: " + ", ".join(
+            f"{name} x{count}" for name, count in culprits), 'WARNING')
+    fired = [name for name in WATCHED_HANDLERS if activity.get(f"handler:{name}")]
+    for handler in _third_party_handlers(fired):
+        utils.log(f"  Handler active during growth: {handler}", 'WARNING')
+
+def on_snapshot(snapshot):
+    """Fold a snapshot into the baseline buckets"""
+    global _bucket_start, _bucket_min
+
+    _poll_operators()
+
+    if _bucket_start is None:
+        _bucket_start = snapshot.timestamp
+        _bucket_min = snapshot.ram
+        return
+
+    if snapshot.ram < _bucket_min:
+        _bucket_min = snapshot.ram
+
+    if snapshot.timestamp - _bucket_start < BASELINE_BUCKET:
+        return
+
+    _buckets.append((_bucket_start, _bucket_min, Counter(_bucket_activity)))
+    _bucket_activity.clear()
+    _bucket_start = snapshot.timestamp
+    _bucket_min = snapshot.ram
+
+    try:
+        prefs = bpy.context.preferences.addons["bigbrain"].preferences
+    except KeyError:
+        return
+    if prefs.leak_detection:
+        evaluate(prefs)
+
+def _tick():
+    global _last_snapshot_time
+    try:
+        prefs = bpy.context.preferences.addons["bigbrain"].preferences
+    except KeyError:
+        return TICK_INTERVAL
+    if not prefs.leak_detection:
+        # No sampling while off; a stale baseline would skew the next fit
+        if _bucket_start is not None:
+            reset()
+        return TICK_INTERVAL
+
+    # get_snapshot() samples when nothing else has, so detection keeps
+    # running with the overlay and header off
+    snapshot = sampler.get_snapshot()
+    if snapshot.timestamp != _last_snapshot_time:
+        _last_snapshot_time = snapshot.timestamp
+        on_snapshot(snapshot)
+    return TICK_INTERVAL
+
+def _make_handler(name):
+    @bpy.app.handlers.persistent
+    def _handler(*args):
+        _bucket_activity[f"handler:{name}"] += 1
+    _handler.__name__ = f"_on_{name}"
+    return _handler
+
+_handlers = {name: _make_handler(name) for name in WATCHED_HANDLERS}
+
+def reset():
+    """Forget the baseline (e.g. after loading another file)"""
+    global _bucket_start, _last_operator
+    _buckets.clear()
+    _bucket_activity.clear()
+    _bucket_start = None
+    _last_operator = None
+    status.update(slope=0.0, growth=0.0, suspected=False, culprits=[])
+
+@bpy.app.handlers.persistent
+def _on_load_post(*args):
+    """Loading a file moves the baseline by design: start a new one"""
+    reset()
+
+def register():
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=TICK_INTERVAL, persistent=True)
+    for name, handler in _handlers.items():
+        handler_list = getattr(bpy.app.handlers, name, None)
+        if handler_list is not None and handler not in handler_list:
+            handler_list.append(handler)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    for name, handler in _handlers.items():
+        handler_list = getattr(bpy.app.handlers, name, None)
+        if handler_list is not None and handler in handler_list:
+            handler_list.remove(handler)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    reset()
@@ -0,0 +1,249 @@
+# =============================================================================
+# utils/log_export.py — Streaming log export (text, JSON Lines, gzip)
+# =============================================================================
+
+import os
+import re
+import gzip
+import json
+import glob
+import codecs
+import datetime
+import threading
+
+# Records formatted and written per chunk
+CHUNK_RECORDS = 2000
+# Bytes read per chunk from the daily log files
+CHUNK_BYTES = 1024 * 1024
+
+FORMATS = ('TEXT', 'JSONL')
+
+# "[HH:MM:SS] [LEVEL] message" lines of the daily log files
+_LINE_RE = re.compile(r"^\[(\d\d:\d\d:\d\d)\] \[(\w+)\] (.*)$")
+_FILE_DATE_RE = re.compile(r"bigbrain_(\d{8})\.log$")
+
+# The running (or last) export, read by the UI
+_job = None
+
+def daily_files(directory, days=None):
+    """
+    Daily log files in a directory, oldest first
+
+    Args:
+        directory: Log directory
+        days: Only the newest this many files (None for all)
+    """
+    paths = sorted(path for path in glob.glob(os.path.join(directory, "bigbrain_*.log"))
+                   if _FILE_DATE_RE.search(path))
+    return paths[-days:] if days else paths
+
+def _record_json(record):
+    return json.dumps({
+        'seq': record.seq,
+        'time': datetime.datetime.fromtimestamp(record.timestamp).isoformat(timespec='milliseconds'),
+        'level': record.level_name,
+        'source': record.source,
+        'message': record.message
+    }, ensure_ascii=False)
+
+def _line_json(day, time_str, level, message):
+    return json.dumps({
+        'time': f"{day}T{time_str}",
+        'level': level,
+        'message': message
+    }, ensure_ascii=False)
+
+class ExportJob:
+    """
+    One export, run on a worker thread (or inline with run())
+
+    Records are read from the store in chunks by sequence number; the range
+    is fixed when the job is created, and records the ring buffer overwrites
+    meanwhile are skipped (counted in skipped). Daily files are read up to
+    the size they had when the job started.
+    """
+
+    def __init__(self, filepath, fmt='TEXT', compress=False, store=None, paths=()):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        self.filepath = filepath
+        self.fmt = fmt
+        self.compress = compress
+        self.store = store
+        self.paths = [(path, os.path.getsize(path)) for path in paths]
+        if store is not None:
+            self._first, self._end = store.first_seq, store.next_seq
+            self.total = self._end - self._first
+        else:
+            self._first = self._end = 0
+            self.total = sum(size for _path, size in self.paths)
+        self.done = 0  # Records or bytes processed, out of total
+        self.written = 0  # Records or lines written
+        self.skipped = 0
+        self.error = None
+        self.cancelled = False
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def _open(self):
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.compress:
+            return gzip.open(self.filepath, 'wt', encoding='utf-8', compresslevel=6)
+        return open(self.filepath, 'w', encoding='utf-8')
+
+    def _write_records(self, out):
+        if self.fmt == 'TEXT':
+            out.write(f"BigBrain Logs - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            out.write("=" * 60 + "\n\n")
+        to_line = (lambda record: record.format()) if self.fmt == 'TEXT' else _record_json
+
+        store = self.store
+        for chunk_start in range(self._first, self._end, CHUNK_RECORDS):
+            if self._cancel.is_set():
+                return
+            chunk_end = min(chunk_start + CHUNK_RECORDS, self._end)
+            lines = []
+            for seq in range(chunk_start, chunk_end):
+                record = store.get(seq)
+                # The slot may already hold a newer record
+                if record is None or record.seq != seq:
+                    self.skipped += 1
+                    continue
+                lines.append(to_line(record))
+            if lines:
+                out.write("\n".join(lines) + "\n")
+                self.written += len(lines)
+            self.done = chunk_end - self._first
+
+    def _file_chunks(self, path, size):
+        """Decoded text of the first size bytes of a file, in chunks"""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        remaining = size
+        with open(path, 'rb') as f:
+            while remaining > 0 and not self._cancel.is_set():
+                data = f.read(min(CHUNK_BYTES, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                self.done += len(data)
+                yield decoder.decode(data, final=remaining <= 0)
+
+    @staticmethod
+    def _collect(day, lines, entry, chunk):
+        """
+        Group file lines into JSON entries
+
+        Messages can span lines: only lines with a timestamp start a new
+        entry. Finished entries go to chunk; the open one is returned.
+        """
+        for line in lines:
+            match = _LINE_RE.match(line)
+            if match:
+                if entry is not None:
+                    chunk.append(_line_json(day, *entry))
+                entry = [match.group(1), match.group(2), match.group(3)]
+            elif entry is not None:
+                entry[2] += "\n" + line
+        return entry
+
+    def _write_files(self, out):
+        for path, size in self.paths:
+            day = datetime.datetime.strptime(
+                _FILE_DATE_RE.search(path).group(1), '%Y%m%d').date().isoformat()
+
+            if self.fmt == 'TEXT':
+                out.write(f"===== {day} =====\n")
+                text = ""
+                for text in self._file_chunks(path, size):
+                    out.write(text)
+                    self.written += text.count("\n")
+                if text and not text.endswith("\n"):
+                    out.write("\n")
+                continue
+
+            entry = None
+            tail = ""
+            for text in self._file_chunks(path, size):
+                lines = (tail + text).split("\n")
+                tail = lines.pop()
+                chunk = []
+                entry = self._collect(day, lines, entry, chunk)
+                if chunk:
+                    out.write("\n".join(chunk) + "\n")
+                    self.written += len(chunk)
+
+            chunk = []
+            entry = self._collect(day, [tail] if tail else [], entry, chunk)
+            if entry is not None:
+                chunk.append(_line_json(day, *entry))
+            if chunk:
+                out.write("\n".join(chunk) + "\n")
+                self.written += len(chunk)
+
+    def run(self):
+        """
+        Write the export; errors are kept in self.error
+
+        A failed or cancelled export removes its partial file. Any exception
+        is caught: on the worker thread it would otherwise end the export
+        silently and leave it looking successful.
+        """
+        try:
+            with self._open() as out:
+                if self.store is not None:
+                    self._write_records(out)
+                else:
+                    self._write_files(out)
+        except Exception as e:
+            self.error = e
+        if self._cancel.is_set():
+            self.cancelled = True
+        if self.error is not None or self.cancelled:
+            try:
+                os.remove(self.filepath)
+            except OSError:
+                pass
+        return self.error is None and not self.cancelled
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="BigBrainLogExport")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+def get_job():
+    """The running or last finished export (None if there was none)"""
+    return _job
+
+def is_running():
+    return _job is not None and _job.is_alive()
+
+def start(job):
+    """Run an export on a worker thread"""
+    global _job
+    if is_running():
+        raise RuntimeError("A log export is already running")
+    _job = job
+    job.start()
+    return job
+
+def cancel():
+    """Cancel the running export and wait for the worker to stop"""
+    if _job is not None:
+        _job.cancel()
+        _job.join(timeout=5.0)
@@ -0,0 +1,123 @@
+# =============================================================================
+# utils/log_index.py — Inverted index for searching the log ring buffer
+# =============================================================================
+
+import re
+import bisect
+from collections import deque
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def tokenize(text):
+    """Lowercase word tokens of a text"""
+    return _TOKEN_RE.findall(text.lower())
+
+class LogIndex:
+    """
+    Token -> sequence numbers index over a LogStore
+
+    Records are indexed in sequence order, so every posting list is sorted
+    and the oldest indexed record always sits at the left of its lists; it
+    is dropped in O(tokens) when the store evicts it. New records are indexed
+    when the next query runs, so log() never formats a message for the index.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._postings = {}  # token -> deque of seqs
+        self._indexed = deque()  # (seq, tokens) of indexed records, oldest first
+        self._next_seq = 0  # First sequence number not indexed yet
+        self._vocabulary = None  # Sorted tokens, rebuilt when tokens change
+
+    def __len__(self):
+        return len(self._indexed)
+
+    def evict(self, first_seq):
+        """Drop indexed records older than first_seq"""
+        postings = self._postings
+        indexed = self._indexed
+        while indexed and indexed[0][0] < first_seq:
+            _seq, tokens = indexed.popleft()
+            for token in tokens:
+                posting = postings[token]
+                posting.popleft()
+                if not posting:
+                    del postings[token]
+                    self._vocabulary = None
+
+    def update(self):
+        """Drop evicted records and index the ones added since the last call"""
+        store = self.store
+        first_seq = store.first_seq
+        self.evict(first_seq)
+
+        postings = self._postings
+        for seq in range(max(self._next_seq, first_seq), store.next_seq):
+            record = store.get(seq)
+            if record is None:
+                continue
+            tokens = tuple(set(tokenize(record.message)))
+            for token in tokens:
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = deque()
+                    self._vocabulary = None
+                posting.append(seq)
+            self._indexed.append((seq, tokens))
+        self._next_seq = store.next_seq
+
+    def expand(self, prefix):
+        """Indexed tokens starting with prefix"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = bisect.bisect_left(vocabulary, prefix + "\uffff")
+        return vocabulary[start:end]
+
+    def _matches(self, term):
+        """Seqs of records with a token starting with term"""
+        tokens = self.expand(term)
+        if len(tokens) == 1:
+            return set(self._postings[tokens[0]])
+        matches = set()
+        for token in tokens:
+            matches.update(self._postings[token])
+        return matches
+
+    def search(self, query, levels=None, since=None):
+        """
+        Find records matching every word of query as a prefix
+
+        Args:
+            query: Search text; each word matches tokens starting with it
+            levels: Only records of these levels (None for all)
+            since: Only records logged at or after this timestamp
+
+        Returns:
+            Sorted list of matching sequence numbers, oldest first
+        """
+        self.update()
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return []
+
+        # Longer prefixes expand to fewer tokens: start from the narrowest
+        result = self._matches(terms[0])
+        for term in terms[1:]:
+            if not result:
+                break
+            result &= self._matches(term)
+
+        if levels is not None or since is not None:
+            get = self.store.get
+            result = [seq for seq in result
+                      if (levels is None or get(seq).level in levels)
+                      and (since is None or get(seq).timestamp >= since)]
+        return sorted(result)
+
+    def clear(self):
+        self._postings.clear()
+        self._indexed.clear()
+        self._next_seq = self.store.next_seq
+        self._vocabulary = None
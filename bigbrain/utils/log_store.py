@@ -0,0 +1,206 @@
+# =============================================================================
+# utils/log_store.py — Ring buffer of structured log records with level indexes
+# =============================================================================
+
+import heapq
+import datetime
+from collections import deque
+from itertools import islice
+
+# Log level constants (shared with utils/logging)
+DEBUG = 0
+INFO = 1
+WARNING = 2
+ERROR = 3
+
+LEVELS = (DEBUG, INFO, WARNING, ERROR)
+
+LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR"
+}
+
+DEFAULT_CAPACITY = 10000
+
+# Last formatted second: bursts of records share one strftime call
+_time_cache = (None, "")
+
+def format_time(timestamp):
+    """'HH:MM:SS' for a timestamp"""
+    global _time_cache
+    second = int(timestamp)
+    cached = _time_cache
+    if cached[0] == second:
+        return cached[1]
+    text = datetime.datetime.fromtimestamp(second).strftime('%H:%M:%S')
+    _time_cache = (second, text)
+    return text
+
+class LogRecord:
+    """
+    One log entry
+
+    The message is kept as a template plus arguments and the display text is
+    only built (then cached) when a viewer, export or file sink asks for it.
+    """
+    __slots__ = ("seq", "timestamp", "level", "source", "template", "args", "_text")
+
+    def __init__(self, timestamp, level, source, template, args=()):
+        self.seq = -1  # Assigned by the store
+        self.timestamp = timestamp
+        self.level = level
+        self.source = source  # Module that logged it
+        self.template = template
+        self.args = args
+        self._text = None
+
+    @property
+    def message(self):
+        if not self.args:
+            return self.template
+        try:
+            return self.template.format(*self.args)
+        except (IndexError, KeyError, ValueError):
+            return f"{self.template} {self.args!r}"
+
+    @property
+    def level_name(self):
+        return LEVEL_NAMES.get(self.level, "INFO")
+
+    def format(self):
+        """'[HH:MM:SS] [LEVEL] message', as shown in the viewer and files"""
+        if self._text is None:
+            self._text = f"[{format_time(self.timestamp)}] [{self.level_name}] {self.message}"
+        return self._text
+
+class LogStore:
+    """
+    Fixed-capacity ring buffer of LogRecords
+
+    Records get increasing sequence numbers. Each level keeps a deque of the
+    sequence numbers it owns; the oldest record is always evicted first, so
+    its number is always at the left end of its level's deque and eviction
+    stays O(1). Queries walk only the records they return.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._capacity = max(int(capacity), 1)
+        self._slots = [None] * self._capacity
+        self._next_seq = 0
+        self._floor = 0  # Nothing below this survives a clear()
+        self._levels = {level: deque() for level in LEVELS}
+        self.version = 0  # Bumped on every change, for UI caches
+
+    def __len__(self):
+        return self._next_seq - self.first_seq
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def first_seq(self):
+        """Sequence number of the oldest record still stored"""
+        return max(self._next_seq - self._capacity, self._floor)
+
+    @property
+    def next_seq(self):
+        return self._next_seq
+
+    def append(self, record):
+        """Store a record, evicting the oldest one when full"""
+        index = self._next_seq % self._capacity
+        evicted = self._slots[index]
+        if evicted is not None:
+            self._levels[evicted.level].popleft()
+        record.seq = self._next_seq
+        self._slots[index] = record
+        self._levels.setdefault(record.level, deque()).append(record.seq)
+        self._next_seq += 1
+        self.version += 1
+        return evicted
+
+    def get(self, seq):
+        """Record with this sequence number (None if evicted or unknown)"""
+        if seq < self.first_seq or seq >= self._next_seq:
+            return None
+        return self._slots[seq % self._capacity]
+
+    def count(self, levels=None):
+        """Number of stored records, optionally only of the given levels"""
+        if levels is None:
+            return len(self)
+        return sum(len(self._levels.get(level, ())) for level in levels)
+
+    def iter_seqs(self, levels=None, newest_first=False):
+        """Sequence numbers of stored records, optionally only given levels"""
+        if levels is None:
+            if newest_first:
+                return iter(range(self._next_seq - 1, self.first_seq - 1, -1))
+            return iter(range(self.first_seq, self._next_seq))
+        indexes = [self._levels[level] for level in levels if self._levels.get(level)]
+        if len(indexes) == 1:
+            return reversed(indexes[0]) if newest_first else iter(indexes[0])
+        if newest_first:
+            return heapq.merge(*(reversed(index) for index in indexes), reverse=True)
+        return heapq.merge(*indexes)
+
+    def last(self, count=None, levels=None):
+        """The newest count records (all if None), oldest first"""
+        seqs = self.iter_seqs(levels, newest_first=True)
+        if count is not None:
+            seqs = islice(seqs, count)
+        records = [self._slots[seq % self._capacity] for seq in seqs]
+        records.reverse()
+        return records
+
+    def window(self, start, count, levels=None):
+        """
+        Records at positions start .. start+count of a (filtered) view
+
+        Positions count from the oldest record matching the levels. With no
+        filter or a single level this is a direct index, so a viewer can
+        page through any part of the buffer without walking the rest.
+        """
+        total = self.count(levels)
+        start = max(min(start, total), 0)
+        end = min(start + count, total)
+        if levels is None:
+            first = self.first_seq
+            seqs = range(first + start, first + end)
+        elif len(levels) == 1:
+            index = self._levels.get(levels[0], ())
+            seqs = [index[i] for i in range(start, end)]
+        else:
+            seqs = islice(self.iter_seqs(levels), start, end)
+        return [self._slots[seq % self._capacity] for seq in seqs]
+
+    def records(self, levels=None):
+        """Iterate stored records oldest first"""
+        for seq in self.iter_seqs(levels):
+            yield self._slots[seq % self._capacity]
+
+    def clear(self):
+        self._floor = self._next_seq
+        self._slots = [None] * self._capacity
+        for index in self._levels.values():
+            index.clear()
+        self.version += 1
+
+    def set_capacity(self, capacity):
+        """Resize, keeping the newest records"""
+        capacity = max(int(capacity), 1)
+        if capacity == self._capacity:
+            return
+        kept = self.last(capacity)
+        self._floor = kept[0].seq if kept else self._next_seq
+        self._capacity = capacity
+        self._slots = [None] * capacity
+        for index in self._levels.values():
+            index.clear()
+        for record in kept:
+            self._slots[record.seq % capacity] = record
+            self._levels[record.level].append(record.seq)
+        self.version += 1
@@ -0,0 +1,160 @@
+# =============================================================================
+# utils/log_writer.py — Background, batched writer for the daily log files
+# =============================================================================
+
+import os
+import time
+import queue
+import datetime
+import threading
+
+# Pending text is written once it reaches this size or this age
+FLUSH_BYTES = 64 * 1024
+FLUSH_INTERVAL = 1.0  # seconds
+
+_queue = queue.SimpleQueue()
+_thread = None
+_directory = None
+_stopping = False  # stop() timed out and the thread has not exited yet
+
+# Tells the thread to write everything queued so far and exit
+_STOP = object()
+
+def log_file_path(directory, day):
+    """Path of the log file for a date"""
+    return os.path.join(directory, f"bigbrain_{day.strftime('%Y%m%d')}.log")
+
+class _DailyFile:
+    """One open handle, reopened when the date of the messages changes"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.day = None
+        self.handle = None
+
+    def write(self, day, text):
+        if day != self.day:
+            self.close()
+            os.makedirs(self.directory, exist_ok=True)
+            self.handle = open(log_file_path(self.directory, day), 'a', encoding='utf-8')
+            self.day = day
+        self.handle.write(text)
+
+    def flush(self):
+        if self.handle is not None:
+            self.handle.flush()
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+        self.handle = None
+        self.day = None
+
+def _write_pending(out, pending):
+    """Write queued lines, one write per day (messages arrive in order)"""
+    day, chunk = pending[0][0], []
+    for item_day, text in pending:
+        if item_day != day:
+            out.write(day, "".join(chunk))
+            day, chunk = item_day, []
+        chunk.append(text)
+    out.write(day, "".join(chunk))
+    out.flush()
+
+def _run(directory):
+    out = _DailyFile(directory)
+    pending = []  # [(day, text)]
+    pending_bytes = 0
+    last_flush = time.monotonic()
+    stopping = False
+
+    while not stopping:
+        timeout = max(FLUSH_INTERVAL - (time.monotonic() - last_flush), 0.01)
+        try:
+            item = _queue.get(timeout=timeout)
+        except queue.Empty:
+            item = None
+
+        if item is _STOP:
+            stopping = True
+        elif item is not None:
+            # Records are formatted here, off the UI thread
+            try:
+                text = item.format() + "\n"
+                day = datetime.date.fromtimestamp(item.timestamp)
+            except Exception as e:
+                print(f"[BigBrain] Could not format log record: {e}")
+            else:
+                pending.append((day, text))
+                pending_bytes += len(text)
+
+        if not (stopping or pending_bytes >= FLUSH_BYTES
+                or time.monotonic() - last_flush >= FLUSH_INTERVAL):
+            continue
+        last_flush = time.monotonic()
+        if not pending:
+            continue
+        try:
+            _write_pending(out, pending)
+        except Exception as e:
+            # Don't use log() here: it would queue more lines for this file.
+            # The batch is dropped, but the writer keeps running
+            print(f"[BigBrain] Error writing to log file: {e}")
+        pending = []
+        pending_bytes = 0
+
+    out.close()
+
+def write(record):
+    """Queue a log record for the file of its timestamp's date"""
+    # A dead or stopping writer would let the queue grow without bound
+    if is_running() and not _stopping:
+        _queue.put(record)
+
+def is_running():
+    return _thread is not None and _thread.is_alive()
+
+def start(directory):
+    """Start writing to daily files in directory (restarts if it changed)"""
+    global _thread, _directory, _stopping
+    if is_running() and not _stopping:
+        if directory == _directory:
+            return
+        stop()
+    # An old writer still finishing would share the queue with the new one
+    if is_running():
+        _thread.join(timeout=5.0)
+        if _thread.is_alive():
+            print("[BigBrain] Log writer is still stopping; file logging not restarted")
+            return
+    _stopping = False
+    # A sentinel left for a writer that died would stop the new one at once
+    pending = []
+    while not _queue.empty():
+        item = _queue.get_nowait()
+        if item is not _STOP:
+            pending.append(item)
+    for item in pending:
+        _queue.put(item)
+    _directory = directory
+    _thread = threading.Thread(target=_run, args=(directory,), name="BigBrainLogWriter")
+    _thread.daemon = True
+    _thread.start()
+
+def stop():
+    """Write everything queued so far, close the file and stop the thread"""
+    global _thread, _stopping
+    if not is_running():
+        _thread = None
+        _stopping = False
+        return
+    if not _stopping:
+        _queue.put(_STOP)
+    _thread.join(timeout=5.0)
+    # Keep the handle of a writer that has not exited yet, so start() does
+    # not run a second one next to it
+    if _thread.is_alive():
+        _stopping = True
+    else:
+        _thread = None
+        _stopping = False
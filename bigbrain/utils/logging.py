@@ -4,76 +4,104 @@
 
 import bpy
 import os
-import datetime
+import sys
 import time
+from . import log_store
+from . import log_index
+from . import log_export
+from . import log_writer
 from ..i18n import get_text as _
 
-# Log storage
-log_entries = []
-log_timestamps = []
-log_levels = []
-
-# Log level constants
-DEBUG = 0
-INFO = 1
-WARNING = 2
-ERROR = 3
-
-# Log level names
-LEVEL_NAMES = {
-    DEBUG: "DEBUG",
-    INFO: "INFO",
-    WARNING: "WARNING",
-    ERROR: "ERROR"
+# Log level constants and names (defined with the store)
+DEBUG = log_store.DEBUG
+INFO = log_store.INFO
+WARNING = log_store.WARNING
+ERROR = log_store.ERROR
+LEVEL_NAMES = log_store.LEVEL_NAMES
+
+_LEVEL_VALUES = {
+    'DEBUG': DEBUG,
+    'INFO': INFO,
+    'WARNING': WARNING,
+    'ERROR': ERROR
 }
 
-def log(message, level='INFO'):
+# Log storage: ring buffer of structured records, capacity from preferences
+store = log_store.LogStore()
+search_index = log_index.LogIndex(store)
+
+# Preference state cached by configure(): file logging and the minimum
+# level kept (everything until preferences are available)
+_file_logging = False
+_min_level = DEBUG
+
+# Frames in these modules are skipped when finding who logged a message
+_WRAPPER_MODULES = {__name__, __package__}
+
+def _level_value(level, default=INFO):
+    """Convert a level name or integer to its integer value"""
+    if isinstance(level, str):
+        return _LEVEL_VALUES.get(level.upper(), default)
+    return level
+
+def _caller_module():
+    """Name of the module that called log(), relative to the addon package"""
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_globals.get('__name__') in _WRAPPER_MODULES:
+        frame = frame.f_back
+    if frame is None:
+        return ""
+    name = frame.f_globals.get('__name__', "")
+    return name.partition(".")[2] or name
+
+def log(message, level='INFO', *args):
     """
     Add a message to the log
     
+    The message is stored as a template; it is only formatted (with
+    str.format(*args)) when the viewer, an export or the log file needs the
+    text. Messages below the Log Level preference are dropped before any
+    work is done, so hot paths should pass values as args, not f-strings.
+    
     Args:
-        message: The message to log
+        message: The message to log, or a template for args
         level: Log level ('DEBUG', 'INFO', 'WARNING', 'ERROR') or integer
-    """
-    # Convert string level to integer
-    if isinstance(level, str):
-        level = level.upper()
-        level_int = {
-            'DEBUG': DEBUG,
-            'INFO': INFO,
-            'WARNING': WARNING,
-            'ERROR': ERROR
-        }.get(level, INFO)
-    else:
-        level_int = level
+        *args: Values for the template's {} fields
     
-    # Get current timestamp
-    timestamp = time.time()
-    formatted_time = datetime.datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')
+    Returns:
+        The stored LogRecord, or None if the level is filtered out
+    """
+    level_int = _level_value(level)
+    if level_int < _min_level:
+        return None
     
-    # Format the log entry
-    level_name = LEVEL_NAMES.get(level_int, "INFO")
-    formatted_message = f"[{formatted_time}] [{level_name}] {message}"
+    record = log_store.LogRecord(time.time(), level_int, _caller_module(), message, args)
+    evicted = store.append(record)
+    if evicted is not None:
+        search_index.evict(evicted.seq + 1)
     
-    # Store the log entry
-    log_entries.append(formatted_message)
-    log_timestamps.append(timestamp)
-    log_levels.append(level_int)
+    # Hand off to the background writer, which formats on its own thread
+    if _file_logging:
+        log_writer.write(record)
     
-    # Limit log size
-    max_logs = 1000
-    if len(log_entries) > max_logs:
-        log_entries.pop(0)
-        log_timestamps.pop(0)
-        log_levels.pop(0)
+    return record
+
+def get_records(level=None, count=None):
+    """
+    Get log records at or above a level
     
-    # Write to file if enabled
-    if hasattr(bpy.context, "preferences"):
-        prefs = bpy.context.preferences.addons.get("bigbrain")
-        if prefs and hasattr(prefs.preferences, "log_to_file") and prefs.preferences.log_to_file:
-            write_to_log_file(formatted_message)
+    Args:
+        level: Minimum log level to include (None or 'ALL' for all)
+        count: Maximum number of records, newest kept (None for all)
     
-    return formatted_message
+    Returns:
+        List of LogRecords, oldest first
+    """
+    level_int = None if level is None else _level_value(level, None)
+    if level_int is None:
+        return store.last(count)
+    levels = [value for value in log_store.LEVELS if value >= level_int]
+    return store.last(count, levels)
 
 def get_logs(level=None, count=None):
     """
@@ -86,102 +114,86 @@ def get_logs(level=None, count=None):
     Returns:
         List of log entries
     """
-    if level is None:
-        filtered_logs = log_entries
-    else:
-        # Convert string level to integer
-        if isinstance(level, str):
-            level = level.upper()
-            level_int = {
-                'DEBUG': DEBUG,
-                'INFO': INFO,
-                'WARNING': WARNING,
-                'ERROR': ERROR,
-                'ALL': None
-            }.get(level, None)
-        else:
-            level_int = level
-        
-        if level_int is None:
-            filtered_logs = log_entries
-        else:
-            # Filter by level
-            filtered_logs = [
-                entry for i, entry in enumerate(log_entries)
-                if log_levels[i] >= level_int
-            ]
-    
-    # Limit count
-    if count is not None:
-        filtered_logs = filtered_logs[-count:]
-    
-    return filtered_logs
+    return [record.format() for record in get_records(level, count)]
+
+def search_logs(query, levels=None, since=None):
+    """
+    Search the log
+    
+    Args:
+        query: Words to find; each matches words starting with it
+        levels: Only these levels, e.g. (WARNING, ERROR) (None for all)
+        since: Only entries logged at or after this timestamp
+    
+    Returns:
+        Sequence numbers of the matching records, oldest first
+        (see store.get)
+    """
+    return search_index.search(query, levels, since)
 
 def clear_logs():
     """Clear all log entries"""
-    log_entries.clear()
-    log_timestamps.clear()
-    log_levels.clear()
+    store.clear()
+    search_index.clear()
     log("Logs cleared", 'INFO')
 
-def write_to_log_file(message):
-    """Write a message to the log file"""
-    try:
-        prefs = bpy.context.preferences.addons["bigbrain"].preferences
-        log_location = getattr(prefs, "log_location", "")
-        
-        # Use default location if not specified
-        if not log_location:
-            log_location = os.path.join(bpy.utils.user_resource('SCRIPTS'), "addons", "bigbrain", "logs")
-        
-        # Create directory if it doesn't exist
-        os.makedirs(log_location, exist_ok=True)
-        
-        # Create log filename with date
-        date_str = datetime.datetime.now().strftime('%Y%m%d')
-        log_file = os.path.join(log_location, f"bigbrain_{date_str}.log")
-        
-        # Append to log file
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(message + "\n")
-    except Exception as e:
-        # Don't use log() here to avoid recursion
-        print(f"Error writing to log file: {e}")
-
-def export_logs(filepath):
+def get_log_directory(prefs):
+    """Directory of the daily log files"""
+    log_location = getattr(prefs, "log_location", "")
+    
+    # Use default location if not specified
+    if not log_location:
+        return os.path.join(bpy.utils.user_resource('SCRIPTS'), "addons", "bigbrain", "logs")
+    return bpy.path.abspath(log_location)
+
+def configure(prefs=None):
+    """Apply the log preferences: store capacity and file writer thread"""
+    global _file_logging, _min_level
+    if prefs is None:
+        addon = bpy.context.preferences.addons.get("bigbrain")
+        if addon is None:
+            return
+        prefs = addon.preferences
+    
+    store.set_capacity(prefs.log_capacity)
+    _min_level = _level_value(prefs.log_level)
+    
+    _file_logging = prefs.log_to_file
+    if _file_logging:
+        log_writer.start(get_log_directory(prefs))
+    else:
+        log_writer.stop()
+
+def export_logs(filepath, fmt='TEXT', compress=False):
     """
     Export logs to a file
     
+    Runs the same streaming export as the Export Logs operator, but blocks
+    until it is written.
+    
     Args:
         filepath: Path to save the log file
+        fmt: 'TEXT' or 'JSONL'
+        compress: Write a gzip file
     
     Returns:
         True if successful, False otherwise
     """
-    try:
-        # Create directory if it doesn't exist
-        directory = os.path.dirname(filepath)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-        
-        # Write logs to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"BigBrain Logs - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            for entry in log_entries:
-                f.write(f"{entry}\n")
-        
-        log(f"Logs exported to {filepath}", 'INFO')
+    job = log_export.ExportJob(filepath, fmt, compress, store=store)
+    if job.run():
+        log("Logs exported to {}", 'INFO', filepath)
         return True
-    except Exception as e:
-        log(f"Error exporting logs: {e}", 'ERROR')
-        return False
+    log("Error exporting logs: {}", 'ERROR', job.error)
+    return False
 
 def register():
     """Register logging functionality"""
+    configure()
     log("Logging system initialized", 'INFO')
 
 def unregister():
     """Unregister logging functionality"""
-    pass
\ No newline at end of file
+    global _file_logging
+    # Flushes everything still queued before the file is closed
+    log_writer.stop()
+    _file_logging = False
\ No newline at end of file
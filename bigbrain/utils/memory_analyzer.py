@@ -0,0 +1,262 @@
+# =============================================================================
+# utils/memory_analyzer.py — Per-datablock memory breakdown (estimates)
+# =============================================================================
+
+import bpy
+import re
+import time
+import heapq
+
+MB = 1024 * 1024
+
+# Bytes per element for mesh attribute data types
+ATTRIBUTE_SIZES = {
+    'FLOAT': 4,
+    'INT': 4,
+    'FLOAT_VECTOR': 12,
+    'FLOAT_COLOR': 16,
+    'BYTE_COLOR': 4,
+    'STRING': 8,
+    'BOOLEAN': 1,
+    'FLOAT2': 8,
+    'INT8': 1,
+    'INT32_2D': 8,
+    'QUATERNION': 16,
+    'FLOAT4X4': 64,
+}
+
+# Approximate bytes per particle (state, rotation, velocities, flags)
+PARTICLE_SIZE = 96
+
+# "250 frames in memory (12.5 MB)" style point cache info
+_CACHE_INFO_RE = re.compile(r"\(([\d.]+)\s*(B|KB|MB|GB)\)")
+_CACHE_UNITS = {'B': 1, 'KB': 1024, 'MB': MB, 'GB': 1024 * MB}
+
+# Datablock kinds, mapped to the bpy.data collection they live in
+KINDS = {
+    'MESH': "meshes",
+    'IMAGE': "images",
+    'CACHE': "objects",  # Particle/physics caches are owned by objects
+}
+
+# (kind, name) -> estimated bytes
+_estimates = {}
+
+# Datablocks changed since the last scan, reported by the depsgraph handler
+_dirty = set()
+_full_scan_needed = True
+_collection_sizes = {}
+_last_scan_time = 0.0
+
+# Bumped on every scan; keys the top-consumers cache used by the panel
+_generation = 0
+_top_cache = {}
+
+def estimate_mesh(mesh):
+    """Estimate memory used by a mesh: topology, attributes and shape keys"""
+    verts = len(mesh.vertices)
+    edges = len(mesh.edges)
+    loops = len(mesh.loops)
+    polys = len(mesh.polygons)
+
+    # Positions, edge vertex pairs, corner vertex/edge indices, face offsets
+    size = verts * 12 + edges * 8 + loops * 8 + polys * 4
+
+    domains = {'POINT': verts, 'EDGE': edges, 'FACE': polys, 'CORNER': loops}
+    for attribute in getattr(mesh, "attributes", ()):
+        # Internal (".edge_verts") and position data are counted above
+        if attribute.name.startswith(".") or attribute.name == "position":
+            continue
+        count = domains.get(attribute.domain, 0)
+        size += count * ATTRIBUTE_SIZES.get(attribute.data_type, 4)
+
+    if mesh.shape_keys:
+        size += len(mesh.shape_keys.key_blocks) * verts * 12
+
+    return size
+
+def estimate_image(image):
+    """Estimate memory used by an image's loaded pixel buffer and packed data"""
+    size = 0
+    if image.has_data:
+        width, height = image.size
+        bytes_per_channel = 4 if image.is_float else 1
+        size += width * height * image.channels * bytes_per_channel
+    if image.packed_file:
+        size += image.packed_file.size
+    return size
+
+def _parse_cache_info(info):
+    match = _CACHE_INFO_RE.search(info or "")
+    if not match:
+        return 0
+    return float(match.group(1)) * _CACHE_UNITS[match.group(2)]
+
+def estimate_caches(obj):
+    """Estimate memory used by an object's particle systems and point caches"""
+    size = 0
+    for psys in getattr(obj, "particle_systems", ()):
+        size += len(psys.particles) * PARTICLE_SIZE
+        cache = getattr(psys, "point_cache", None)
+        if cache is not None:
+            size += _parse_cache_info(cache.info)
+
+    # Cloth, soft body and other physics modifiers keep their own caches
+    for modifier in obj.modifiers:
+        cache = getattr(modifier, "point_cache", None)
+        if cache is not None:
+            size += _parse_cache_info(cache.info)
+
+    return size
+
+_ESTIMATORS = {
+    'MESH': estimate_mesh,
+    'IMAGE': estimate_image,
+    'CACHE': estimate_caches,
+}
+
+def _estimate(kind, id_data):
+    try:
+        return _ESTIMATORS[kind](id_data)
+    except (AttributeError, ReferenceError, RuntimeError):
+        return 0
+
+def _current_collection_sizes():
+    return {kind: len(getattr(bpy.data, attr)) for kind, attr in KINDS.items()}
+
+def _full_scan():
+    global _full_scan_needed
+    _estimates.clear()
+    for kind, attr in KINDS.items():
+        for id_data in getattr(bpy.data, attr):
+            size = _estimate(kind, id_data)
+            if size > 0:
+                _estimates[(kind, id_data.name)] = size
+    _dirty.clear()
+    _full_scan_needed = False
+
+def _incremental_scan():
+    global _full_scan_needed
+    dirty = list(_dirty)
+    _dirty.clear()
+    for kind, name in dirty:
+        id_data = getattr(bpy.data, KINDS[kind]).get(name)
+        if id_data is None:
+            # Removed or renamed: rescan everything next time
+            _estimates.pop((kind, name), None)
+            _full_scan_needed = True
+            continue
+        size = _estimate(kind, id_data)
+        if size > 0:
+            _estimates[(kind, name)] = size
+        else:
+            _estimates.pop((kind, name), None)
+
+def scan(full=False):
+    """
+    Refresh the estimates
+
+    Only datablocks reported by the depsgraph since the last scan are
+    re-estimated, unless a full scan is requested or datablocks were added,
+    removed or renamed (detected from collection sizes / missing names).
+
+    Returns:
+        Number of datablocks with an estimate
+    """
+    global _collection_sizes, _last_scan_time, _generation
+
+    sizes = _current_collection_sizes()
+    if full or _full_scan_needed or sizes != _collection_sizes:
+        _full_scan()
+    else:
+        _incremental_scan()
+    _collection_sizes = sizes
+    _last_scan_time = time.time()
+    _generation += 1
+    _top_cache.clear()
+    return len(_estimates)
+
+def get_top_consumers(count=20, kind=None, sort='SIZE'):
+    """
+    Get the largest datablocks
+
+    Args:
+        count: Maximum number of entries
+        kind: 'MESH', 'IMAGE', 'CACHE' or None for all
+        sort: 'SIZE' (largest first), 'NAME' or 'TYPE'
+
+    Returns:
+        List of (kind, name, size_mb)
+    """
+    cache_key = (count, kind, sort)
+    cached = _top_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Always pick the largest first, then order for display
+    items = heapq.nlargest(count, (
+        (k, name, size / MB)
+        for (k, name), size in _estimates.items()
+        if kind is None or k == kind
+    ), key=lambda item: item[2])
+    if sort == 'NAME':
+        items.sort(key=lambda item: item[1].lower())
+    elif sort == 'TYPE':
+        items.sort(key=lambda item: (item[0], -item[2]))
+
+    _top_cache[cache_key] = items
+    return items
+
+def get_collection_totals():
+    """Get the estimated total per datablock kind in MB"""
+    totals = {kind: 0.0 for kind in KINDS}
+    for (kind, _name), size in _estimates.items():
+        totals[kind] += size / MB
+    return totals
+
+def has_results():
+    return bool(_estimates)
+
+def get_last_scan_time():
+    return _last_scan_time
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Queue changed datablocks for the next incremental scan"""
+    if depsgraph is None or _full_scan_needed:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Mesh):
+            if update.is_updated_geometry:
+                _dirty.add(('MESH', id_data.name))
+        elif isinstance(id_data, bpy.types.Object):
+            # Particle and physics caches change with the object's geometry
+            if update.is_updated_geometry:
+                _dirty.add(('CACHE', id_data.name))
+                if id_data.type == 'MESH' and id_data.data is not None:
+                    _dirty.add(('MESH', id_data.data.name))
+        elif isinstance(id_data, bpy.types.Image):
+            _dirty.add(('IMAGE', id_data.name))
+
+@bpy.app.handlers.persistent
+def _on_load_post(*args):
+    """A different file means different datablocks: start over"""
+    global _full_scan_needed
+    _estimates.clear()
+    _dirty.clear()
+    _top_cache.clear()
+    _full_scan_needed = True
+
+def register():
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _on_load_post()
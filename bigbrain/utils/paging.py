@@ -0,0 +1,113 @@
+# =============================================================================
+# utils/paging.py — Swap and page-fault rates with thrash detection
+# =============================================================================
+
+import os
+from . import sampler
+from . import sampler_thread
+
+# Swap-in rate that always counts as thrashing, and how far above its
+# recent baseline a rate must jump to count as a spike
+THRASH_SWAP_IN = 20.0  # MB/s
+SPIKE_MIN_SWAP_IN = 2.0  # MB/s; smaller spikes are noise
+SPIKE_FACTOR = 5.0
+THRASH_FAULTS = 1000.0  # Major faults/s (where the OS counts them)
+# Thrashing is cleared only after this long without a spike
+THRASH_HOLD = 10.0  # seconds
+# Weight of the newest rate in the swap-in baseline
+BASELINE_SMOOTHING = 0.05
+
+_process = None
+_previous = None  # (timestamp, counters)
+_baseline_swap_in = 0.0
+_last_spike_time = 0.0
+
+# Latest evaluation, read by the status bar, UI and pressure engine
+status = {
+    'swap_used': 0.0,  # MB
+    'swap_percent': 0.0,
+    'swap_in_rate': 0.0,  # MB/s
+    'swap_out_rate': 0.0,  # MB/s
+    'fault_rate': 0.0,  # Major page faults/s (0 where not counted)
+    'rss': 0.0,  # MB
+    'vms': 0.0,  # MB
+    'thrashing': False,
+}
+
+def _read_counters(snapshot):
+    """Counters from the sampler thread, or read here on the main thread"""
+    global _process
+    if snapshot.process is not None:
+        return snapshot.process['paging']
+    if _process is None and sampler_thread.is_available():
+        _process = sampler_thread.psutil.Process(os.getpid())
+    return sampler_thread.read_paging(_process)
+
+def _is_spike(swap_in_rate, fault_rate):
+    """fault_rate is None without a hard-fault counter: swap-in rate alone"""
+    if swap_in_rate >= THRASH_SWAP_IN:
+        return True
+    if fault_rate is not None and fault_rate >= THRASH_FAULTS:
+        return True
+    return swap_in_rate >= max(SPIKE_MIN_SWAP_IN, _baseline_swap_in * SPIKE_FACTOR)
+
+def on_snapshot(snapshot):
+    """Sampler listener: turn cumulative counters into rates"""
+    global _previous, _baseline_swap_in, _last_spike_time
+    from .. import utils
+
+    counters = _read_counters(snapshot)
+    now = snapshot.timestamp
+    status.update(
+        swap_used=counters['swap_used'],
+        swap_percent=counters['swap_percent'],
+        rss=counters['rss'],
+        vms=counters['vms']
+    )
+
+    previous = _previous
+    _previous = (now, counters)
+    if previous is None or now <= previous[0]:
+        return
+
+    elapsed = now - previous[0]
+    before = previous[1]
+    # Counters can go backwards (e.g. the sampler thread was toggled)
+    swap_in_rate = max(counters['swap_in'] - before['swap_in'], 0.0) / elapsed
+    swap_out_rate = max(counters['swap_out'] - before['swap_out'], 0.0) / elapsed
+    if counters['major_faults'] is None or before['major_faults'] is None:
+        fault_rate = None
+    else:
+        fault_rate = max(counters['major_faults'] - before['major_faults'], 0) / elapsed
+    status.update(swap_in_rate=swap_in_rate, swap_out_rate=swap_out_rate,
+                  fault_rate=fault_rate or 0.0)
+
+    if _is_spike(swap_in_rate, fault_rate):
+        _last_spike_time = now
+        if not status['thrashing']:
+            status['thrashing'] = True
+            utils.log(f"Swap thrashing: {swap_in_rate:.1f} MB/s swapped in, "
+                      f"{fault_rate or 0.0:.0f} major faults/s (RSS {counters['rss']:.0f} MB, "
+                      f"VMS {counters['vms']:.0f} MB)", 'WARNING')
+    else:
+        # Spikes stay out of the baseline so it tracks normal paging only
+        _baseline_swap_in += BASELINE_SMOOTHING * (swap_in_rate - _baseline_swap_in)
+        if status['thrashing'] and now - _last_spike_time >= THRASH_HOLD:
+            status['thrashing'] = False
+            utils.log("Swap thrashing stopped", 'INFO')
+
+def reset():
+    global _previous, _baseline_swap_in, _last_spike_time
+    _previous = None
+    _baseline_swap_in = 0.0
+    _last_spike_time = 0.0
+    status.update(swap_in_rate=0.0, swap_out_rate=0.0, fault_rate=0.0, thrashing=False)
+
+def register():
+    sampler.add_listener(on_snapshot)
+
+def unregister():
+    global _process
+    sampler.remove_listener(on_snapshot)
+    _process = None
+    reset()
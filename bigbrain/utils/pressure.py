@@ -0,0 +1,214 @@
+# =============================================================================
+# utils/pressure.py — Memory pressure levels and escalating responses
+# =============================================================================
+
+import bpy
+from . import sampler
+from . import undo_budget
+from . import paging
+
+LEVELS = ('NONE', 'SOFT', 'HARD', 'CRITICAL')
+
+# Percentage points usage must fall below a level's threshold to leave it
+HYSTERESIS = 3.0
+# Actions of the current level run again this often while it persists
+REPEAT_INTERVAL = 60.0  # seconds
+TICK_INTERVAL = 1.0  # seconds
+
+# Items for the per-level action preferences (ENUM_FLAG)
+ACTION_ITEMS = [
+    ('FREE_IMAGE_GPU', "Free Image Textures", "Free GPU textures of images (reloaded on next use)"),
+    ('CLEAR_SEQUENCER_CACHE', "Clear Sequencer Cache", "Drop cached Video Sequencer frames"),
+    ('LOWER_UNDO_LIMIT', "Lower Undo Limit", "Halve the undo memory limit so old steps are dropped"),
+    ('PAUSE_GRAPH', "Pause Graph", "Stop drawing the RAM graph until pressure is gone"),
+    ('PURGE_ORPHANS', "Purge Orphans", "Delete datablocks with zero users (not undoable once saved)"),
+]
+
+_level = 0
+_last_action_time = 0.0
+_graph_paused = False
+# User's undo_memory_limit before LOWER_UNDO_LIMIT first lowered it (None
+# while untouched); restored once pressure is gone
+_saved_undo_limit = None
+
+# Latest evaluation, read by the UI
+status = {
+    'level': 'NONE',
+    'percent': 0.0,  # Pressure metric the levels are compared against
+}
+
+def _free_image_gpu():
+    for image in bpy.data.images:
+        if image.bindcode:
+            image.gl_free()
+
+def _clear_sequencer_cache():
+    scene = bpy.context.scene
+    if scene is None or scene.sequence_editor is None:
+        return "no sequencer in the current scene"
+    bpy.ops.sequencer.refresh_all()
+
+def _smart_undo_enabled():
+    try:
+        return bpy.context.preferences.addons["bigbrain"].preferences.smart_undo
+    except KeyError:
+        return False
+
+def _lower_undo_limit():
+    global _saved_undo_limit
+    # The undo budget owns the limit while smart undo is on
+    if _smart_undo_enabled():
+        return "skipped, smart undo manages the limit"
+    edit = bpy.context.preferences.edit
+    current = edit.undo_memory_limit
+    if _saved_undo_limit is None:
+        _saved_undo_limit = current
+    if current == 0:
+        # Unlimited: start from what the undo stack may currently hold
+        current = int(sampler.latest.system_ram['available']) or undo_budget.MIN_UNDO_MEMORY * 4
+    edit.undo_memory_limit = max(current // 2, undo_budget.MIN_UNDO_MEMORY)
+    return f"undo memory limit now {edit.undo_memory_limit} MB"
+
+def _pause_graph():
+    global _graph_paused
+    from ..ui import overlay_draw
+    overlay_draw.set_paused(True)
+    _graph_paused = True
+
+def _purge_orphans():
+    if hasattr(bpy.data, "orphans_purge"):  # Blender 3.2+
+        count = bpy.data.orphans_purge(do_recursive=True)
+    else:
+        count = bpy.data.orphans_purge()
+    return f"{count} datablocks purged"
+
+_ACTIONS = {
+    'FREE_IMAGE_GPU': _free_image_gpu,
+    'CLEAR_SEQUENCER_CACHE': _clear_sequencer_cache,
+    'LOWER_UNDO_LIMIT': _lower_undo_limit,
+    'PAUSE_GRAPH': _pause_graph,
+    'PURGE_ORPHANS': _purge_orphans,
+}
+
+def run_action(name):
+    """Run one response action and log the memory it reclaimed"""
+    from .. import utils
+    ram0, vram0 = sampler.read_memory()
+    try:
+        note = _ACTIONS[name]()
+    except Exception as e:
+        utils.log(f"Pressure action {name} failed: {e}", 'ERROR')
+        return
+    ram, vram = sampler.read_memory()
+    utils.log("Pressure action {}: reclaimed {:.0f} MB RAM, {:.0f} MB VRAM{}", 'INFO',
+              name, ram0 - ram, vram0 - vram, f" ({note})" if note else "")
+
+def _thresholds(prefs):
+    return (0.0, prefs.pressure_soft, prefs.pressure_hard, prefs.pressure_critical)
+
+def _level_actions(prefs, level):
+    return getattr(prefs, f"pressure_{LEVELS[level].lower()}_actions")
+
+def pressure_percent(snapshot, prefs):
+    """
+    Get the pressure metric: system RAM in use in percent, or without psutil
+    Blender's RAM relative to the critical threshold (mapped so reaching the
+    threshold equals the critical level)
+    """
+    if snapshot.system_ram['total'] > 0:
+        return snapshot.system_ram['percent']
+    if prefs.critical_threshold > 0:
+        return snapshot.ram / prefs.critical_threshold * prefs.pressure_critical
+    return 0.0
+
+def _restore_undo_limit():
+    global _saved_undo_limit
+    if _saved_undo_limit is None:
+        return
+    if not _smart_undo_enabled():
+        bpy.context.preferences.edit.undo_memory_limit = _saved_undo_limit
+    _saved_undo_limit = None
+
+def _resume():
+    global _graph_paused
+    if _graph_paused:
+        from ..ui import overlay_draw
+        overlay_draw.set_paused(False)
+        _graph_paused = False
+    _restore_undo_limit()
+
+def update(snapshot, prefs):
+    """Move between pressure levels and run the actions of entered levels"""
+    global _level, _last_action_time
+    from .. import utils
+
+    percent = pressure_percent(snapshot, prefs)
+    thresholds = _thresholds(prefs)
+    status['percent'] = percent
+
+    # Thrashing means the OS already ran out: respond at least at HARD
+    floor = 2 if paging.status['thrashing'] else 0
+    target = floor
+    for level in range(1, len(LEVELS)):
+        if percent >= thresholds[level]:
+            target = level
+
+    if target > _level:
+        # Escalate: run every action of the levels entered, once each
+        actions = set()
+        for level in range(_level + 1, target + 1):
+            actions |= _level_actions(prefs, level)
+        utils.log(f"Memory pressure {LEVELS[target]} ({percent:.0f}%)", 'WARNING')
+        _level = target
+        _last_action_time = snapshot.timestamp
+        for name in sorted(actions):
+            run_action(name)
+    else:
+        # De-escalate only once usage is clearly below the level's threshold
+        previous = _level
+        while _level > floor and percent < thresholds[_level] - HYSTERESIS:
+            _level -= 1
+        if _level < previous:
+            utils.log(f"Memory pressure down to {LEVELS[_level]} ({percent:.0f}%)", 'INFO')
+            if _level == 0:
+                _resume()
+        elif _level > 0 and snapshot.timestamp - _last_action_time >= REPEAT_INTERVAL:
+            _last_action_time = snapshot.timestamp
+            for name in sorted(_level_actions(prefs, _level)):
+                run_action(name)
+
+    status['level'] = LEVELS[_level]
+
+def reset():
+    """Drop back to no pressure and undo reversible actions"""
+    global _level, _last_action_time
+    _level = 0
+    _last_action_time = 0.0
+    _resume()
+    status.update(level='NONE', percent=0.0)
+
+def _tick():
+    try:
+        prefs = bpy.context.preferences.addons["bigbrain"].preferences
+    except KeyError:
+        return TICK_INTERVAL
+    if prefs.pressure_response:
+        # Never runs from draw callbacks: actions may call operators
+        update(sampler.get_snapshot(), prefs)
+    elif _level:
+        reset()
+    return TICK_INTERVAL
+
+def register():
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=TICK_INTERVAL, persistent=True)
+
+def unregister():
+    global _level, _graph_paused
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    _restore_undo_limit()
+    # The overlay is unregistered before utils and clears its own pause
+    _level = 0
+    _graph_paused = False
+    status.update(level='NONE', percent=0.0)
@@ -0,0 +1,156 @@
+# =============================================================================
+# utils/process_tree.py — Memory of Blender plus its child processes
+# =============================================================================
+
+import bpy
+import os
+import time
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+MB = 1024 * 1024
+
+# Walking the tree and reading USS/PSS (smaps on Linux) is far more costly
+# than a plain RSS read, so it runs on its own thread at a slow cadence
+REFRESH_INTERVAL = 5.0  # seconds
+
+# Published totals, swapped by reference like the sampler thread's snapshot
+_latest = None
+
+_thread = None
+_stop_event = threading.Event()
+_stopping = False  # stop() timed out inside a slow walk; thread still alive
+
+def is_available():
+    """True if psutil is installed"""
+    return psutil is not None
+
+def is_running():
+    return _thread is not None and _thread.is_alive()
+
+def _read_process(proc):
+    """(rss, uss, pss) in bytes; uss/pss are None where not readable"""
+    try:
+        info = proc.memory_full_info()
+        return info.rss, getattr(info, "uss", None), getattr(info, "pss", None)
+    except psutil.AccessDenied:
+        return proc.memory_info().rss, None, None
+
+def collect(root):
+    """
+    Sum memory over a process and all of its descendants
+
+    Returns:
+        Dict with rss, uss, pss and total (MB), the metric total is based on
+        ('PSS', 'USS' or 'RSS'), children (count) and children_rss (MB).
+        PSS is preferred since it splits shared pages between processes;
+        summed RSS counts shared libraries once per process.
+    """
+    rss = uss = pss = children_rss = 0
+    has_uss = has_pss = True
+    children = root.children(recursive=True)
+
+    for proc in [root] + children:
+        try:
+            p_rss, p_uss, p_pss = _read_process(proc)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+            # Gone, or protected even from memory_info(): skip just this one
+            continue
+        rss += p_rss
+        if proc is not root:
+            children_rss += p_rss
+        if p_uss is None:
+            has_uss = False
+        else:
+            uss += p_uss
+        if p_pss is None:
+            has_pss = False
+        else:
+            pss += p_pss
+
+    if has_pss:
+        metric, total = 'PSS', pss
+    elif has_uss:
+        metric, total = 'USS', uss
+    else:
+        metric, total = 'RSS', rss
+
+    return {
+        'timestamp': time.time(),
+        'rss': rss / MB,
+        'uss': uss / MB if has_uss else 0.0,
+        'pss': pss / MB if has_pss else 0.0,
+        'total': total / MB,
+        'metric': metric,
+        'children': len(children),
+        'children_rss': children_rss / MB
+    }
+
+def _run():
+    global _latest
+    root = psutil.Process(os.getpid())
+    while True:
+        try:
+            totals = collect(root)
+        except Exception as e:
+            print(f"[BigBrain] Process tree error: {e}")
+        else:
+            # A walk that outlived stop() must not republish its totals
+            if _stop_event.is_set():
+                break
+            _latest = totals
+        if _stop_event.wait(REFRESH_INTERVAL):
+            break
+
+def get_totals():
+    """Get the latest tree totals (None until the first walk finished)"""
+    return _latest
+
+def start():
+    """Start refreshing the totals (no-op without psutil)"""
+    global _thread, _stopping
+    if psutil is None:
+        return False
+    if is_running() and not _stopping:
+        return True
+    # Clearing the event under a walker that is still stopping would keep it
+    # running next to the new one
+    if is_running():
+        _thread.join(timeout=5.0)
+        if _thread.is_alive():
+            print("[BigBrain] Process tree walker is still stopping; not restarted")
+            return False
+    _stopping = False
+    _stop_event.clear()
+    _thread = threading.Thread(target=_run, name="BigBrainProcessTree")
+    _thread.daemon = True
+    _thread.start()
+    return True
+
+def stop():
+    """Stop refreshing and drop the published totals"""
+    global _thread, _latest, _stopping
+    _stop_event.set()
+    if _thread is not None:
+        _thread.join(timeout=1.0)
+        # Keep the handle until the walk in progress has finished
+        if _thread.is_alive():
+            _stopping = True
+        else:
+            _thread = None
+            _stopping = False
+    _latest = None
+
+def register():
+    try:
+        if bpy.context.preferences.addons["bigbrain"].preferences.show_process_tree:
+            start()
+    except (KeyError, AttributeError):
+        pass
+
+def unregister():
+    stop()
@@ -0,0 +1,286 @@
+# =============================================================================
+# utils/profiler.py — Per-operator wall time and memory profiler
+# =============================================================================
+
+import bpy
+import csv
+import math
+import time
+from . import sampler
+from .ring_buffer import RingBuffer
+
+# Samples kept per operator and per field
+SAMPLES_PER_OPERATOR = 512
+
+# Depsgraph updates further apart than this start a new measurement window
+WINDOW_GAP = 0.5  # seconds
+# Windows never run longer than this (e.g. during animation playback)
+MAX_WINDOW = 30.0  # seconds
+
+# Operators whose RAM delta reaches this are logged as they happen
+LOG_RAM_DELTA = 100.0  # MB
+
+class OperatorStats:
+    """Compact per-operator records: one ring buffer per field"""
+    __slots__ = ("name", "calls", "wall_ms", "ram_delta", "vram_delta")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall_ms = RingBuffer(SAMPLES_PER_OPERATOR)
+        self.ram_delta = RingBuffer(SAMPLES_PER_OPERATOR)
+        self.vram_delta = RingBuffer(SAMPLES_PER_OPERATOR)
+
+    def add(self, wall_ms, ram_delta, vram_delta):
+        self.calls += 1
+        self.wall_ms.append(wall_ms)
+        self.ram_delta.append(ram_delta)
+        self.vram_delta.append(vram_delta)
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an unsorted list (0.0 if empty)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # Smallest value with at least fraction of the values at or below it
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+# bl_idname -> OperatorStats
+stats = {}
+
+# Open measurement window: (start perf time, ram, vram) or None
+_window = None
+_window_last = 0.0  # perf time of the last depsgraph update in the window
+_undo_window = None
+
+_last_operator = None
+_enabled = False
+
+# Bumped whenever stats change; keys the ranking cache used by the panel
+_version = 0
+_ranking_cache = {}
+
+def poll_new_operators(last_seen):
+    """
+    Find operators registered in window_manager.operators since last_seen
+
+    Args:
+        last_seen: as_pointer() of the newest operator seen before (or None)
+
+    Returns:
+        (list of new operators oldest first, pointer of the newest operator)
+    """
+    try:
+        operators = bpy.context.window_manager.operators
+    except AttributeError:
+        return [], last_seen
+    if not len(operators):
+        return [], last_seen
+
+    newest = operators[-1].as_pointer()
+    if newest == last_seen:
+        return [], last_seen
+
+    # Walk back to the last operator already seen
+    found = []
+    for op in reversed(operators):
+        if op.as_pointer() == last_seen:
+            break
+        found.append(op)
+    found.reverse()
+    return found, newest
+
+def _get_entry(name):
+    global _version
+    _version += 1
+    entry = stats.get(name)
+    if entry is None:
+        entry = stats[name] = OperatorStats(name)
+    return entry
+
+def _record(name, wall_ms, ram_delta, vram_delta):
+    _get_entry(name).add(wall_ms, ram_delta, vram_delta)
+
+    if abs(ram_delta) >= LOG_RAM_DELTA:
+        from .. import utils
+        utils.log("Operator {}: {:.0f} ms, RAM {:+.0f} MB, VRAM {:+.0f} MB", 'INFO',
+                  name, wall_ms, ram_delta, vram_delta)
+
+def _close_window(operators):
+    """Attribute the open window to the newest of the given operators"""
+    global _window
+    start, ram0, vram0 = _window
+    _window = None
+    ram, vram = sampler.read_memory()
+    wall_ms = (_window_last - start) * 1000.0
+    _record(operators[-1].bl_idname, wall_ms, ram - ram0, vram - vram0)
+
+def _check_operators():
+    global _last_operator
+    operators, _last_operator = poll_new_operators(_last_operator)
+    if not operators:
+        return
+    if _window is not None:
+        _close_window(operators)
+    else:
+        # Operator that caused no depsgraph update: nothing was measured,
+        # count the call without skewing the percentiles
+        _get_entry(operators[-1].bl_idname).calls += 1
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update_pre(*args):
+    global _window, _window_last
+    now = time.perf_counter()
+    if _window is not None and (now - _window_last > WINDOW_GAP or now - _window[0] > MAX_WINDOW):
+        _window = None
+    if _window is None:
+        ram, vram = sampler.read_memory()
+        _window = (now, ram, vram)
+        _window_last = now
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update_post(*args):
+    global _window_last
+    if _window is None:
+        return
+    _window_last = time.perf_counter()
+    _check_operators()
+
+def _make_undo_handlers(name):
+    @bpy.app.handlers.persistent
+    def _pre(*args):
+        global _undo_window
+        ram, vram = sampler.read_memory()
+        _undo_window = (time.perf_counter(), ram, vram)
+
+    @bpy.app.handlers.persistent
+    def _post(*args):
+        global _undo_window
+        if _undo_window is None:
+            return
+        start, ram0, vram0 = _undo_window
+        _undo_window = None
+        ram, vram = sampler.read_memory()
+        _record(name, (time.perf_counter() - start) * 1000.0, ram - ram0, vram - vram0)
+
+    return _pre, _post
+
+_undo_pre, _undo_post = _make_undo_handlers("UNDO")
+_redo_pre, _redo_post = _make_undo_handlers("REDO")
+
+_HANDLERS = (
+    ("depsgraph_update_pre", _on_depsgraph_update_pre),
+    ("depsgraph_update_post", _on_depsgraph_update_post),
+    ("undo_pre", _undo_pre),
+    ("undo_post", _undo_post),
+    ("redo_pre", _redo_pre),
+    ("redo_post", _redo_post),
+)
+
+def on_snapshot(snapshot):
+    """Sampler listener: catch operators that never touched the depsgraph"""
+    if _enabled and _window is None:
+        _check_operators()
+
+def get_ranking(sort='TIME', count=10):
+    """
+    Get the most expensive operators
+
+    Args:
+        sort: 'TIME' (p95 wall time), 'RAM' (p95 RAM delta) or 'CALLS'
+        count: Maximum number of rows
+
+    Returns:
+        List of dicts with name, calls, time_p50, time_p95, ram_p50, ram_p95,
+        vram_p95 (ms / MB)
+    """
+    cache_key = (_version, sort, count)
+    cached = _ranking_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    rows = []
+    for entry in stats.values():
+        wall = entry.wall_ms.to_list()
+        ram = entry.ram_delta.to_list()
+        rows.append({
+            'name': entry.name,
+            'calls': entry.calls,
+            'time_p50': percentile(wall, 0.5),
+            'time_p95': percentile(wall, 0.95),
+            'ram_p50': percentile(ram, 0.5),
+            'ram_p95': percentile(ram, 0.95),
+            'vram_p95': percentile(entry.vram_delta.to_list(), 0.95),
+        })
+
+    key = {'TIME': 'time_p95', 'RAM': 'ram_p95', 'CALLS': 'calls'}.get(sort, 'time_p95')
+    rows.sort(key=lambda row: row[key], reverse=True)
+
+    _ranking_cache.clear()
+    _ranking_cache[cache_key] = rows[:count]
+    return _ranking_cache[cache_key]
+
+def export_csv(filepath):
+    """
+    Export per-operator statistics to a CSV file
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from .. import utils
+    fields = ['name', 'calls', 'time_p50', 'time_p95', 'ram_p50', 'ram_p95', 'vram_p95']
+    try:
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for row in get_ranking(count=max(len(stats), 1)):
+                writer.writerow(row)
+        utils.log(f"Operator profile exported to {filepath}", 'INFO')
+        return True
+    except Exception as e:
+        utils.log(f"Error exporting operator profile: {e}", 'ERROR')
+        return False
+
+def clear():
+    """Drop all recorded statistics"""
+    global _window, _undo_window, _version
+    stats.clear()
+    _version += 1
+    _window = None
+    _undo_window = None
+
+def start():
+    """Install the profiling handlers"""
+    global _enabled, _last_operator
+    # Operators that ran before profiling started are not ours to attribute
+    _, _last_operator = poll_new_operators(None)
+    for name, handler in _HANDLERS:
+        handler_list = getattr(bpy.app.handlers, name)
+        if handler not in handler_list:
+            handler_list.append(handler)
+    _enabled = True
+
+def stop():
+    """Remove the profiling handlers (statistics are kept)"""
+    global _enabled, _window, _undo_window
+    for name, handler in _HANDLERS:
+        handler_list = getattr(bpy.app.handlers, name)
+        if handler in handler_list:
+            handler_list.remove(handler)
+    _enabled = False
+    _window = None
+    _undo_window = None
+
+def register():
+    sampler.add_listener(on_snapshot)
+    try:
+        prefs = bpy.context.preferences.addons["bigbrain"].preferences
+        if prefs.enable_profiler:
+            start()
+    except (KeyError, AttributeError):
+        pass
+
+def unregister():
+    sampler.remove_listener(on_snapshot)
+    stop()
@@ -5,14 +5,18 @@
 import bpy
 import time
 import threading
-import psutil
+from . import sampler
+from . import sampler_thread
+from . import paging
+from . import process_tree
+from .history import TieredHistory
 from ..i18n import get_text as _
 
-# RAM history for graph
-ram_history = []
-vram_history = []
+# RAM history for graph (shared with ui/overlay_draw): raw samples plus
+# minute and hour rollups, bounded regardless of session length
+ram_history = TieredHistory()
+vram_history = TieredHistory()
 last_update_time = 0
-MAX_HISTORY_POINTS = 100
 
 # Timer for status updates
 _timer = None
@@ -21,47 +25,107 @@ _timer = None
 _critical_warning_shown = False
 _last_warning_time = 0
 
+# Status text cache: last (displayed values, text) per display mode, and
+# the text currently pushed to the status bar
+_status_cache = {}
+_pushed_text = None
+
+# Adaptive sampling state
+VOLATILITY_REF = 5.0  # MB/s of change that halves the base interval
+FLAT_RATE = 0.5  # MB/s below which usage counts as flat
+IDLE_SECONDS = 30.0  # No depsgraph updates for this long = idle
+BACKOFF = 1.5  # Interval growth per flat tick
+CRITICAL_PROXIMITY = 0.9  # Fraction of critical_threshold that forces fast sampling
+
+_current_interval = 1.0
+_last_ram = None
+_last_sample_time = 0.0
+_volatility = 0.0  # Smoothed |dRAM/dt| in MB/s
+_last_activity_time = 0.0
+
 def get_ram_usage():
     """Get current RAM usage in MB"""
-    stats = bpy.app.memory_statistics()
-    return stats.get("mem_in_use", 0) / (1024 * 1024)
+    return sampler.get_snapshot().ram
 
 def get_vram_usage():
     """Get current VRAM usage in MB if available"""
-    stats = bpy.app.memory_statistics()
-    
-    # Blender 4.0+ changed the key for GPU memory
-    if bpy.app.version >= (4, 0, 0):
-        vram = stats.get("gpu_memory_in_use", 0)
-    else:
-        vram = stats.get("gpu_mem_in_use", 0)
-        
-    if vram > 0:
-        return vram / (1024 * 1024)
-    return 0
+    return sampler.get_snapshot().vram
 
 def get_system_ram():
     """Get system RAM info using psutil"""
-    try:
-        import psutil
-        mem = psutil.virtual_memory()
-        return {
-            'total': mem.total / (1024 * 1024),  # Total RAM in MB
-            'available': mem.available / (1024 * 1024),  # Available RAM in MB
-            'used': mem.used / (1024 * 1024),  # Used RAM in MB
-            'percent': mem.percent  # Percentage used
-        }
-    except ImportError:
-        return {
-            'total': 0,
-            'available': 0,
-            'used': 0,
-            'percent': 0
-        }
+    return sampler.get_snapshot().system_ram
+
+def get_paging_stats():
+    """Get swap usage, swap/fault rates, RSS vs VMS and the thrashing flag"""
+    return paging.status
 
 def get_fps():
     """Get current FPS"""
-    return bpy.context.scene.render.fps / bpy.context.scene.render.fps_base
+    return sampler.get_snapshot().fps
+
+def record_history(snapshot):
+    """Sampler listener: append each new snapshot to the history buffers"""
+    global last_update_time
+    last_update_time = snapshot.timestamp
+    ram_history.append(snapshot.timestamp, snapshot.ram)
+    vram_history.append(snapshot.timestamp, snapshot.vram)
+
+def reset_status_cache():
+    """Forget the pushed status text so the next tick pushes it again"""
+    global _pushed_text
+    _status_cache.clear()
+    _pushed_text = None
+
+@bpy.app.handlers.persistent
+def _on_load_post(*args):
+    """A newly loaded file brings a fresh window manager with an empty status bar"""
+    reset_status_cache()
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Mark user activity for the adaptive scheduler (cheap: one assignment)"""
+    global _last_activity_time
+    _last_activity_time = time.time()
+
+def next_sample_interval(snapshot, prefs):
+    """
+    Pick the delay before the next sample
+
+    Samples at the minimum interval while memory moves quickly or nears the
+    critical threshold, and backs off toward the maximum while usage is flat
+    and Blender is idle.
+    """
+    global _current_interval, _last_ram, _last_sample_time, _volatility
+    
+    if not prefs.adaptive_sampling:
+        _current_interval = prefs.status_delay
+        return _current_interval
+    
+    low = prefs.min_sample_interval
+    high = max(prefs.max_sample_interval, low)
+    now = snapshot.timestamp
+    
+    # Smoothed rate of change (MB/s)
+    if _last_ram is not None and now > _last_sample_time:
+        rate = abs(snapshot.ram - _last_ram) / (now - _last_sample_time)
+        _volatility = 0.5 * _volatility + 0.5 * rate
+    _last_ram = snapshot.ram
+    _last_sample_time = now
+    
+    near_critical = (prefs.critical_threshold > 0 and
+                     snapshot.ram >= prefs.critical_threshold * CRITICAL_PROXIMITY)
+    idle = now - _last_activity_time > IDLE_SECONDS
+    
+    if near_critical:
+        interval = low
+    elif _volatility < FLAT_RATE:
+        # Flat usage: back off, straight to the maximum when idle
+        interval = high if idle else _current_interval * BACKOFF
+    else:
+        interval = prefs.status_delay / (1.0 + _volatility / VOLATILITY_REF)
+    
+    _current_interval = min(max(interval, low), high)
+    return _current_interval
 
 def format_ram(ram_mb):
     """Format RAM value for display"""
@@ -70,8 +134,96 @@ def format_ram(ram_mb):
     else:
         return f"{ram_mb:.0f} MB"
 
+def quantize_ram(ram_mb):
+    """Round a RAM value to the precision format_ram() displays"""
+    if ram_mb > 1024:
+        return (1, round(ram_mb / 1024, 2))
+    return (0, round(ram_mb))
+
+def format_status_text(snapshot, prefs):
+    """
+    Build the status bar text for a snapshot
+
+    Values are quantized to display precision first; if none of them changed
+    since the last call in the same display mode, the cached string is
+    returned without formatting anything.
+    """
+    mode = 'COMPACT' if prefs.compact_overlay else 'DETAILED'
+    fps = round(snapshot.fps, 1) if prefs.show_fps else None
+    vram = quantize_ram(snapshot.vram) if prefs.show_vram else None
+    thrashing = paging.status['thrashing']
+    tree = process_tree.get_totals() if prefs.show_process_tree else None
+    tree_total = quantize_ram(tree['total']) if tree is not None else None
+    
+    if mode == 'COMPACT':
+        key = (quantize_ram(snapshot.ram), fps, vram, thrashing, tree_total)
+    else:
+        sys_ram = snapshot.system_ram
+        percent = sys_ram['percent'] if sys_ram['total'] > 0 else None
+        rss = None
+        if snapshot.process is not None:
+            rss = quantize_ram(snapshot.process['rss_peak'])
+        tree_detail = (tree['children'], tree['metric']) if tree is not None else None
+        key = (quantize_ram(snapshot.ram), percent, rss, fps, vram, thrashing, tree_total,
+               tree_detail)
+    
+    cached = _status_cache.get(mode)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    # Format text based on preferences
+    if prefs.compact_overlay:
+        text = f"RAM: {format_ram(snapshot.ram)}"
+        
+        if tree is not None:
+            text = f"{text} | Blender+children: {format_ram(tree['total'])}"
+        
+        # Add FPS if enabled
+        if prefs.show_fps:
+            text = f"FPS: {snapshot.fps:.1f} | {text}"
+        
+        # Add VRAM if enabled and available
+        if prefs.show_vram:
+            vram = snapshot.vram
+            if vram > 0:
+                text = f"{text} | VRAM: {format_ram(vram)}"
+    else:
+        text = f"BigBrain | RAM Usage: {format_ram(snapshot.ram)}"
+        
+        # Add system RAM if available
+        sys_ram = snapshot.system_ram
+        if sys_ram['total'] > 0:
+            text = f"{text} | System: {sys_ram['percent']}% used"
+        
+        # Add process RSS (peak since last tick) from the sampler thread
+        if snapshot.process is not None:
+            text = f"{text} | RSS: {format_ram(snapshot.process['rss_peak'])}"
+        
+        # Add the whole process tree (render/bake subprocesses, helpers)
+        if tree is not None:
+            text = (f"{text} | Blender + {tree['children']} children: "
+                    f"{format_ram(tree['total'])} {tree['metric']}")
+        
+        # Add FPS if enabled
+        if prefs.show_fps:
+            text = f"{text} | FPS: {snapshot.fps:.1f}"
+        
+        # Add VRAM if enabled and available
+        if prefs.show_vram:
+            vram = snapshot.vram
+            if vram > 0:
+                text = f"{text} | VRAM: {format_ram(vram)}"
+    
+    # Swapping hurts long before Blender's own usage looks alarming
+    if thrashing:
+        text = f"{text} | SWAP THRASHING"
+    
+    _status_cache[mode] = (key, text)
+    return text
+
 def update_status_text():
     """Update status bar text with RAM usage"""
+    global _pushed_text
     try:
         # Get preferences
         prefs = bpy.context.preferences.addons["bigbrain"].preferences
@@ -80,50 +232,25 @@ def update_status_text():
         if not prefs.show_overlay:
             return 1.0
         
-        # Get RAM usage
-        ram = get_ram_usage()
+        # Take this tick's snapshot, shared with the header and graph
+        snapshot = sampler.sample()
+        ram = snapshot.ram
         
-        # Format text based on preferences
-        if prefs.compact_overlay:
-            text = f"RAM: {format_ram(ram)}"
-            
-            # Add FPS if enabled
-            if prefs.show_fps:
-                fps = get_fps()
-                text = f"FPS: {fps:.1f} | {text}"
-            
-            # Add VRAM if enabled and available
-            if prefs.show_vram:
-                vram = get_vram_usage()
-                if vram > 0:
-                    text = f"{text} | VRAM: {format_ram(vram)}"
-        else:
-            text = f"BigBrain | RAM Usage: {format_ram(ram)}"
-            
-            # Add system RAM if available
-            sys_ram = get_system_ram()
-            if sys_ram['total'] > 0:
-                text = f"{text} | System: {sys_ram['percent']}% used"
-            
-            # Add FPS if enabled
-            if prefs.show_fps:
-                fps = get_fps()
-                text = f"{text} | FPS: {fps:.1f}"
-            
-            # Add VRAM if enabled and available
-            if prefs.show_vram:
-                vram = get_vram_usage()
-                if vram > 0:
-                    text = f"{text} | VRAM: {format_ram(vram)}"
+        # Schedule the next tick; lazy readers follow the same cadence
+        interval = next_sample_interval(snapshot, prefs)
+        sampler.sample_interval = interval
         
-        # Set status text
-        bpy.context.window_manager.status_text_set(text=text)
+        # Only push (and redraw the status bar) when the visible text changed
+        text = format_status_text(snapshot, prefs)
+        if text != _pushed_text:
+            bpy.context.window_manager.status_text_set(text=text)
+            _pushed_text = text
         
         # Check for critical RAM usage
         check_critical_ram(ram, prefs)
         
         # Return delay for next update
-        return prefs.status_delay
+        return interval
     
     except Exception as e:
         print(f"[BigBrain] Error updating status: {e}")
@@ -146,7 +273,6 @@ def check_critical_ram(ram, prefs):
             _last_warning_time = current_time
             
             # Show warning
-            message = f"RAM usage is critical: {format_ram(ram)} > {format_ram(prefs.critical_threshold)}"
             bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
             
             # Play sound if enabled
@@ -158,7 +284,8 @@ def check_critical_ram(ram, prefs):
             
             # Log warning
             from .. import utils
-            utils.log(message, 'WARNING')
+            utils.log("RAM usage is critical: {} > {}", 'WARNING',
+                      format_ram(ram), format_ram(prefs.critical_threshold))
     else:
         _critical_warning_shown = False
 
@@ -166,36 +293,61 @@ def start_ram_status():
     """Start RAM status updates"""
     global _timer
     
+    # No status bar without a UI; headless renders sample per frame instead
+    if bpy.app.background:
+        return
+    
     # Stop existing timer if running
     stop_ram_status()
     
-    # Start new timer
-    _timer = bpy.app.timers.register(
+    # Start new timer (register() returns None, so keep the function itself)
+    bpy.app.timers.register(
         update_status_text,
         first_interval=0.1,
         persistent=True
     )
+    _timer = update_status_text
 
 def stop_ram_status():
     """Stop RAM status updates"""
     global _timer
     
     # Unregister timer if running
-    if _timer and _timer in bpy.app.timers.timers():
-        bpy.app.timers.unregister(_timer)
+    if bpy.app.timers.is_registered(update_status_text):
+        bpy.app.timers.unregister(update_status_text)
     
     _timer = None
     
     # Clear status text
+    reset_status_cache()
     try:
         bpy.context.window_manager.status_text_set(text="")
     except:
         pass
 
+def update_sampler_thread(prefs):
+    """Start, stop or retune the background sampler thread from preferences"""
+    if prefs.use_sampler_thread:
+        if not sampler_thread.start(prefs.sampler_rate):
+            from .. import utils
+            utils.log("psutil not available, background sampling disabled", 'WARNING')
+    else:
+        sampler_thread.stop()
+
 def register():
+    global _last_activity_time
+    sampler.add_listener(record_history)
+    
+    _last_activity_time = time.time()
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    
     # Start RAM status if enabled in preferences
     try:
         prefs = bpy.context.preferences.addons["bigbrain"].preferences
+        update_sampler_thread(prefs)
         if prefs.show_overlay:
             start_ram_status()
     except:
@@ -203,4 +355,10 @@ def register():
         pass
 
 def unregister():
-    stop_ram_status()
\ No newline at end of file
+    stop_ram_status()
+    sampler_thread.stop()
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    sampler.remove_listener(record_history)
\ No newline at end of file
@@ -0,0 +1,255 @@
+# =============================================================================
+# utils/recorder.py — Append-only binary metrics recorder and mmap reader
+# =============================================================================
+
+import bpy
+import os
+import time
+import queue
+import struct
+import datetime
+import threading
+import numpy as np
+from . import sampler
+from . import paging
+from . import process_tree
+
+# File layout: a fixed-size header followed by fixed-size little-endian
+# records (float64 timestamp + one float32 per field). A crash can only
+# leave a partial last record, which the reader ignores.
+MAGIC = b"BBRC"
+FORMAT_VERSION = 1
+HEADER_SIZE = 256
+FILE_EXTENSION = ".bbrec"
+
+FIELDS = (
+    "ram",  # Blender guarded allocator (MB)
+    "vram",  # MB
+    "system_percent",  # System RAM in use (%)
+    "rss",  # Process resident size (MB)
+    "tree_total",  # Blender + children (MB, 0 if not tracked)
+    "swap_used",  # MB
+    "swap_in_rate",  # MB/s
+    "fault_rate",  # Major faults/s
+    "fps",
+)
+
+_RECORD = struct.Struct("<d" + "f" * len(FIELDS))
+_HEADER = struct.Struct("<4sHHH")  # magic, version, field count, record size
+
+FSYNC_INTERVAL = 10.0  # seconds
+# Seconds between timer-driven samples, so recording goes on when nothing
+# else (overlay, header, pressure engine) asks for snapshots
+RECORD_INTERVAL = 1.0
+
+_file = None
+_filepath = None
+
+# Records are packed on the main thread and written (and fsynced) by a
+# writer thread, so no disk I/O runs in timers or draw callbacks
+_queue = queue.SimpleQueue()
+_thread = None
+_error = None  # OSError from the writer thread, reported by the timer
+_STOP = object()
+
+def get_default_directory():
+    return os.path.join(bpy.utils.user_resource('SCRIPTS'), "addons", "bigbrain", "recordings")
+
+def _write_header(f, fields):
+    names = ",".join(fields).encode("ascii")
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(fields), _RECORD.size) + names
+    if len(header) > HEADER_SIZE:
+        raise ValueError("Too many fields for the recording header")
+    f.write(header.ljust(HEADER_SIZE, b"\0"))
+
+def _create_file(directory):
+    """
+    Create a new, empty recording file
+
+    Restarts within one second (Reload Scripts, preference edits) get a
+    counter suffix; an existing recording is never appended to, since a
+    second header would misalign every record after it.
+    """
+    stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    suffix = ""
+    for counter in range(1, 1000):
+        filepath = os.path.join(directory, f"bigbrain_metrics_{stamp}{suffix}{FILE_EXTENSION}")
+        try:
+            return open(filepath, 'xb'), filepath
+        except FileExistsError:
+            suffix = f"_{counter}"
+    raise FileExistsError(f"No free recording file name in {directory}")
+
+def _snapshot_values(snapshot):
+    tree = process_tree.get_totals()
+    status = paging.status
+    return (
+        snapshot.ram,
+        snapshot.vram,
+        snapshot.system_ram['percent'],
+        status['rss'],
+        tree['total'] if tree is not None else 0.0,
+        status['swap_used'],
+        status['swap_in_rate'],
+        status['fault_rate'],
+        snapshot.fps,
+    )
+
+def on_snapshot(snapshot):
+    """Sampler listener: queue one record per snapshot (no I/O here)"""
+    if _file is not None:
+        _queue.put(_RECORD.pack(snapshot.timestamp, *_snapshot_values(snapshot)))
+
+def _run(f):
+    """Writer thread: append queued records, fsync every FSYNC_INTERVAL"""
+    global _error
+    last_fsync = time.monotonic()
+    stopping = False
+    try:
+        while not stopping:
+            timeout = max(FSYNC_INTERVAL - (time.monotonic() - last_fsync), 0.01)
+            try:
+                items = [_queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            # Take everything else already queued in the same write
+            while not _queue.empty():
+                items.append(_queue.get_nowait())
+            stopping = _STOP in items
+            records = [item for item in items if item is not _STOP]
+            if records:
+                f.write(b"".join(records))
+            if stopping or time.monotonic() - last_fsync >= FSYNC_INTERVAL:
+                f.flush()
+                os.fsync(f.fileno())
+                last_fsync = time.monotonic()
+    except OSError as e:
+        _error = e
+    finally:
+        try:
+            f.close()
+        except OSError:
+            pass
+
+def _tick():
+    """Keep snapshots (and so records) coming; report writer errors"""
+    if _file is None:
+        return None
+    if _error is not None:
+        from .. import utils
+        utils.log(f"Metrics recording stopped: {_error}", 'ERROR')
+        stop()
+        return None
+    sampler.get_snapshot()
+    return RECORD_INTERVAL
+
+def is_recording():
+    return _file is not None
+
+def get_filepath():
+    """Path of the recording being written (None if not recording)"""
+    return _filepath
+
+def start(directory=""):
+    """
+    Start a new recording file for this session
+
+    Returns:
+        Path of the recording, or None if it could not be created
+    """
+    global _file, _filepath, _thread, _error
+    from .. import utils
+
+    if _file is not None:
+        return _filepath
+    # A previous writer still finishing would share the queue
+    if _thread is not None:
+        _thread.join(timeout=5.0)
+        if _thread.is_alive():
+            utils.log("Could not start metrics recording: previous recording still closing", 'ERROR')
+            return None
+
+    directory = bpy.path.abspath(directory) if directory else get_default_directory()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        f, filepath = _create_file(directory)
+        _write_header(f, FIELDS)
+    except OSError as e:
+        utils.log(f"Could not start metrics recording: {e}", 'ERROR')
+        return None
+
+    # Records queued after the previous writer stopped
+    while not _queue.empty():
+        _queue.get_nowait()
+    _error = None
+    _file = f
+    _filepath = filepath
+    _thread = threading.Thread(target=_run, args=(f,), name="BigBrainRecorder")
+    _thread.daemon = True
+    _thread.start()
+
+    sampler.add_listener(on_snapshot)
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=RECORD_INTERVAL, persistent=True)
+    utils.log(f"Recording metrics to {filepath}", 'INFO')
+    return filepath
+
+def stop():
+    """Write what is queued, fsync and close the current recording"""
+    global _file, _filepath, _thread
+    sampler.remove_listener(on_snapshot)
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    if _file is None:
+        return
+    _file = None
+    _filepath = None
+    if _thread is not None:
+        _queue.put(_STOP)
+        _thread.join(timeout=5.0)
+        if _thread.is_alive():
+            # Kept so start() waits for it instead of running two writers
+            print("[BigBrain] Metrics recorder did not stop in time")
+            return
+    _thread = None
+
+def read_recording(filepath):
+    """
+    Map a recording into memory without reading it
+
+    Returns:
+        NumPy structured array (np.memmap) with a 'timestamp' field plus one
+        field per recorded metric; rec['ram'] etc. are views, not copies.
+        Raises ValueError for files that are not BigBrain recordings.
+    """
+    with open(filepath, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError("Truncated recording header")
+    magic, version, count, record_size = _HEADER.unpack_from(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a BigBrain metrics recording")
+
+    names = header[_HEADER.size:].rstrip(b"\0").decode("ascii").split(",")
+    if len(names) != count:
+        raise ValueError("Corrupt recording header")
+    dtype = np.dtype([("timestamp", "<f8")] + [(name, "<f4") for name in names])
+    if dtype.itemsize != record_size:
+        raise ValueError("Record size does not match the header")
+
+    # A partial trailing record (crash mid-write) is left out
+    records = (os.path.getsize(filepath) - HEADER_SIZE) // record_size
+    if records <= 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(filepath, dtype=dtype, mode='r', offset=HEADER_SIZE, shape=(records,))
+
+def register():
+    try:
+        prefs = bpy.context.preferences.addons["bigbrain"].preferences
+        if prefs.record_metrics:
+            start(prefs.recording_location)
+    except (KeyError, AttributeError):
+        pass
+
+def unregister():
+    stop()
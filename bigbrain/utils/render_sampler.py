@@ -0,0 +1,108 @@
+# =============================================================================
+# utils/render_sampler.py — High-frequency memory sampling during renders
+# =============================================================================
+
+import os
+import threading
+from . import sampler
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+MB = 1024 * 1024
+
+# Renders block the main thread for seconds to minutes per frame, so peaks
+# are caught by a thread polling between render_pre and render_post
+SAMPLE_RATE = 50.0  # Hz
+
+class FrameAccumulator:
+    """Running peak/average for one frame, filled by the sampling thread"""
+    __slots__ = ("samples", "mem_sum", "mem_peak", "rss_peak")
+
+    def __init__(self):
+        self.samples = 0
+        self.mem_sum = 0.0
+        self.mem_peak = 0.0
+        self.rss_peak = 0.0
+
+    @property
+    def mem_avg(self):
+        return self.mem_sum / self.samples if self.samples else 0.0
+
+# Accumulator of the frame being rendered; swapped by reference, so the
+# thread never needs a lock (a late sample lands in a finished frame at worst)
+_frame = None
+
+_thread = None
+_stop_event = threading.Event()
+
+def _run(read_guarded):
+    process = psutil.Process(os.getpid()) if psutil is not None else None
+    interval = 1.0 / SAMPLE_RATE
+    while not _stop_event.wait(interval):
+        frame = _frame
+        if frame is None:
+            continue
+        try:
+            # memory_statistics() only reads the allocator's atomic counters,
+            # but is still a bpy call: only used while the UI is not running
+            mem = sampler.read_memory()[0] if read_guarded else 0.0
+            rss = process.memory_info().rss / MB if process is not None else 0.0
+        except Exception:
+            continue
+        frame.samples += 1
+        frame.mem_sum += mem
+        if mem > frame.mem_peak:
+            frame.mem_peak = mem
+        if rss > frame.rss_peak:
+            frame.rss_peak = rss
+
+def begin_frame():
+    """Start accumulating a new frame"""
+    global _frame
+    _frame = FrameAccumulator()
+
+def end_frame():
+    """
+    Stop accumulating
+
+    Returns:
+        The frame's FrameAccumulator (None if no frame was started)
+    """
+    global _frame
+    frame = _frame
+    _frame = None
+    return frame
+
+def is_running():
+    return _thread is not None and _thread.is_alive()
+
+def start(read_guarded=True):
+    """
+    Start the sampling thread for a render job
+
+    Args:
+        read_guarded: Also sample Blender's guarded allocator. Pass False in
+            interactive sessions: the thread then makes no bpy calls and
+            only tracks the process RSS (psutil)
+    """
+    global _thread
+    if is_running():
+        return
+    if not read_guarded and psutil is None:
+        return
+    _stop_event.clear()
+    _thread = threading.Thread(target=_run, args=(read_guarded,), name="BigBrainRenderSampler")
+    _thread.daemon = True
+    _thread.start()
+
+def stop():
+    """Stop the sampling thread"""
+    global _thread, _frame
+    _stop_event.set()
+    if _thread is not None:
+        _thread.join(timeout=1.0)
+    _thread = None
+    _frame = None
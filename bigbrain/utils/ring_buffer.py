@@ -0,0 +1,131 @@
+# =============================================================================
+# utils/ring_buffer.py — Fixed-size ring buffer for metric history
+# =============================================================================
+
+from array import array
+from collections import deque
+
+class RingBuffer:
+    """
+    Preallocated, array-backed ring buffer of floats
+
+    Appending is O(1) and never reallocates. Running min/max are kept with
+    monotonic queues and the mean with a running sum, so all three are O(1)
+    to read. Windows are returned as memoryview segments over the backing
+    array (no copy); numpy.frombuffer() can wrap them directly.
+    """
+
+    def __init__(self, capacity, typecode='f'):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self._data = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._capacity = capacity
+        self._head = 0  # Next write position
+        self._count = 0
+        self._total = 0  # Appends so far (plus one per clear)
+        self._sum = 0.0
+        # (sequence, value) pairs, increasing / decreasing respectively
+        self._min_queue = deque()
+        self._max_queue = deque()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def version(self):
+        """Counter that changes whenever the contents change"""
+        return self._total
+
+    def append(self, value):
+        """Append a value, overwriting the oldest one when full"""
+        data = self._data
+        head = self._head
+
+        if self._count == self._capacity:
+            self._sum -= data[head]
+        else:
+            self._count += 1
+
+        data[head] = value
+        stored = data[head]  # Read back so stats match the stored precision
+        self._sum += stored
+
+        seq = self._total
+        self._total += 1
+        self._head = head = (head + 1) % self._capacity
+
+        # Resync the running sum once per lap to stop float drift
+        if head == 0:
+            self._sum = float(sum(data[:self._count]))
+
+        oldest = self._total - self._count
+        min_queue = self._min_queue
+        while min_queue and min_queue[-1][1] >= stored:
+            min_queue.pop()
+        min_queue.append((seq, stored))
+        while min_queue[0][0] < oldest:
+            min_queue.popleft()
+
+        max_queue = self._max_queue
+        while max_queue and max_queue[-1][1] <= stored:
+            max_queue.pop()
+        max_queue.append((seq, stored))
+        while max_queue[0][0] < oldest:
+            max_queue.popleft()
+
+    def clear(self):
+        """Remove all values (capacity is kept)"""
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min_queue.clear()
+        self._max_queue.clear()
+        self._total += 1  # Mark as changed for cache owners
+
+    @property
+    def last(self):
+        """Most recent value (0.0 if empty)"""
+        if not self._count:
+            return 0.0
+        return self._data[self._head - 1]
+
+    @property
+    def min(self):
+        return self._min_queue[0][1] if self._count else 0.0
+
+    @property
+    def max(self):
+        return self._max_queue[0][1] if self._count else 0.0
+
+    @property
+    def mean(self):
+        return self._sum / self._count if self._count else 0.0
+
+    def segments(self, count=None):
+        """
+        Get the newest `count` values (all if None) as memoryviews
+
+        Returns:
+            Tuple of one or two memoryview segments, oldest first
+        """
+        if count is None or count > self._count:
+            count = self._count
+        if count <= 0:
+            return ()
+
+        view = memoryview(self._data)
+        start = self._head - count
+        if start >= 0:
+            return (view[start:self._head],)
+        return (view[start + self._capacity:], view[:self._head])
+
+    def to_list(self, count=None):
+        """Copy the newest `count` values (all if None) into a list"""
+        values = []
+        for segment in self.segments(count):
+            values.extend(segment)
+        return values
@@ -0,0 +1,149 @@
+# =============================================================================
+# utils/sampler.py — Shared metrics sampler (one snapshot per tick)
+# =============================================================================
+
+import bpy
+import time
+from . import sampler_thread
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+MB = 1024 * 1024
+
+class MetricsSnapshot:
+    """Timestamped set of metrics shared by every BigBrain consumer"""
+    __slots__ = ("timestamp", "ram", "vram", "system_ram", "fps", "process")
+
+    def __init__(self, timestamp=0.0, ram=0.0, vram=0.0, system_ram=None, fps=0.0,
+                 process=None):
+        self.timestamp = timestamp  # time.time() of the sample
+        self.ram = ram  # Blender guarded allocator usage in MB
+        self.vram = vram  # GPU memory in MB (0 if unavailable)
+        self.system_ram = system_ram or {
+            'total': 0,
+            'available': 0,
+            'used': 0,
+            'percent': 0
+        }
+        self.fps = fps  # Scene playback FPS
+        # Process metrics from the background sampler thread (None if off):
+        # rss, rss_peak, vms, cpu_percent, cpu_per_core, paging, swap_*, io_*
+        self.process = process
+
+# Latest snapshot. Replaced on every sample, never mutated, so readers can
+# hold on to it safely.
+latest = MetricsSnapshot()
+
+# Readers asking for a snapshot older than this trigger a fresh sample
+sample_interval = 1.0
+
+# Callbacks invoked with each new snapshot
+_listeners = []
+
+def _read_system_ram():
+    """Read system RAM info using psutil"""
+    if psutil is None:
+        return None
+    mem = psutil.virtual_memory()
+    return {
+        'total': mem.total / MB,  # Total RAM in MB
+        'available': mem.available / MB,  # Available RAM in MB
+        'used': mem.used / MB,  # Used RAM in MB
+        'percent': mem.percent  # Percentage used
+    }
+
+def _read_fps():
+    """Read the scene playback FPS"""
+    scene = getattr(bpy.context, "scene", None)
+    if scene is None:
+        return 0.0
+    return scene.render.fps / scene.render.fps_base
+
+def read_memory():
+    """
+    Read Blender's RAM and VRAM usage directly (no psutil, no snapshot)
+
+    Cheap enough for handlers that need exact before/after values.
+
+    Returns:
+        (ram_mb, vram_mb)
+    """
+    stats = bpy.app.memory_statistics()
+
+    # Blender 4.0+ changed the key for GPU memory
+    if bpy.app.version >= (4, 0, 0):
+        vram = stats.get("gpu_memory_in_use", 0)
+    else:
+        vram = stats.get("gpu_mem_in_use", 0)
+
+    return stats.get("mem_in_use", 0) / MB, max(vram, 0) / MB
+
+def sample():
+    """
+    Take one snapshot of all metrics and publish it
+
+    Returns:
+        The new MetricsSnapshot
+    """
+    global latest
+
+    ram, vram = read_memory()
+
+    # psutil is read by the background thread when it runs; only fall back
+    # to reading it here on the main thread when it does not
+    process = sampler_thread.get_latest()
+    if process is not None:
+        system_ram = process['system_ram']
+    else:
+        system_ram = _read_system_ram()
+
+    snapshot = MetricsSnapshot(
+        timestamp=time.time(),
+        ram=ram,
+        vram=vram,
+        system_ram=system_ram,
+        fps=_read_fps(),
+        process=process
+    )
+    latest = snapshot
+
+    for callback in _listeners:
+        try:
+            callback(snapshot)
+        except Exception as e:
+            print(f"[BigBrain] Sampler listener failed: {e}")
+
+    return snapshot
+
+def get_snapshot():
+    """
+    Get the latest snapshot, sampling only if it is older than sample_interval
+
+    Safe to call from draw callbacks: no matter how many views ask, metrics
+    are read at most once per interval.
+    """
+    if time.time() - latest.timestamp >= sample_interval:
+        return sample()
+    return latest
+
+def add_listener(callback):
+    """Call callback(snapshot) whenever a new snapshot is taken"""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+def remove_listener(callback):
+    """Stop calling callback on new snapshots"""
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+def register():
+    pass
+
+def unregister():
+    global latest
+    sampler_thread.stop()
+    _listeners.clear()
+    latest = MetricsSnapshot()
@@ -0,0 +1,202 @@
+# =============================================================================
+# utils/sampler_thread.py — Background psutil sampler (no bpy access)
+# =============================================================================
+
+import os
+import time
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+MB = 1024 * 1024
+
+# Published snapshot. The thread fills a fresh back buffer and then swaps
+# the reference, so readers on the main thread never see a half-written
+# sample and never take a lock.
+_front = None
+
+_thread = None
+_stop_event = threading.Event()
+_stopping = False  # stop() timed out inside a slow sample; thread still alive
+_interval = 0.1
+
+# Peak RSS seen since the main thread last consumed a snapshot, so spikes
+# between status ticks are not lost
+_peak_rss = 0.0
+_peak_generation = 0
+_consumed_generation = 0
+
+def is_available():
+    """True if psutil is installed"""
+    return psutil is not None
+
+def is_running():
+    return _thread is not None and _thread.is_alive()
+
+def _read_io(process):
+    try:
+        io = process.io_counters()
+        return io.read_bytes / MB, io.write_bytes / MB
+    except (AttributeError, psutil.Error):
+        # Not supported on every platform (e.g. macOS)
+        return 0.0, 0.0
+
+def read_paging(process=None):
+    """
+    Read cumulative paging counters (safe on any thread)
+
+    Args:
+        process: psutil.Process to read RSS/VMS from (None to skip them)
+
+    Returns:
+        Dict with swap_total/swap_used (MB), swap_percent, swap_in/swap_out
+        (cumulative MB, 0 where the OS does not report them), major_faults
+        (cumulative count, None where the OS has no hard-fault counter)
+        and rss/vms (MB, 0 without a process)
+    """
+    counters = {
+        'swap_total': 0.0,
+        'swap_used': 0.0,
+        'swap_percent': 0.0,
+        'swap_in': 0.0,
+        'swap_out': 0.0,
+        'major_faults': None,
+        'rss': 0.0,
+        'vms': 0.0
+    }
+    if psutil is not None:
+        swap = psutil.swap_memory()
+        counters.update(
+            swap_total=swap.total / MB,
+            swap_used=swap.used / MB,
+            swap_percent=swap.percent,
+            swap_in=swap.sin / MB,
+            swap_out=swap.sout / MB
+        )
+    if process is not None:
+        proc_mem = process.memory_info()
+        counters['rss'] = proc_mem.rss / MB
+        counters['vms'] = proc_mem.vms / MB
+    # Windows only reports num_page_faults, which counts soft faults too and
+    # would read as thrashing on any busy session, so it is not used
+    if resource is not None:
+        counters['major_faults'] = resource.getrusage(resource.RUSAGE_SELF).ru_majflt
+    return counters
+
+def _sample(process):
+    """Collect one back buffer of process and system metrics"""
+    global _peak_rss, _peak_generation
+
+    mem = psutil.virtual_memory()
+    paging = read_paging(process)
+    io_read, io_write = _read_io(process)
+    rss = paging['rss']
+
+    # Restart the peak window once the main thread has consumed it
+    if _peak_generation != _consumed_generation:
+        _peak_generation = _consumed_generation
+        _peak_rss = rss
+    elif rss > _peak_rss:
+        _peak_rss = rss
+
+    return {
+        'timestamp': time.time(),
+        'system_ram': {
+            'total': mem.total / MB,
+            'available': mem.available / MB,
+            'used': mem.used / MB,
+            'percent': mem.percent
+        },
+        'rss': rss,
+        'rss_peak': _peak_rss,
+        'vms': paging['vms'],
+        'cpu_percent': process.cpu_percent(),
+        'cpu_per_core': psutil.cpu_percent(percpu=True),
+        'paging': paging,
+        'swap_used': paging['swap_used'],
+        'swap_percent': paging['swap_percent'],
+        'io_read': io_read,
+        'io_write': io_write
+    }
+
+def _run():
+    global _front
+    process = psutil.Process(os.getpid())
+
+    # Prime the CPU counters; the first cpu_percent() call always returns 0
+    process.cpu_percent()
+    psutil.cpu_percent(percpu=True)
+
+    while not _stop_event.wait(_interval):
+        try:
+            back = _sample(process)
+        except Exception as e:
+            print(f"[BigBrain] Sampler thread error: {e}")
+            continue
+        # A sample that outlived stop() must not be republished
+        if _stop_event.is_set():
+            break
+        _front = back
+
+def get_latest():
+    """
+    Get the most recent background sample (None if the thread is not running)
+
+    Marks the RSS peak window as consumed.
+    """
+    global _consumed_generation
+    if not is_running() or _stopping:
+        return None
+    snapshot = _front
+    if snapshot is not None:
+        _consumed_generation += 1
+    return snapshot
+
+def set_rate(hz):
+    """Set the sampling rate in Hz (applies on the next sample)"""
+    global _interval
+    _interval = 1.0 / max(hz, 0.1)
+
+def start(hz=10.0):
+    """Start the sampler thread (no-op without psutil)"""
+    global _thread, _stopping
+    if psutil is None:
+        return False
+    set_rate(hz)
+    if is_running() and not _stopping:
+        return True
+    # Clearing the event under a thread that is still stopping would keep it
+    # running next to the new one
+    if is_running():
+        _thread.join(timeout=5.0)
+        if _thread.is_alive():
+            print("[BigBrain] Sampler thread is still stopping; not restarted")
+            return False
+    _stopping = False
+    _stop_event.clear()
+    _thread = threading.Thread(target=_run, name="BigBrainSampler")
+    _thread.daemon = True
+    _thread.start()
+    return True
+
+def stop():
+    """Stop the sampler thread and drop the published snapshot"""
+    global _thread, _front, _stopping
+    _stop_event.set()
+    if _thread is not None:
+        _thread.join(timeout=1.0)
+        # Keep the handle until the sample in progress has finished
+        if _thread.is_alive():
+            _stopping = True
+        else:
+            _thread = None
+            _stopping = False
+    _front = None
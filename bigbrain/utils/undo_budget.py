@@ -0,0 +1,152 @@
+# =============================================================================
+# utils/undo_budget.py — Smart undo budget from measured undo step costs
+# =============================================================================
+
+import bpy
+import time
+from . import sampler
+
+# Seconds between budget evaluations, from a dedicated timer: preferences
+# must not be written from draw callbacks
+BUDGET_INTERVAL = 10.0
+
+# Floor for the measured cost of one undo step, so a run of cheap steps
+# cannot ask for thousands of them
+MIN_STEP_COST = 1.0  # MB
+# Smoothing of the per-step cost (weight of the newest measurement)
+COST_SMOOTHING = 0.2
+# Measurements needed before undo_steps follows the measured cost
+MIN_MEASUREMENTS = 3
+
+MIN_UNDO_MEMORY = 256  # MB
+MIN_UNDO_STEPS = 32
+
+# Relative change needed before Blender's preferences are rewritten
+HYSTERESIS = 0.1
+
+_undo_start_ram = None
+
+# Latest budget, read by the preferences UI
+status = {
+    'step_cost': 0.0,  # Smoothed MB per undo step
+    'measurements': 0,
+    'memory_limit': 0,  # Applied undo_memory_limit in MB
+    'steps': 0,  # Applied undo_steps
+}
+
+def record_step_cost(delta_mb):
+    """Fold the RAM delta of one undo/redo step into the smoothed cost"""
+    cost = max(abs(delta_mb), MIN_STEP_COST)
+    if status['measurements'] == 0:
+        status['step_cost'] = cost
+    else:
+        status['step_cost'] += COST_SMOOTHING * (cost - status['step_cost'])
+    status['measurements'] += 1
+
+@bpy.app.handlers.persistent
+def _on_undo_pre(*args):
+    global _undo_start_ram
+    _undo_start_ram = sampler.read_memory()[0]
+
+@bpy.app.handlers.persistent
+def _on_undo_post(*args):
+    """Moving one step through the stack swaps in (or out) one step's data"""
+    global _undo_start_ram
+    if _undo_start_ram is None:
+        return
+    record_step_cost(sampler.read_memory()[0] - _undo_start_ram)
+    _undo_start_ram = None
+
+_HANDLERS = (
+    ("undo_pre", _on_undo_pre),
+    ("undo_post", _on_undo_post),
+    ("redo_pre", _on_undo_pre),
+    ("redo_post", _on_undo_post),
+)
+
+def _hard_max(edit, name):
+    return type(edit).bl_rna.properties[name].hard_max
+
+def _changed(old, new):
+    return old == 0 or abs(new - old) > old * HYSTERESIS
+
+def compute_budget(available_mb, prefs, edit):
+    """
+    Get the (undo_memory_limit, undo_steps) that fit the budget
+
+    The memory limit is the configured share of free system RAM. Steps
+    follow from the measured cost per step, capped by the Undo Steps
+    preference; until enough steps were measured that preference is used.
+    """
+    limit = int(available_mb * prefs.undo_budget_share / 100.0)
+    limit = min(max(limit, MIN_UNDO_MEMORY), _hard_max(edit, "undo_memory_limit"))
+
+    max_steps = min(prefs.undo_steps, _hard_max(edit, "undo_steps"))
+    if status['measurements'] < MIN_MEASUREMENTS:
+        return limit, max_steps
+    steps = int(limit / status['step_cost'])
+    return limit, min(max(steps, MIN_UNDO_STEPS), max_steps)
+
+def update(prefs, force=False):
+    """
+    Re-evaluate the budget and apply it to Blender's undo preferences
+
+    Does nothing without system RAM figures (psutil) or when the change is
+    within the hysteresis band, unless forced.
+    """
+    from .. import utils
+
+    snapshot = sampler.get_snapshot()
+    if snapshot.system_ram['total'] <= 0:
+        return False
+
+    edit = bpy.context.preferences.edit
+    limit, steps = compute_budget(snapshot.system_ram['available'], prefs, edit)
+
+    changed = False
+    if force or _changed(edit.undo_memory_limit, limit):
+        edit.undo_memory_limit = limit
+        changed = True
+    if force or edit.undo_steps != steps:
+        edit.undo_steps = steps
+        changed = True
+
+    status['memory_limit'] = edit.undo_memory_limit
+    status['steps'] = edit.undo_steps
+    if changed:
+        utils.log("Undo budget: {} MB, {} steps (~{:.1f} MB/step)", 'DEBUG',
+                  status['memory_limit'], status['steps'], status['step_cost'])
+    return changed
+
+def _tick():
+    """Re-evaluate the budget every BUDGET_INTERVAL"""
+    try:
+        prefs = bpy.context.preferences.addons["bigbrain"].preferences
+    except KeyError:
+        return BUDGET_INTERVAL
+    if prefs.smart_undo:
+        update(prefs)
+    return BUDGET_INTERVAL
+
+def reset():
+    """Forget measured step costs"""
+    global _undo_start_ram
+    _undo_start_ram = None
+    status.update(step_cost=0.0, measurements=0)
+
+def register():
+    if not bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.register(_tick, first_interval=BUDGET_INTERVAL, persistent=True)
+    for name, handler in _HANDLERS:
+        handler_list = getattr(bpy.app.handlers, name)
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+def unregister():
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    for name, handler in _HANDLERS:
+        handler_list = getattr(bpy.app.handlers, name)
+        if handler in handler_list:
+            handler_list.remove(handler)
+    reset()